@@ -0,0 +1,59 @@
+"""
+Microbenchmark of the Test-set Writer against the former per-line text Writer
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import XMLEmitter
+
+
+def legacyWriteTestSet(inFile, inTestSet: str, inQueries, inStartingID: int = 1):
+    """Test-set Writer issuing the separate text-mode writes per test as it was done before `XMLEmitter`"""
+    inFile.write(f"<TestSet Name=\"{inTestSet}\" JavaClass=\"com.simba.testframework.testcases"
+                 f".jdbc.resultvalidation.SqlTester\" dotNetClass=\"SqlTester\">\n")
+    for query in inQueries:
+        inFile.write(f"\t<Test Name=\"SQL_QUERY\" JavaMethod=\"testSqlQuery\" "
+                     f"dotNetMethod=\"TestSqlQuery\" ID=\"{inStartingID}\">\n")
+        inFile.write(f"\t\t<SQL><![CDATA[{query}]]></SQL>\n")
+        inFile.write('\t\t<ValidateColumns>True</ValidateColumns>\n')
+        inFile.write('\t\t<ValidateNumericExactly>True</ValidateNumericExactly>\n')
+        inFile.write('\t</Test>\n')
+        inStartingID += 1
+    inFile.write('</TestSet>')
+
+
+def iterSyntheticQueries(inCount: int):
+    for index in range(inCount):
+        yield f"SELECT Column_{index % 97} FROM Table_{index % 1013} WHERE Column_{index % 89} = {index}"
+
+
+def measure(inWriter, inMode: str, inFilePath: str, inCount: int, inNewline: str = None):
+    startTime = time.perf_counter()
+    with open(inFilePath, inMode, newline=inNewline) as file:
+        inWriter(file, 'SQL_BENCHMARK', iterSyntheticQueries(inCount))
+    return time.perf_counter() - startTime
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    with tempfile.TemporaryDirectory() as folder:
+        legacyPath = os.path.join(folder, 'Legacy.xml')
+        emitterPath = os.path.join(folder, 'Emitter.xml')
+        results = [
+            ('Legacy', measure(legacyWriteTestSet, 'w', legacyPath, count, '\n')),
+            # Text mode on Windows translates every newline, which is what the legacy writer paid there
+            ('Legacy CRLF', measure(legacyWriteTestSet, 'w', legacyPath, count, '\r\n')),
+            ('Emitter', measure(XMLEmitter.writeTestSet, 'wb', emitterPath, count))
+        ]
+        emitterTime = results[-1][1]
+        print(f"Queries: {count}")
+        for name, elapsedTime in results:
+            print(f"{name:12} {count / elapsedTime:10.0f} tests/s  {elapsedTime:6.2f}s  "
+                  f"{emitterTime and elapsedTime / emitterTime:5.2f}x of Emitter time")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+SQLite Catalog of the values sampled from the columns of the tables, reused across runs
+"""
+
+import os
+import pickle
+import sqlite3
+import time
+
+from GenUtility import getFingerprint
+
+
+m_CatalogVersion = 1
+# Data of a table may change without its definition changing, so entries are only trusted for a week
+m_MaxAge = 7 * 24 * 60 * 60
+
+
+class ColumnCatalog:
+    """
+    Values sampled from the columns of every table, along with their sketches, kept in a SQLite database. Entries are
+    keyed by the connection string, the name of the table and its fingerprint within the MDEF, so a table whose
+    definition changed misses the catalog. Entries older than `inMaxAge` seconds or written by another version of the
+    catalog are stale and purged. Every column is stored as a row of its own, hence a table is read without loading
+    the others and the catalog may grow beyond the memory available
+    """
+
+    def __init__(self, inFilePath: str, inConnectionString: str, inMaxAge: float = m_MaxAge):
+        folderPath = os.path.dirname(inFilePath)
+        if len(folderPath) > 0:
+            os.makedirs(folderPath, exist_ok=True)
+        # The connection string may hold credentials, only its fingerprint is stored
+        self.connectionKey = getFingerprint([inConnectionString]).hex()
+        self.maxAge = inMaxAge
+        self.database = sqlite3.connect(inFilePath)
+        with self.database:
+            self.database.execute('CREATE TABLE IF NOT EXISTS Tables (Connection TEXT, TableName TEXT, '
+                                  'Fingerprint TEXT, Version INTEGER, StoredAt REAL, '
+                                  'PRIMARY KEY (Connection, TableName, Fingerprint))')
+            self.database.execute('CREATE TABLE IF NOT EXISTS Columns (Connection TEXT, TableName TEXT, '
+                                  'Fingerprint TEXT, Position INTEGER, ColumnName TEXT, ColumnValues BLOB, '
+                                  'Sketch BLOB, PRIMARY KEY (Connection, TableName, Fingerprint, Position))')
+            self.purge()
+
+    def close(self):
+        self.database.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, inType, inValue, inTraceback):
+        self.close()
+
+    def purge(self):
+        """Removes the stale entries of all the connections"""
+        with self.database:
+            self.database.execute('DELETE FROM Tables WHERE Version != ? OR StoredAt < ?',
+                                  (m_CatalogVersion, time.time() - self.maxAge))
+            self.database.execute('DELETE FROM Columns WHERE NOT EXISTS (SELECT 1 FROM Tables WHERE '
+                                  'Tables.Connection = Columns.Connection AND Tables.TableName = Columns.TableName '
+                                  'AND Tables.Fingerprint = Columns.Fingerprint)')
+
+    def contains(self, inTableName: str, inFingerprint: str):
+        """Checks whether an entry of the table with the given fingerprint is up to date"""
+        if inFingerprint is None:
+            return False
+        return self.database.execute('SELECT 1 FROM Tables WHERE Connection = ? AND TableName = ? AND Fingerprint = ? '
+                                     'AND Version = ? AND StoredAt >= ?',
+                                     (self.connectionKey, inTableName, inFingerprint, m_CatalogVersion,
+                                      time.time() - self.maxAge)).fetchone() is not None
+
+    def getTable(self, inTableName: str, inFingerprint: str):
+        """
+        Reads the entry of a table \n
+        :param inTableName: Name of the Table
+        :param inFingerprint: Fingerprint of the Table as hex string
+        :return: Returns the Column Values Mapping & the Column Sketch Mapping of the table, in the order of its
+        columns. Both are None if the catalog has no up to date entry of the table
+        """
+        if not self.contains(inTableName, inFingerprint):
+            return None, None
+        columnValues, columnSketches = dict(), dict()
+        for columnName, values, sketch in self.database.execute(
+                'SELECT ColumnName, ColumnValues, Sketch FROM Columns WHERE Connection = ? AND TableName = ? AND '
+                'Fingerprint = ? ORDER BY Position', (self.connectionKey, inTableName, inFingerprint)):
+            columnValues[columnName] = pickle.loads(values)
+            if sketch is not None:
+                columnSketches[columnName] = pickle.loads(sketch)
+        return columnValues, columnSketches
+
+    def load(self, inTableFingerprints: dict, withSketches: bool = False):
+        """
+        Reads the entries of the given tables, provided all of them are up to date \n
+        :param inTableFingerprints: Dictionary having Table Name as key and its fingerprint as hex string as value
+        :param withSketches: If set to True, a table stored without the sketches of its columns misses the catalog
+        :return: Returns the Table Column Values Mapping & the Table Column Sketch Mapping, None if any of the tables
+        misses the catalog. Tables stored without columns, as they had no rows, are left out
+        """
+        if not all(self.contains(tableName, fingerprint) for tableName, fingerprint in inTableFingerprints.items()):
+            return None
+        tableColumnValues, columnSketches = dict(), dict()
+        for tableName, fingerprint in inTableFingerprints.items():
+            columnValues, sketches = self.getTable(tableName, fingerprint)
+            if withSketches and len(sketches) < len(columnValues):
+                return None
+            if len(columnValues) > 0:
+                tableColumnValues[tableName], columnSketches[tableName] = columnValues, sketches
+        return tableColumnValues, columnSketches
+
+    def store(self, inTableColumnsValues: dict, inColumnSketches: dict, inTableFingerprints: dict):
+        """
+        Writes the entries of the given tables, replacing the former ones of the same fingerprint \n
+        :param inTableColumnsValues: Table Column Values Mapping, the values as any iterable
+        :param inColumnSketches: Table Column Sketch Mapping
+        :param inTableFingerprints: Dictionary having Table Name as key and its fingerprint as hex string as value.
+        Tables without a fingerprint are not stored
+        """
+        storedAt = time.time()
+        with self.database:
+            for tableName, columns in inTableColumnsValues.items():
+                fingerprint = inTableFingerprints.get(tableName)
+                if fingerprint is None:
+                    continue
+                key = (self.connectionKey, tableName, fingerprint)
+                self.database.execute('DELETE FROM Columns WHERE Connection = ? AND TableName = ? AND Fingerprint = ?',
+                                      key)
+                self.database.execute('INSERT OR REPLACE INTO Tables VALUES (?, ?, ?, ?, ?)',
+                                      key + (m_CatalogVersion, storedAt))
+                sketches = inColumnSketches.get(tableName, dict())
+                self.database.executemany('INSERT INTO Columns VALUES (?, ?, ?, ?, ?, ?, ?)', (
+                    key + (position, columnName, pickle.dumps(list(values)),
+                           pickle.dumps(sketches[columnName]) if columnName in sketches else None)
+                    for position, (columnName, values) in enumerate(columns.items())))
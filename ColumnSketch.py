@@ -0,0 +1,101 @@
+"""
+Bounded Streaming Sketches of the values of a column, built in a single pass over a Result-set
+"""
+
+import heapq
+from hashlib import blake2b
+
+
+m_DistinctSketchSize = 256
+m_TopValueCount = 10
+m_HashRange = 1 << 64
+
+
+class ColumnSketch:
+    """
+    Summary of all the values of a column, read once & in bounded memory. `DistinctCount` is estimated from the
+    `m_DistinctSketchSize` smallest hashes of the values (K Minimum Values), exact below that many distinct values.
+    `TopValues` holds the `m_TopValueCount` most frequent values with their counts as found by Space-Saving, a count
+    may exceed the true one by the count of the value it replaced. Values are added as the text read from the
+    Result-set, None for the null ones, and are converted by `finish` once the SQL type of the column is known
+    """
+    __slots__ = ('RowCount', 'NullCount', 'DistinctCount', 'Min', 'Max', 'TopValues', '_hashes', '_hashSet',
+                 '_counters', '_textMin', '_textMax', '_numberMin', '_numberMax', '_numeric')
+
+    def __init__(self):
+        self.RowCount = 0
+        self.NullCount = 0
+        self.DistinctCount = 0
+        self.Min = self.Max = None
+        self.TopValues = list()
+        # Max-heap of the smallest hashes, negated
+        self._hashes = list()
+        self._hashSet = set()
+        self._counters = dict()
+        self._textMin = self._textMax = None
+        # (Number, Text) of the extremes, as long as every value is numeric
+        self._numberMin = self._numberMax = None
+        self._numeric = True
+
+    @property
+    def NullFraction(self):
+        return self.NullCount / self.RowCount if self.RowCount > 0 else 0.0
+
+    def add(self, inText: str):
+        """Adds the text of a value, None for a null one"""
+        self.RowCount += 1
+        if inText is None:
+            self.NullCount += 1
+            return
+        hashValue = int.from_bytes(blake2b(inText.encode('utf-8'), digest_size=8).digest(), 'big')
+        if hashValue not in self._hashSet:
+            if len(self._hashes) < m_DistinctSketchSize:
+                heapq.heappush(self._hashes, -hashValue)
+                self._hashSet.add(hashValue)
+            elif hashValue < -self._hashes[0]:
+                self._hashSet.discard(-heapq.heapreplace(self._hashes, -hashValue))
+                self._hashSet.add(hashValue)
+        counters = self._counters
+        if inText in counters:
+            counters[inText] += 1
+        elif len(counters) < m_TopValueCount:
+            counters[inText] = 1
+        else:
+            # Space-Saving takes over the counter of the least frequent value
+            leastFrequent = min(counters, key=counters.get)
+            counters[inText] = counters.pop(leastFrequent) + 1
+        if self._textMin is None or inText < self._textMin:
+            self._textMin = inText
+        if self._textMax is None or inText > self._textMax:
+            self._textMax = inText
+        if self._numeric:
+            try:
+                number = float(inText)
+            except ValueError:
+                self._numeric = False
+                return
+            if self._numberMin is None or number < self._numberMin[0]:
+                self._numberMin = (number, inText)
+            if self._numberMax is None or number > self._numberMax[0]:
+                self._numberMax = (number, inText)
+
+    def finish(self, inConvert=None):
+        """
+        Completes the sketch, converting the values kept and dropping the state needed to add further values \n
+        :param inConvert: Callable converting the text of a value to the value, the text is kept if not given
+        :return: Returns the sketch itself
+        """
+        convert = inConvert if inConvert is not None else (lambda inText: inText)
+        if len(self._hashes) < m_DistinctSketchSize:
+            self.DistinctCount = len(self._hashes)
+        else:
+            self.DistinctCount = int((m_DistinctSketchSize - 1) * m_HashRange / (-self._hashes[0] + 1))
+        if self._numeric and self._numberMin is not None:
+            self.Min, self.Max = convert(self._numberMin[1]), convert(self._numberMax[1])
+        elif self._textMin is not None:
+            self.Min, self.Max = convert(self._textMin), convert(self._textMax)
+        self.TopValues = [(convert(text), count)
+                          for text, count in sorted(self._counters.items(), key=lambda item: -item[1])]
+        self._hashes = self._hashSet = self._counters = None
+        self._textMin = self._textMax = self._numberMin = self._numberMax = None
+        return self
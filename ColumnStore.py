@@ -0,0 +1,140 @@
+"""
+Typed Column Store of the values sampled from the tables
+"""
+
+import random
+from collections.abc import Sequence
+
+try:
+    import numpy
+except ImportError:
+    # The store falls back to plain lists
+    numpy = None
+
+
+m_Integer = 'Integer'
+m_Float = 'Float'
+m_Boolean = 'Boolean'
+m_String = 'String'
+m_Object = 'Object'
+
+
+def _getKind(inValues: list):
+    """Finds the common type of the given values, `m_Object` if they do not share one"""
+    types = set(map(type, inValues))
+    if types == {int}:
+        return m_Integer
+    elif types == {float}:
+        return m_Float
+    elif types == {bool}:
+        return m_Boolean
+    elif types == {str}:
+        return m_String
+    return m_Object
+
+
+class TypedColumn(Sequence):
+    """
+    Values sampled from a column. With NumPy available, the values are held as an array typed after their `Kind` along
+    with a mask of the rows which were null, otherwise as a list. Null values are kept out of the sequence itself, so
+    it can be consumed just like the list of values it replaces
+    """
+
+    def __init__(self, inValues):
+        values = list(inValues)
+        present = [value for value in values if value is not None]
+        self.Kind = _getKind(present)
+        if numpy is not None:
+            self.nulls = numpy.fromiter((value is None for value in values), bool, len(values))
+            self.data = TypedColumn._toArray(present, self.Kind)
+            if self.data.dtype == object:
+                self.Kind = m_Object
+        else:
+            self.nulls = [value is None for value in values]
+            self.data = present
+
+    @staticmethod
+    def _toArray(inValues: list, inKind: str):
+        dtypes = {m_Integer: numpy.int64, m_Float: numpy.float64, m_Boolean: numpy.bool_, m_String: numpy.str_}
+        if inKind in dtypes:
+            try:
+                return numpy.array(inValues, dtype=dtypes[inKind])
+            except OverflowError:
+                pass
+        array = numpy.empty(len(inValues), dtype=object)
+        array[:] = inValues
+        return array
+
+    @property
+    def NullCount(self):
+        return int(numpy.count_nonzero(self.nulls)) if numpy is not None else sum(self.nulls)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, inIndex):
+        if numpy is None:
+            return self.data[inIndex]
+        elif isinstance(inIndex, slice):
+            return self.data[inIndex].tolist()
+        value = self.data[inIndex]
+        return value.item() if isinstance(value, numpy.generic) else value
+
+    def __iter__(self):
+        return iter(self.data.tolist() if numpy is not None else self.data)
+
+    def __repr__(self):
+        return f"TypedColumn({list(self)!r})"
+
+    def min(self):
+        """Returns the smallest value, None if the values can not be ordered"""
+        return self._getExtreme(0)
+
+    def max(self):
+        """Returns the largest value, None if the values can not be ordered"""
+        return self._getExtreme(-1)
+
+    def _getExtreme(self, inPosition: int):
+        if len(self.data) == 0:
+            return None
+        elif numpy is not None and self.Kind == m_String:
+            # NumPy has no minimum & maximum for strings, though it sorts them
+            return numpy.sort(self.data)[inPosition].item()
+        elif numpy is not None and self.Kind != m_Object:
+            return (self.data.min() if inPosition == 0 else self.data.max()).item()
+        try:
+            return min(self.data) if inPosition == 0 else max(self.data)
+        except TypeError:
+            return None
+
+    def distinct(self):
+        """Returns the distinct values"""
+        if numpy is not None and self.Kind != m_Object:
+            return numpy.unique(self.data).tolist()
+        return list(dict.fromkeys(self))
+
+    def distinctCount(self):
+        return len(self.distinct())
+
+    def sample(self, inCount: int):
+        """
+        Picks distinct positions at random \n
+        :param inCount: Number of values to pick, all of them if there are fewer
+        :return: Returns the list of values picked
+        """
+        inCount = min(inCount, len(self.data))
+        if numpy is not None:
+            generator = numpy.random.default_rng(random.getrandbits(64))
+            return self.data[generator.choice(len(self.data), inCount, replace=False)].tolist()
+        return random.sample(self.data, inCount)
+
+
+def toColumnStore(inTableColumnsValues: dict):
+    """
+    Converts the sampled values of every column into a `TypedColumn` \n
+    :param inTableColumnsValues: Table Column Values Mapping
+    :return: Returns Table Column Values Mapping having `TypedColumn` as values
+    """
+    return {tableName: {columnName: columnValues if isinstance(columnValues, TypedColumn) else TypedColumn(columnValues)
+                        for columnName, columnValues in columns.items()}
+            for tableName, columns in inTableColumnsValues.items()}
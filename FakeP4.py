@@ -0,0 +1,65 @@
+"""
+Local stand-in for `p4 -G -x - print|files` to work with the Perforce Utilities offline.
+Revisions are read from a depot folder holding `<depot>/<file name>/<revision number>` files.
+
+i.e. set P4_COMMAND=python FakeP4.py --depot <depot folder>
+"""
+
+import marshal
+import os
+import sys
+
+
+def getRevisions(inDepotPath: str, inFilePath: str):
+    """Returns the available revision numbers of the given file in ascending order"""
+    fileFolder = os.path.join(inDepotPath, os.path.basename(inFilePath.replace('\\', '/')))
+    if not os.path.isdir(fileFolder):
+        return fileFolder, []
+    return fileFolder, sorted(int(revision) for revision in os.listdir(fileFolder) if revision.isdigit())
+
+
+def writeRecord(inRecord: dict):
+    """Writes a result record the way `p4 -G` does, as marshalled dictionary of bytes"""
+    marshal.dump({key.encode(): value if isinstance(value, bytes) else str(value).encode()
+                  for key, value in inRecord.items()}, sys.stdout.buffer, 0)
+
+
+def writeError(inMessage: str):
+    writeRecord({'code': 'error', 'data': inMessage + '\n', 'severity': 3, 'generic': 17})
+
+
+def run(inDepotPath: str, inCommand: str):
+    for fileSpec in sys.stdin.read().splitlines():
+        if len(fileSpec.strip()) == 0:
+            continue
+        filePath, _, revision = fileSpec.strip().partition('#')
+        fileFolder, revisions = getRevisions(inDepotPath, filePath)
+        if len(revisions) == 0:
+            writeError(f"{filePath} - no such file(s).")
+            continue
+        revision = int(revision) if len(revision) > 0 else revisions[-1]
+        if revision not in revisions:
+            writeError(f"{fileSpec} - no file(s) at that revision.")
+            continue
+        stat = {'code': 'stat', 'depotFile': f"//depot/{os.path.basename(fileFolder)}", 'rev': revision,
+                'change': revision, 'action': 'edit', 'type': 'text'}
+        if inCommand == 'files':
+            stat['rev'] = revision if '#' in fileSpec else revisions[-1]
+            writeRecord(stat)
+        elif inCommand == 'print':
+            writeRecord(stat)
+            with open(os.path.join(fileFolder, str(revision)), 'rb') as file:
+                for chunk in iter(lambda: file.read(1 << 16), b''):
+                    writeRecord({'code': 'text', 'data': chunk})
+            writeRecord({'code': 'text', 'data': b''})
+        else:
+            writeError(f"Unknown command: {inCommand}")
+    sys.stdout.buffer.flush()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if len(args) < 6 or args[0] != '--depot' or args[2:5] != ['-G', '-x', '-']:
+        print('Usage: python FakeP4.py --depot <depot folder> -G -x - print|files', file=sys.stderr)
+        sys.exit(1)
+    run(args[1], args[5])
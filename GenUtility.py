@@ -2,12 +2,22 @@
 General Utility Functions
 """
 
+import json
+import marshal
 import os
+import shlex
 import subprocess
-from shutil import copy
+import threading
+from hashlib import blake2b
+from shutil import copy, copyfile
 
 
 m_DeleteFolder = '.ignore'
+m_HashChunkSize = 1 << 20
+m_RevisionStoreFolder = os.path.join(m_DeleteFolder, 'RevisionStore')
+m_RevisionStoreSize = 4 << 30
+# Command to run Perforce with, can be overridden e.g. by `python FakeP4.py --depot <folder>` to work offline
+m_P4Command = os.environ.get('P4_COMMAND', 'p4.exe')
 
 
 def assure(inParam: dict, inArg: str, ignoreError: bool = False):
@@ -28,6 +38,43 @@ def getEnvVariableValue(inVarName: str):
     return assure(dict(os.environ), inVarName)
 
 
+def getFingerprint(inContent):
+    """
+    Computes a stable fingerprint of the given JSON serializable content, independent of the order of its keys \n
+    :param inContent: Content to compute the fingerprint of
+    :return: Returns the fingerprint as bytes
+    """
+    return blake2b(json.dumps(inContent, sort_keys=True, separators=(',', ':')).encode(), digest_size=8).digest()
+
+
+def getFileHash(inFilePath: str):
+    """
+    Computes the hash of the content of the given file, reading it chunk by chunk \n
+    :param inFilePath: Path of the file
+    :return: Returns the hash as hexadecimal string
+    """
+    fileHash = blake2b(digest_size=20)
+    with open(inFilePath, 'rb') as file:
+        for chunk in iter(lambda: file.read(m_HashChunkSize), b''):
+            fileHash.update(chunk)
+    return fileHash.hexdigest()
+
+
+def linkFile(inSrcFilePath: str, inDestFilePath: str):
+    """
+    Makes the file available at the destination path by a hard link, or by copying it where linking is not possible
+    e.g. across drives \n
+    :param inSrcFilePath: Path of the existing file
+    :param inDestFilePath: Path to make the file available at, replaced if it already exists
+    """
+    if os.path.exists(inDestFilePath):
+        os.remove(inDestFilePath)
+    try:
+        os.link(inSrcFilePath, inDestFilePath)
+    except OSError:
+        copyfile(inSrcFilePath, inDestFilePath)
+
+
 def checkFilesInDir(inDirPath: str, inFiles: list):
     """
     Checks whether given files are present or not in the specified Directory \n
@@ -61,29 +108,343 @@ def copyFilesInDir(inSrcDirPath: str, inDestDirPath: str, inFiles: list):
         return False
 
 
+class DiskCache:
+    """
+    Represents a size bounded store of binary values on disk which evicts the least recently used values first. Several
+    processes may share the store, values are written to a temporary file of the writer first and replace the stored
+    value at once, so a reader never sees a partly written value
+    """
+    m_TempSuffix = '.tmp'
+
+    def __init__(self, inFolderPath: str, inMaxBytes: int):
+        self.folderPath = inFolderPath
+        self.maxBytes = inMaxBytes
+
+    @staticmethod
+    def _getTempPath(inValuePath: str):
+        """Returns the temporary path to write a value at, distinct for every process & thread"""
+        return f"{inValuePath}.{os.getpid()}-{threading.get_ident()}{DiskCache.m_TempSuffix}"
+
+    def get(self, inKey: str):
+        """
+        Reads the value stored for the given key and marks it as recently used \n
+        :param inKey: Key of the value, must be a valid file name
+        :return: Returns the value as bytes, None if no value is stored for the key
+        """
+        valuePath = os.path.join(self.folderPath, inKey)
+        try:
+            with open(valuePath, 'rb') as file:
+                value = file.read()
+            os.utime(valuePath)
+            return value
+        except FileNotFoundError:
+            return None
+
+    def getPath(self, inKey: str):
+        """
+        Finds the file holding the value stored for the given key and marks it as recently used \n
+        :param inKey: Key of the value, must be a valid file name
+        :return: Returns the path of the file, None if no value is stored for the key
+        """
+        valuePath = os.path.join(self.folderPath, inKey)
+        try:
+            os.utime(valuePath)
+            return valuePath
+        except FileNotFoundError:
+            return None
+
+    def put(self, inKey: str, inValue: bytes):
+        """
+        Stores the value for the given key and evicts the least recently used values exceeding the size limit \n
+        :param inKey: Key of the value, must be a valid file name
+        :param inValue: Value to store
+        """
+        os.makedirs(self.folderPath, exist_ok=True)
+        valuePath = os.path.join(self.folderPath, inKey)
+        tempPath = DiskCache._getTempPath(valuePath)
+        with open(tempPath, 'wb') as file:
+            file.write(inValue)
+        os.replace(tempPath, valuePath)
+        self.evict()
+
+    def putFile(self, inKey: str, inFilePath: str):
+        """
+        Stores the content of the given file for the given key without reading it into memory \n
+        :param inKey: Key of the value, must be a valid file name
+        :param inFilePath: Path of the file holding the value, it is left in place
+        :return: Returns the path of the file holding the stored value
+        """
+        os.makedirs(self.folderPath, exist_ok=True)
+        valuePath = os.path.join(self.folderPath, inKey)
+        tempPath = DiskCache._getTempPath(valuePath)
+        linkFile(inFilePath, tempPath)
+        os.replace(tempPath, valuePath)
+        self.evict()
+        return valuePath
+
+    def remove(self, inKey: str):
+        """Removes the value stored for the given key, if any"""
+        try:
+            os.remove(os.path.join(self.folderPath, inKey))
+        except FileNotFoundError:
+            pass
+
+    def evict(self):
+        """
+        Removes the least recently used values until the size of the store is within its limit. Values removed by
+        another process meanwhile are skipped, and values still being written are left alone
+        """
+        values = list()
+        for entry in os.scandir(self.folderPath):
+            if entry.name.endswith(DiskCache.m_TempSuffix):
+                continue
+            try:
+                if entry.is_file():
+                    stat = entry.stat()
+                    values.append((stat.st_mtime, stat.st_size, entry.path))
+            except FileNotFoundError:
+                continue
+        totalBytes = sum(size for _, size, _ in values)
+        for _, size, valuePath in sorted(values):
+            if totalBytes <= self.maxBytes:
+                break
+            totalBytes -= size
+            try:
+                os.remove(valuePath)
+            except FileNotFoundError:
+                continue
+
+
+class RevisionStore:
+    """
+    Represents a local store of file revisions fetched from Perforce. Contents are stored once by their hash, the depot
+    path & revision number of a file only refer to the content, so every revision has to be fetched at most once
+    """
+
+    def __init__(self, inFolderPath: str, inMaxBytes: int):
+        self.objects = DiskCache(os.path.join(inFolderPath, 'Objects'), inMaxBytes)
+        self.refsPath = os.path.join(inFolderPath, 'Refs')
+
+    def _getRefPath(self, inFilePath: str, inRevision: int):
+        refKey = blake2b(f"{os.path.abspath(inFilePath).lower()}#{inRevision}".encode(), digest_size=20).hexdigest()
+        return os.path.join(self.refsPath, refKey)
+
+    def find(self, inFilePath: str, inRevision: int):
+        """
+        Finds the stored content of the given file revision and verifies its integrity \n
+        :param inFilePath: Path of the file
+        :param inRevision: Revision Number of the file
+        :return: Returns the path of the stored content, None if the revision is not stored or got corrupted
+        """
+        try:
+            with open(self._getRefPath(inFilePath, inRevision), 'r') as file:
+                contentHash = file.read().strip()
+        except FileNotFoundError:
+            return None
+        contentPath = self.objects.getPath(contentHash)
+        if contentPath is not None and getFileHash(contentPath) != contentHash:
+            print(f"Warning: Stored content of {inFilePath}#{inRevision} is corrupted, fetching it again")
+            self.objects.remove(contentHash)
+            return None
+        return contentPath
+
+    def add(self, inFilePath: str, inRevision: int, inContentPath: str):
+        """
+        Stores the content of the given file revision \n
+        :param inFilePath: Path of the file
+        :param inRevision: Revision Number of the file
+        :param inContentPath: Path of the fetched content of the revision
+        """
+        contentHash = getFileHash(inContentPath)
+        self.objects.putFile(contentHash, inContentPath)
+        os.makedirs(self.refsPath, exist_ok=True)
+        refPath = self._getRefPath(inFilePath, inRevision)
+        tempPath = DiskCache._getTempPath(refPath)
+        with open(tempPath, 'w') as file:
+            file.write(contentHash)
+        os.replace(tempPath, refPath)
+
+
+m_RevisionStore = RevisionStore(m_RevisionStoreFolder, m_RevisionStoreSize)
+
+
+class PerforceSession:
+    """
+    Represents a session with Perforce which runs a whole batch of requests of the same command by a single p4 process.
+    The process reads the arguments of all requests from stdin (`-x -`) and writes the results as marshalled
+    dictionaries (`-G`), which are parsed while the process is still running.
+    """
+
+    def __init__(self, inP4Command: str = m_P4Command):
+        self.p4Command = shlex.split(inP4Command, posix=os.name != 'nt')
+
+    def iterRecords(self, inCommand: str, inArgs: list, inOptions: list = None):
+        """
+        Runs the command once for every argument within a single p4 process \n
+        :param inCommand: p4 command e.g. `print`, `files`
+        :param inArgs: Arguments to run the command for
+        :param inOptions: Options of the command
+        :return: Yields every result record as soon as it is read, the results of every argument start with either its
+        file stat or an error
+        """
+        process = subprocess.Popen(self.p4Command + ['-G', '-x', '-', inCommand] + (inOptions or []),
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        # Arguments are written by another thread, so a full stdout pipe can't block the p4 process
+        writer = threading.Thread(target=PerforceSession._writeArgs, args=(process.stdin, inArgs))
+        writer.start()
+        try:
+            while True:
+                try:
+                    record = PerforceSession._decodeRecord(marshal.load(process.stdout))
+                except EOFError:
+                    break
+                yield record
+        finally:
+            writer.join()
+            process.stdout.close()
+            process.wait()
+
+    @staticmethod
+    def _startsResults(inRecord: dict):
+        """Checks whether the record starts the results of the next argument"""
+        return inRecord.get('code') in ('stat', 'error')
+
+    def iterResults(self, inCommand: str, inArgs: list, inOptions: list = None):
+        """
+        Runs the command once for every argument within a single p4 process \n
+        :param inCommand: p4 command e.g. `print`, `files`
+        :param inArgs: Arguments to run the command for
+        :param inOptions: Options of the command
+        :return: Yields the list of result records of every argument, in the order of the arguments
+        """
+        results = None
+        for record in self.iterRecords(inCommand, inArgs, inOptions):
+            if PerforceSession._startsResults(record) or results is None:
+                if results is not None:
+                    yield results
+                results = list()
+            results.append(record)
+        if results is not None:
+            yield results
+
+    @staticmethod
+    def _writeArgs(inStream, inArgs: list):
+        try:
+            for arg in inArgs:
+                inStream.write(f"{arg}\n".encode())
+        finally:
+            inStream.close()
+
+    @staticmethod
+    def _decodeRecord(inRecord: dict):
+        record = dict()
+        for key, value in inRecord.items():
+            key = key.decode() if isinstance(key, bytes) else key
+            record[key] = value.decode(errors='replace') if isinstance(value, bytes) and key != 'data' else value
+        if record.get('code') == 'error' and isinstance(record.get('data'), bytes):
+            record['data'] = record['data'].decode(errors='replace')
+        return record
+
+    def files(self, inFilePaths: list):
+        """
+        Finds the latest revision numbers of the given files \n
+        :param inFilePaths: Paths of the files
+        :return: Returns the mapping of the file paths to their latest revision numbers, None for failed files
+        """
+        revisions = dict.fromkeys(inFilePaths)
+        for filePath, results in zip(inFilePaths, self.iterResults('files', inFilePaths)):
+            if results[0].get('code') == 'stat':
+                revisions[filePath] = int(results[0]['rev'])
+            else:
+                print(f"Error: p4 files {filePath} failed: {results[0].get('data', '').strip()}")
+        return revisions
+
+    def print(self, inFileSpecs: list, inOutFilePaths: list):
+        """
+        Fetches the given file revisions. The content of every file is written as soon as it is read from p4, so no
+        file is held in memory \n
+        :param inFileSpecs: File specifications to fetch e.g. `<path>#<revision>`
+        :param inOutFilePaths: Paths to write the files at, one for each file specification
+        :return: Returns the list of flags whether the respective file was fetched successfully
+        """
+        fetched = [False] * len(inFileSpecs)
+        index = -1
+        file = None
+        try:
+            for record in self.iterRecords('print', inFileSpecs):
+                if PerforceSession._startsResults(record) or index < 0:
+                    if file is not None:
+                        file.close()
+                        file = None
+                    index += 1
+                    if index >= len(inFileSpecs):
+                        continue
+                    if record.get('code') == 'stat':
+                        file = open(inOutFilePaths[index], 'wb')
+                        fetched[index] = True
+                    else:
+                        print(f"Error: p4 print {inFileSpecs[index]} failed: {record.get('data', '').strip()}")
+                elif file is not None and record.get('code') in ('text', 'binary', 'utf8', 'utf16', 'unicode'):
+                    file.write(record['data'])
+        finally:
+            if file is not None:
+                file.close()
+        return fetched
+
+
+m_PerforceSession = PerforceSession()
+
+
 class PerforceUtility:
 
     @staticmethod
     def getRevision(inFilePath: str, inFileRevision: int = None):
         """
-        Gets a file from Perforce with the latest revision if revision not specified \n
+        Gets a file from Perforce with the latest revision if revision not specified. Revisions fetched before are
+        taken from the local Revision Store instead. \n
         :param inFilePath: Path of the file to get revision
         :param inFileRevision: Revision Number of a file to get
         :return: Returns the Absolute Path of the File if downloaded successfully
         """
+        if inFileRevision is None:
+            inFileRevision = PerforceUtility.getLatestRevisionNumber(inFilePath)
+            if inFileRevision is None:
+                return None
+        return PerforceUtility.getRevisions(inFilePath, [inFileRevision])[inFileRevision]
+
+    @staticmethod
+    def getRevisions(inFilePath: str, inFileRevisions: list):
+        """
+        Gets the given revisions of a file, all revisions missing in the local Revision Store are fetched from
+        Perforce at once \n
+        :param inFilePath: Path of the file to get revisions
+        :param inFileRevisions: Revision Numbers of the file to get
+        :return: Returns the mapping of the Revision Numbers to the Absolute Paths of the Files
+        """
         if os.path.exists(inFilePath):
             inFileName = os.path.splitext(os.path.basename(os.path.abspath(inFilePath)))[0]
             inFileExtension = os.path.splitext(os.path.basename(os.path.abspath(inFilePath)))[1]
-            outFileName = None
-            if inFileRevision is not None:
-                outFileName = f"{inFileName}_{inFileRevision}{inFileExtension}"
-                subprocess.call(f"p4.exe print -o {os.path.join(m_DeleteFolder, outFileName)} "
-                                f"{os.path.abspath(inFilePath)}#{inFileRevision}")
-            else:
-                outFileName = f"{inFileName}_Head{inFileExtension}"
-                subprocess.call(f"p4.exe print -o {os.path.join(m_DeleteFolder, outFileName)} "
-                                f"{os.path.abspath(inFilePath)}")
-            return os.path.abspath(os.path.join(m_DeleteFolder, outFileName))
+            os.makedirs(m_DeleteFolder, exist_ok=True)
+            outFilePaths = dict()
+            missingRevisions = list()
+            for revision in inFileRevisions:
+                outFilePaths[revision] = os.path.abspath(os.path.join(m_DeleteFolder, f"{inFileName}_{revision}"
+                                                                                      f"{inFileExtension}"))
+                storedFilePath = m_RevisionStore.find(inFilePath, revision)
+                if storedFilePath is not None:
+                    linkFile(storedFilePath, outFilePaths[revision])
+                else:
+                    if os.path.exists(outFilePaths[revision]):
+                        os.remove(outFilePaths[revision])
+                    missingRevisions.append(revision)
+            if len(missingRevisions) > 0:
+                fetched = m_PerforceSession.print([f"{os.path.abspath(inFilePath)}#{revision}"
+                                                   for revision in missingRevisions],
+                                                  [outFilePaths[revision] for revision in missingRevisions])
+                for revision, isFetched in zip(missingRevisions, fetched):
+                    if isFetched:
+                        m_RevisionStore.add(inFilePath, revision, outFilePaths[revision])
+            return outFilePaths
         else:
             raise FileNotFoundError(f"{inFilePath} is an invalid location")
 
@@ -92,12 +453,9 @@ class PerforceUtility:
         """
         Finds the latest revision number of the file \n
         :param inFilePath: Path of the file to get latest revision number
-        :return: Returns latest revision number of the specified file
+        :return: Returns latest revision number of the specified file, None if p4 could not find it
         """
         if os.path.exists(inFilePath):
-            output = subprocess.check_output(f"p4.exe files {os.path.abspath(inFilePath)}").decode().split(' - ')[0]
-            fileName = os.path.basename(os.path.abspath(inFilePath))
-            index = output.find(fileName + '#') + len(fileName) + 1
-            return int(output[index:])
+            return m_PerforceSession.files([os.path.abspath(inFilePath)])[os.path.abspath(inFilePath)]
         else:
             raise FileNotFoundError(f"{inFilePath} is an invalid location")
@@ -1,14 +1,30 @@
+import gc
 import json
 import os
+import pickle
 import random
 import re
 import subprocess
+import sys
+import time
 import xml.etree.ElementTree as Etree
-from shutil import rmtree
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
+from itertools import repeat
+from shutil import rmtree
 
-from InputReader import InputReader, m_ModifiedMDEFLocation, m_CompareTwoRevisions
-from GenUtility import assure, getEnvVariableValue, checkFilesInDir, copyFilesInDir, PerforceUtility
+from InputReader import InputReader, m_ModifiedMDEFLocation, m_CompareTwoRevisions, m_RevisionRange
+from GenUtility import assure, getEnvVariableValue, checkFilesInDir, copyFilesInDir, getFingerprint, getFileHash, \
+    DiskCache, PerforceUtility, m_DeleteFolder
+from MDEFStream import iterArrayElements, LazyJSONArray, LazyEntryList
+from QueryIndex import QueryIndex, splitDigests
+import QueryExpansion
+import XMLEmitter
+import ColumnStore
+from ColumnSketch import ColumnSketch
+from ColumnCatalog import ColumnCatalog
+from TouchstoneMonitor import RunMonitor, m_ResultSetPattern
 
 
 class TestSuites(Enum):
@@ -41,9 +57,100 @@ m_EnvsFolder = 'Envs'
 m_TestEnv = 'TestEnv.xml'
 m_TestSuite = 'TestSuite.xml'
 m_TestFilesExtension = '.xml'
+m_TempFileSuffix = '.tmp'
 m_TestSets = 'TestSets'
 m_ResultSets = 'ResultSets'
+m_Partitions = 'Partitions'
+m_RevisionHistory = 'RevisionHistory.json'
+m_Manifest = 'Manifest.json'
+m_GeneratorVersion = 2
+m_WriteBufferSize = 1 << 20
+# Maximum number of tests & bytes per Test-set file within the worker processes, 0 for no limit
+m_ShardLimits = (0, 0)
+# Maximum number of queries per table & per Test-set the expandable Test-sets take within the worker processes, both
+# 0 for a single query per table
+m_QueryBudget = (0, 0)
+# Digests of the queries written to every Test-set within the worker processes, along with the duplicates dropped
+m_WrittenQueries = dict()
 TOUCHSTONE_DIR = getEnvVariableValue('TOUCHSTONE_DIR')
+m_MDEFCacheVersion = 2
+m_MDEFCache = DiskCache(os.path.join(m_DeleteFolder, 'MDEFCache'), 1 << 30)
+m_ColumnCatalog = os.path.join(m_DeleteFolder, 'ColumnCatalog.sqlite')
+m_TestSetWriters = {
+    TestSets.SQL_PASSDOWN: 'writeSQLPassdownTestsets',
+    TestSets.SQL_SP: 'writeSPTestSets',
+    TestSets.SQL_SELECT_TOP: 'writeSQLSelectTopTestsets',
+    TestSets.SQL_AND_OR: 'writeSQLAndOrTestsets',
+    TestSets.SQL_ORDER_BY: 'writeSQLOrderByTestsets',
+    TestSets.SQL_FUNCTION_1TABLE: 'writeSQLFunctionTestsets',
+    TestSets.SQL_GROUP_BY: 'writeSQLGroupByTestsets',
+    TestSets.SQL_IN_BETWEEN: 'writeSQLInBetweenTestsets',
+    TestSets.SQL_LIKE: 'writeSQLLikeTestsets',
+    TestSets.SQL_COLUMNS_1TABLE: 'writeSQLColumnTableTestsets'
+}
+# Writers expanding their queries combinatorially within the Query Budget
+m_ExpandableTestSetWriters = ['writeSQLAndOrTestsets', 'writeSQLOrderByTestsets', 'writeSQLInBetweenTestsets']
+# Writers choosing their predicates from the sketches of the columns, unless expanded within a budget
+m_SketchedTestSetWriters = ['writeSQLAndOrTestsets']
+
+
+class MDEFColumn:
+    """Column of an MDEF Table or of a Stored Procedure's Result Table"""
+    __slots__ = ('Name', 'SQLType', 'Passdownable')
+
+    def __init__(self, inName: str, inSQLType: str = None, inPassdownable: bool = False):
+        self.Name = sys.intern(inName)
+        self.SQLType = sys.intern(inSQLType) if inSQLType is not None else None
+        self.Passdownable = inPassdownable
+
+    @staticmethod
+    def fromElement(inColumn: dict, withPassdownable: bool = False):
+        """Creates a Column from its MDEF element"""
+        return MDEFColumn(assure(inColumn, MDEF.m_Name),
+                          assure(inColumn[MDEF.m_MetaData], MDEF.m_SQLType) if assure(inColumn, MDEF.m_MetaData)
+                          else None,
+                          bool(assure(inColumn, MDEF.m_Passdownable)) if withPassdownable else False)
+
+    def __reduce__(self):
+        return MDEFColumn, (self.Name, self.SQLType, self.Passdownable)
+
+    def getFingerprint(self):
+        """Returns the fingerprint of the column's name, SQLType & passdownability"""
+        return getFingerprint([self.Name, self.SQLType, self.Passdownable])
+
+
+class MDEFTable:
+    """
+    Table or Virtual Table of an MDEF, `Columns` maps the column names to their `MDEFColumn` whereas `Ordinals` holds
+    the same columns in the order of the MDEF, as referred by the `ParentColumn` of Virtual Tables.
+    `Fingerprint` covers the table's element of the MDEF excluding its Virtual Tables.
+    """
+    __slots__ = ('Name', 'Columns', 'Ordinals', 'APIAccess', 'Virtual', 'Fingerprint')
+
+    def __init__(self, inName: str, inColumns: dict, inOrdinals: tuple = (), inAPIAccess: dict = None,
+                 inVirtual: bool = False, inFingerprint: bytes = None):
+        self.Name = sys.intern(inName)
+        self.Columns = inColumns
+        self.Ordinals = inOrdinals
+        self.APIAccess = inAPIAccess
+        self.Virtual = inVirtual
+        self.Fingerprint = inFingerprint
+
+    def __reduce__(self):
+        return MDEFTable, (self.Name, self.Columns, self.Ordinals, self.APIAccess, self.Virtual, self.Fingerprint)
+
+
+class MDEFStoredProcedure:
+    """Stored Procedure of an MDEF, `Columns` holds the `MDEFColumn` of its Result Table"""
+    __slots__ = ('Name', 'Columns', 'Fingerprint')
+
+    def __init__(self, inName: str, inColumns: tuple = (), inFingerprint: bytes = None):
+        self.Name = sys.intern(inName)
+        self.Columns = inColumns
+        self.Fingerprint = inFingerprint
+
+    def __reduce__(self):
+        return MDEFStoredProcedure, (self.Name, self.Columns, self.Fingerprint)
 
 
 class MDEF:
@@ -64,16 +171,29 @@ class MDEF:
     m_ParentColumn = 'ParentColumn'
     m_Passdownable = 'Passdownable'
 
-    def __init__(self, inFilePath: str = None, withColumns: bool = False, inFileContent: dict = None):
+    # MDEF Difference Variables
+    m_Changes = 'Changes'
+    m_Added = 'Added'
+    m_Changed = 'Changed'
+    m_Removed = 'Removed'
+    m_SourceElements = 'SourceElements'
+
+    def __init__(self, inFilePath: str = None, withColumns: bool = False, inFileContent: dict = None,
+                 lazy: bool = False, inParsedMDEF=None):
+        self.WithColumns = withColumns
+        self.TableIndex = dict()
+        self.TableFingerprints = list()
+        self.TableElements = array('q')
+        self.StoredProcedureIndex = dict()
+        self.StoredProcedureFingerprints = list()
+        self.StoredProcedureElements = array('q')
+        self.ChangedColumns = dict()
         if inFilePath is not None:
             if len(inFilePath) > 0 and os.path.exists(inFilePath):
-                with open(inFilePath, 'r') as file:
-                    self.MDEFPath = inFilePath
-                    self.MDEFContent = json.load(file)
-                    self.TableNames = dict()
-                    self.VirtualTableNames = list()
-                    self.MDEFStoredProcedures = self.parseStoredProcedures(withColumns)
-                    self.Tables = self.parseTables(withColumns)
+                self.MDEFPath = inFilePath
+                self.TableNames = dict()
+                self.VirtualTableNames = list()
+                self.streamContent(lazy)
             else:
                 raise FileNotFoundError(f"{inFilePath} is an invalid location")
         else:
@@ -82,133 +202,569 @@ class MDEF:
                 self.MDEFContent = inFileContent
                 self.TableNames = dict()
                 self.VirtualTableNames = list()
-                self.MDEFStoredProcedures = self.parseStoredProcedures(withColumns)
-                self.Tables = self.parseTables(withColumns)
+                if inParsedMDEF is not None and inParsedMDEF.WithColumns == withColumns and \
+                        assure(inFileContent, MDEF.m_SourceElements, True):
+                    self.adoptEntries(inParsedMDEF)
+                else:
+                    self.MDEFStoredProcedures = self.parseStoredProcedures(withColumns)
+                    self.Tables = self.parseTables(withColumns)
+                if assure(inFileContent, MDEF.m_Changes, True):
+                    self.restrictToChanges(inFileContent[MDEF.m_Changes])
             else:
                 raise ValueError(f"Invalid MDEF Content provided")
 
+    @staticmethod
+    def load(inFilePath: str, withColumns: bool = False, lazy: bool = False):
+        """
+        Loads the MDEF File, reusing the parsed MDEF from the cache if the same content was parsed before \n
+        :param inFilePath: Path of the MDEF File
+        :param withColumns: If set to True, columns of the tables are parsed as well
+        :param lazy: If set to True, entries are parsed only when accessed
+        :return: Returns the MDEF Instance
+        """
+        if not os.path.exists(inFilePath):
+            raise FileNotFoundError(f"{inFilePath} is an invalid location")
+        cacheKey = f"{getFileHash(inFilePath)}_{int(withColumns)}{int(lazy)}_{m_MDEFCacheVersion}"
+        cachedMDEF = m_MDEFCache.get(cacheKey)
+        if cachedMDEF is not None:
+            # Unpickling creates a lot of objects at once which would otherwise trigger the garbage collector repeatedly
+            gcEnabled = gc.isenabled()
+            gc.disable()
+            try:
+                mdef = pickle.loads(cachedMDEF)
+                mdef.relocate(inFilePath)
+                return mdef
+            except (pickle.UnpicklingError, AttributeError, EOFError, TypeError) as e:
+                print('Warning: Discarding corrupted MDEF cache entry', cacheKey, e)
+                m_MDEFCache.remove(cacheKey)
+            finally:
+                if gcEnabled:
+                    gc.enable()
+        mdef = MDEF(inFilePath, withColumns, lazy=lazy)
+        m_MDEFCache.put(cacheKey, pickle.dumps(mdef, pickle.HIGHEST_PROTOCOL))
+        return mdef
+
+    def relocate(self, inFilePath: str):
+        """Points the MDEF to another file having the same content e.g. after loading it from the cache"""
+        self.MDEFPath = inFilePath
+        for elements in self.MDEFContent.values():
+            if isinstance(elements, LazyJSONArray):
+                elements.filePath = inFilePath
+
+    def streamContent(self, lazy: bool = False):
+        """
+        Streams Tables and Stored Procedures from the MDEF File one element at a time, so the whole document is never
+        held in memory. `MDEFContent` then refers to the elements by their location within the file. \n
+        :param lazy: If set to True, entries are parsed only when accessed else all of them are parsed right away
+        """
+        tables = LazyJSONArray(self.MDEFPath)
+        storedProcedures = LazyJSONArray(self.MDEFPath)
+        self.MDEFContent = {MDEF.m_Tables: tables, MDEF.m_StoredProcedures: storedProcedures}
+        if lazy:
+            self.Tables = LazyEntryList(self, MDEF.m_Tables, tables)
+            self.MDEFStoredProcedures = LazyEntryList(self, MDEF.m_StoredProcedures, storedProcedures)
+        else:
+            self.Tables = list()
+            self.MDEFStoredProcedures = list()
+
+        for section, element, offset, length in iterArrayElements(self.MDEFPath, (MDEF.m_Tables,
+                                                                                  MDEF.m_StoredProcedures)):
+            if section == MDEF.m_Tables:
+                tables.append(offset, length)
+                entries = self.parseTable(element, self.WithColumns)
+                self.indexEntries(entries, len(tables) - 1, MDEF.m_Tables)
+                if lazy:
+                    self.Tables.addEntries(len(tables) - 1, len(entries))
+                else:
+                    self.Tables.extend(entries)
+            else:
+                storedProcedures.append(offset, length)
+                entries = self.parseStoredProcedure(element, self.WithColumns)
+                self.indexEntries(entries, len(storedProcedures) - 1, MDEF.m_StoredProcedures)
+                if lazy:
+                    self.MDEFStoredProcedures.addEntries(len(storedProcedures) - 1, len(entries))
+                else:
+                    self.MDEFStoredProcedures.extend(entries)
+
+    def parseElement(self, inSection: str, inElement: dict):
+        """Parses a single Table or Stored Procedure element of the MDEF into its entries"""
+        if inSection == MDEF.m_Tables:
+            return self.parseTable(inElement, self.WithColumns, inRegister=False)
+        else:
+            return self.parseStoredProcedure(inElement, self.WithColumns)
+
+    def indexEntries(self, inEntries: list, inElementIndex: int, inSection: str):
+        """
+        Records the position, fingerprint & source element of the given Table or Stored Procedure entries \n
+        :param inEntries: Entries to index, all of them parsed from the same element of the MDEF
+        :param inElementIndex: Index of the element within the `Tables` or `StoredProcedures` of the MDEF
+        :param inSection: `Tables` or `StoredProcedures`
+        """
+        if inSection == MDEF.m_Tables:
+            index, fingerprints, elements = self.TableIndex, self.TableFingerprints, self.TableElements
+        else:
+            index, fingerprints, elements = self.StoredProcedureIndex, self.StoredProcedureFingerprints, \
+                                            self.StoredProcedureElements
+        for entry in inEntries:
+            if entry.Name not in index:
+                index[entry.Name] = len(fingerprints)
+            elif inSection == MDEF.m_Tables:
+                raise Exception(f"Error: {self.MDEFPath} contains more than one table with name {entry.Name}")
+            fingerprints.append(entry.Fingerprint)
+            elements.append(inElementIndex)
+
+    def getTable(self, inTableName: str):
+        """Returns the Table or Virtual Table with the given name, None if there is no such table"""
+        position = self.TableIndex.get(inTableName)
+        return self.Tables[position] if position is not None else None
+
+    def getStoredProcedure(self, inStoredProcName: str):
+        """Returns the Stored Procedure with the given name, None if there is no such stored procedure"""
+        position = self.StoredProcedureIndex.get(inStoredProcName)
+        return self.MDEFStoredProcedures[position] if position is not None else None
+
+    def getTableFingerprint(self, inTableName: str):
+        """Returns the fingerprint of the Table or Virtual Table with the given name"""
+        return self.TableFingerprints[self.TableIndex[inTableName]]
+
+    def getColumnFingerprints(self, inTableName: str):
+        """
+        Finds the fingerprints of the columns of the given Table or Virtual Table, parsing them from the MDEF Content
+        if the MDEF was parsed without columns \n
+        :param inTableName: Name of the Table or Virtual Table
+        :return: Returns the mapping of column names to their fingerprints
+        """
+        if self.WithColumns:
+            return {column.Name: column.getFingerprint() for column in self.getTable(inTableName).Ordinals}
+        element = self.MDEFContent[MDEF.m_Tables][self.TableElements[self.TableIndex[inTableName]]]
+        for table in self.parseTable(element, withColumns=True, inRegister=False):
+            if table.Name == inTableName:
+                return {column.Name: column.getFingerprint() for column in table.Ordinals}
+        return dict()
+
     def findDifference(self, inMDEF):
         """
-        Finds the difference in Tables and Stored Procedures with respect to passed MDEF Content \n
+        Finds the Tables, Columns and Stored Procedures added, changed or removed with respect to the passed MDEF by
+        comparing the fingerprints of both \n
         :param inMDEF: Another MDEF Instance to compare in order to find the difference between both
-        :return: Returns the difference between both files in the form of MDEF Instance
+        :return: Returns the MDEF Content holding the added & changed Tables and Stored Procedures along with the
+        `Changes` found, None if both MDEFs are identical
         """
         if inMDEF is None:
             return None
-        mdefDiff = dict()
+        changes = {
+            MDEF.m_Tables: {MDEF.m_Added: list(), MDEF.m_Changed: dict(), MDEF.m_Removed: list()},
+            MDEF.m_StoredProcedures: {MDEF.m_Added: list(), MDEF.m_Changed: list(), MDEF.m_Removed: list()}
+        }
+
+        # Compare Tables
+        tableElements = set()
+        tableChanges = changes[MDEF.m_Tables]
+        for tableName, position in self.TableIndex.items():
+            otherPosition = inMDEF.TableIndex.get(tableName)
+            if otherPosition is None:
+                tableChanges[MDEF.m_Added].append(tableName)
+            elif self.TableFingerprints[position] != inMDEF.TableFingerprints[otherPosition]:
+                columns = self.getColumnFingerprints(tableName)
+                otherColumns = inMDEF.getColumnFingerprints(tableName)
+                tableChanges[MDEF.m_Changed][tableName] = [columnName for columnName, fingerprint in columns.items()
+                                                           if otherColumns.get(columnName) != fingerprint]
+            else:
+                continue
+            tableElements.add(self.TableElements[position])
+        tableChanges[MDEF.m_Removed] = [tableName for tableName in inMDEF.TableIndex
+                                        if tableName not in self.TableIndex]
 
         # Compare Stored Procedures
-        if len(self.MDEFStoredProcedures) > 0 and len(inMDEF.MDEFStoredProcedures) > 0:
-            mdefDiff[MDEF.m_StoredProcedures] = list()
-            index = 0
-            for storedProcName in self.MDEFStoredProcedures:
-                if storedProcName not in inMDEF.MDEFStoredProcedures:
-                    mdefDiff[MDEF.m_StoredProcedures].append(self.MDEFContent[MDEF.m_StoredProcedures][index])
-                index += 1
+        storedProcElements = set()
+        storedProcChanges = changes[MDEF.m_StoredProcedures]
+        for storedProcName, position in self.StoredProcedureIndex.items():
+            otherPosition = inMDEF.StoredProcedureIndex.get(storedProcName)
+            if otherPosition is None:
+                storedProcChanges[MDEF.m_Added].append(storedProcName)
+            elif self.StoredProcedureFingerprints[position] != inMDEF.StoredProcedureFingerprints[otherPosition]:
+                storedProcChanges[MDEF.m_Changed].append(storedProcName)
+            else:
+                continue
+            storedProcElements.add(self.StoredProcedureElements[position])
+        storedProcChanges[MDEF.m_Removed] = [storedProcName for storedProcName in inMDEF.StoredProcedureIndex
+                                             if storedProcName not in self.StoredProcedureIndex]
 
-        # Compare Tables
-        if len(self.Tables) > 0 and len(inMDEF.Tables) > 0:
-            mdefDiff[MDEF.m_Tables] = list()
-            index = 0
-            for table in self.MDEFContent[MDEF.m_Tables]:
-                if assure(table, MDEF.m_TableName) not in inMDEF.TableNames:
-                    mdefDiff[MDEF.m_Tables].append(self.MDEFContent[MDEF.m_Tables][index])
-                index += 1
+        if all(len(changed) == 0 for sectionChanges in changes.values() for changed in sectionChanges.values()):
+            return None
+        tableElements, storedProcElements = sorted(tableElements), sorted(storedProcElements)
+        return {
+            MDEF.m_Tables: [self.MDEFContent[MDEF.m_Tables][index] for index in tableElements],
+            MDEF.m_StoredProcedures: [self.MDEFContent[MDEF.m_StoredProcedures][index]
+                                      for index in storedProcElements],
+            MDEF.m_Changes: changes,
+            MDEF.m_SourceElements: {MDEF.m_Tables: tableElements, MDEF.m_StoredProcedures: storedProcElements}
+        }
 
-        return mdefDiff if len(mdefDiff[MDEF.m_Tables]) > 0 and len(mdefDiff[MDEF.m_StoredProcedures]) > 0 else None
+    def adoptEntries(self, inMDEF):
+        """
+        Takes over the already parsed entries of the given MDEF for the elements of this MDEF's Content, which has to
+        be a difference found by `inMDEF.findDifference`, instead of parsing the elements again \n
+        :param inMDEF: MDEF Instance the difference was found from
+        """
+        sourceElements = self.MDEFContent[MDEF.m_SourceElements]
+        self.Tables = list()
+        self.MDEFStoredProcedures = list()
+        for section, entries, sourceEntries, sourceEntryElements in (
+                (MDEF.m_Tables, self.Tables, inMDEF.Tables, inMDEF.TableElements),
+                (MDEF.m_StoredProcedures, self.MDEFStoredProcedures, inMDEF.MDEFStoredProcedures,
+                 inMDEF.StoredProcedureElements)):
+            elementIndexes = {sourceElement: index for index, sourceElement in enumerate(sourceElements[section])}
+            for position, sourceElement in enumerate(sourceEntryElements):
+                if sourceElement in elementIndexes:
+                    entries.append(sourceEntries[position])
+                    self.indexEntries(entries[-1:], elementIndexes[sourceElement], section)
+        for table in self.Tables:
+            if table.Virtual:
+                self.VirtualTableNames.append(table.Name)
+            elif table.Name in inMDEF.TableNames:
+                self.TableNames[table.Name] = inMDEF.TableNames[table.Name]
+
+    def restrictToChanges(self, inChanges: dict):
+        """
+        Keeps only the added & changed Tables, and records the changed columns of the changed tables in
+        `ChangedColumns`. The MDEF Content of a difference holds whole elements, so it may also contain unchanged
+        tables which were needed to resolve the changed Virtual Tables. \n
+        :param inChanges: Changes found by `findDifference`
+        """
+        tableChanges = inChanges[MDEF.m_Tables]
+        surface = set(tableChanges[MDEF.m_Added]).union(tableChanges[MDEF.m_Changed])
+        self.ChangedColumns = {tableName: set(columns) for tableName, columns in tableChanges[MDEF.m_Changed].items()
+                               if len(columns) > 0}
+        positions = [position for tableName, position in self.TableIndex.items() if tableName in surface]
+        self.Tables = [self.Tables[position] for position in positions]
+        self.TableFingerprints = [self.TableFingerprints[position] for position in positions]
+        self.TableElements = array('q', (self.TableElements[position] for position in positions))
+        self.TableIndex = {table.Name: position for position, table in enumerate(self.Tables)}
+        self.VirtualTableNames = [tableName for tableName in self.VirtualTableNames if tableName in surface]
+        for tableName in list(self.TableNames):
+            if tableName not in surface:
+                del self.TableNames[tableName]
+            elif tableName in self.ChangedColumns and self.TableNames[tableName] is not None:
+                passdownableColumns = [columnName for columnName in self.TableNames[tableName]
+                                       if columnName in self.ChangedColumns[tableName]]
+                self.TableNames[tableName] = passdownableColumns if len(passdownableColumns) > 0 else None
+
+    def restrictToChangedColumns(self, inTableColumnsValues: dict):
+        """
+        Restricts the given Table Column Values Mapping to the changed columns of the changed tables \n
+        :param inTableColumnsValues: Table Column Values Mapping
+        :return: Returns the restricted Table Column Values Mapping
+        """
+        for tableName, changedColumns in self.ChangedColumns.items():
+            if tableName in inTableColumnsValues:
+                inTableColumnsValues[tableName] = {columnName: columnValues for columnName, columnValues
+                                                   in inTableColumnsValues[tableName].items()
+                                                   if columnName in changedColumns}
+        return inTableColumnsValues
 
     def parseStoredProcedures(self, withColumns: bool = False):
         """Parses Stored Procedures"""
+        mdefStoredProcedures = list()
         if assure(self.MDEFContent, MDEF.m_StoredProcedures, True) and len(
                 self.MDEFContent[MDEF.m_StoredProcedures]) > 0:
-            mdefStoredProcedures = list()
-            if withColumns:
-                for storedProc in self.MDEFContent[MDEF.m_StoredProcedures]:
-                    columns = list()
-                    if assure(storedProc, MDEF.m_ResultTable):
-                        for column in assure(storedProc[MDEF.m_ResultTable], MDEF.m_Columns):
-                            columns.append({
-                                assure(column, MDEF.m_Name): assure(column[MDEF.m_MetaData], MDEF.m_SQLType) if assure(
-                                    column, MDEF.m_MetaData) else None
-                            })
-                        mdefStoredProcedures.append({
-                            assure(storedProc, MDEF.m_Name): columns
-                        })
-            else:
-                for storedProc in self.MDEFContent[MDEF.m_StoredProcedures]:
-                    mdefStoredProcedures.append(assure(storedProc, MDEF.m_Name))
+            for index, storedProc in enumerate(self.MDEFContent[MDEF.m_StoredProcedures]):
+                entries = self.parseStoredProcedure(storedProc, withColumns)
+                self.indexEntries(entries, index, MDEF.m_StoredProcedures)
+                mdefStoredProcedures.extend(entries)
+        return mdefStoredProcedures
 
-            return mdefStoredProcedures
+    @staticmethod
+    def parseStoredProcedure(inStoredProc: dict, withColumns: bool = False):
+        """
+        Parses a Stored Procedure, returns a list holding its entry. Every Stored Procedure is indexed whether its
+        columns are parsed or not, so MDEFs loaded with & without columns compare alike
+        """
+        columns = tuple()
+        if withColumns and assure(inStoredProc, MDEF.m_ResultTable, True):
+            columns = tuple(MDEFColumn.fromElement(column)
+                            for column in assure(inStoredProc[MDEF.m_ResultTable], MDEF.m_Columns, True) or ())
+        return [MDEFStoredProcedure(assure(inStoredProc, MDEF.m_Name), columns, getFingerprint(inStoredProc))]
 
     def parseTables(self, withColumns: bool = False):
         """Parses Tables"""
+        mdefTables = list()
         if assure(self.MDEFContent, MDEF.m_Tables) and len(self.MDEFContent[MDEF.m_Tables]) > 0:
-            mdefTables = list()
-            for table in self.MDEFContent[MDEF.m_Tables]:
-                if assure(table, MDEF.m_TableName) in mdefTables:
-                    raise Exception(
-                        f"Error: {self.MDEFPath} contains more than one table with name {table[MDEF.m_TableName]}"
-                    )
-                else:
-                    columns = dict()
-                    passdownableColumns = list()
-                    if withColumns:
-                        if len(assure(table, MDEF.m_Columns)) > 0:
-                            for column in table[MDEF.m_Columns]:
-                                if assure(column, MDEF.m_Passdownable):
-                                    passdownableColumns.append(assure(column, MDEF.m_Name))
-                                columns[assure(column, MDEF.m_Name)] = assure(column[MDEF.m_MetaData], MDEF.m_SQLType) \
-                                    if assure(column, MDEF.m_MetaData) else None
-
-                    if assure(table, MDEF.m_APIAccess):
-                        apiAccesses = list()
-                        for apiAccess in table[MDEF.m_APIAccess]:
-                            if apiAccess in MDEF.m_APIAccesses:
-                                columns_req = assure(table[MDEF.m_APIAccess][apiAccess], MDEF.m_ColumnRequirements,
-                                                     True)
-                                apiAccesses.append({
-                                    apiAccess: columns_req if columns_req else []
-                                })
-                        mdefTables.append({
-                            MDEF.m_Name: table[MDEF.m_TableName],
-                            MDEF.m_Columns: columns,
-                            MDEF.m_APIAccess: apiAccesses
-                        })
-                        self.TableNames[table[MDEF.m_TableName]] = passdownableColumns \
-                            if len(passdownableColumns) > 0 else None
-                    self.parseVirtualTables(table, mdefTables, withColumns)
-
-            return mdefTables
-
-    def parseVirtualTables(self, inTable: dict, inMDEFTables: list, withColumns: bool = False):
-        """Parses Virtual Tables"""
+            for index, table in enumerate(self.MDEFContent[MDEF.m_Tables]):
+                entries = self.parseTable(table, withColumns)
+                self.indexEntries(entries, index, MDEF.m_Tables)
+                mdefTables.extend(entries)
+        return mdefTables
+
+    @staticmethod
+    def getElementFingerprint(inTable: dict):
+        """Returns the fingerprint of a Table or Virtual Table element excluding its Virtual Tables"""
+        return getFingerprint({key: value for key, value in inTable.items() if key != MDEF.m_VirtualTables})
+
+    def parseTable(self, inTable: dict, withColumns: bool = False, inRegister: bool = True):
+        """
+        Parses a Table along with its Virtual Tables \n
+        :param inTable: Table element of the MDEF
+        :param withColumns: If set to True, columns of the tables are parsed as well
+        :param inRegister: If set to True, table names are recorded in `TableNames` & `VirtualTableNames`
+        :return: Returns the list of parsed table entries
+        """
+        mdefTables = list()
+        columns = dict()
+        ordinals = list()
+        passdownableColumns = list()
+        if withColumns:
+            if len(assure(inTable, MDEF.m_Columns)) > 0:
+                for column in inTable[MDEF.m_Columns]:
+                    mdefColumn = MDEFColumn.fromElement(column, withPassdownable=True)
+                    if mdefColumn.Passdownable:
+                        passdownableColumns.append(mdefColumn.Name)
+                    columns[mdefColumn.Name] = mdefColumn
+                    ordinals.append(mdefColumn)
+        ordinals = tuple(ordinals)
+
+        if assure(inTable, MDEF.m_APIAccess):
+            apiAccesses = dict()
+            for apiAccess in inTable[MDEF.m_APIAccess]:
+                if apiAccess in MDEF.m_APIAccesses:
+                    columns_req = assure(inTable[MDEF.m_APIAccess][apiAccess], MDEF.m_ColumnRequirements, True)
+                    apiAccesses[sys.intern(apiAccess)] = columns_req if columns_req else []
+            mdefTables.append(MDEFTable(inTable[MDEF.m_TableName], columns, ordinals, apiAccesses,
+                                        inFingerprint=MDEF.getElementFingerprint(inTable)))
+            if inRegister:
+                self.TableNames[mdefTables[-1].Name] = passdownableColumns if len(passdownableColumns) > 0 else None
+        self.parseVirtualTables(inTable, ordinals, mdefTables, withColumns, inRegister)
+        return mdefTables
+
+    def parseVirtualTables(self, inTable: dict, inParentOrdinals: tuple, inMDEFTables: list,
+                           withColumns: bool = False, inRegister: bool = True):
+        """
+        Parses Virtual Tables \n
+        :param inTable: Table or Virtual Table element of the MDEF holding the Virtual Tables
+        :param inParentOrdinals: Columns of `inTable` in MDEF order, to resolve the `ParentColumn` ordinals
+        :param inMDEFTables: List of parsed table entries to append the Virtual Tables to
+        :param withColumns: If set to True, columns of the tables are parsed as well
+        :param inRegister: If set to True, table names are recorded in `VirtualTableNames`
+        """
         if assure(inTable, MDEF.m_VirtualTables, True) and len(inTable[MDEF.m_VirtualTables]) > 0:
             for virtualTable in inTable[MDEF.m_VirtualTables]:
-                if assure(virtualTable, MDEF.m_TableName) in inMDEFTables:
-                    raise Exception(f"Error: {self.MDEFPath} contains more than one table "
-                                    f"with name {virtualTable[MDEF.m_TableName]}")
-                else:
-                    columns = dict()
-                    if withColumns and len(assure(virtualTable, MDEF.m_Columns)) > 0:
-                        for column in virtualTable[MDEF.m_Columns]:
-                            if MDEF.m_ParentColumn in column:
-                                columnIndex = 0
-                                for tableColumn, tableColumnType in inMDEFTables[-1][MDEF.m_Columns].items():
-                                    if columnIndex == int(column[MDEF.m_ParentColumn]):
-                                        columns[tableColumn] = tableColumnType
-                                        break
-                                    columnIndex += 1
-                            else:
-                                columns[assure(column, MDEF.m_Name)] = assure(column[MDEF.m_MetaData], MDEF.m_SQLType) \
-                                    if assure(column, MDEF.m_MetaData) else None
-
-                    inMDEFTables.append({
-                        MDEF.m_Name: virtualTable[MDEF.m_TableName],
-                        MDEF.m_Columns: columns,
-                        'Virtual': True
-                    })
-                    self.VirtualTableNames.append(virtualTable[MDEF.m_TableName])
-                    self.parseVirtualTables(virtualTable, inMDEFTables, withColumns)
+                columns = dict()
+                ordinals = list()
+                if withColumns and len(assure(virtualTable, MDEF.m_Columns)) > 0:
+                    for column in virtualTable[MDEF.m_Columns]:
+                        if MDEF.m_ParentColumn in column:
+                            columnIndex = int(column[MDEF.m_ParentColumn])
+                            if not 0 <= columnIndex < len(inParentOrdinals):
+                                continue
+                            mdefColumn = inParentOrdinals[columnIndex]
+                        else:
+                            mdefColumn = MDEFColumn.fromElement(column)
+                        columns[mdefColumn.Name] = mdefColumn
+                        ordinals.append(mdefColumn)
+                ordinals = tuple(ordinals)
+
+                inMDEFTables.append(MDEFTable(assure(virtualTable, MDEF.m_TableName), columns, ordinals,
+                                              inVirtual=True,
+                                              inFingerprint=MDEF.getElementFingerprint(virtualTable)))
+                if inRegister:
+                    self.VirtualTableNames.append(inMDEFTables[-1].Name)
+                self.parseVirtualTables(virtualTable, ordinals, inMDEFTables, withColumns, inRegister)
+
+
+class ColumnProfile:
+    """
+    Classification of the values sampled from a column, computed once and shared by all the query generators.
+    `Values` holds the sampled values themselves, `TypeClass` is one of `m_Numeric`, `m_Boolean`, `m_Datetime`,
+    `m_String`, `m_Mixed` or `m_Empty`. `Min` & `Max` are unknown for Mixed & Empty columns. `Sketch` summarizes all
+    the values of the column rather than the sampled ones, if the Result-set was sketched. `SQL_AND_OR` chooses its
+    predicates from it.
+    """
+    __slots__ = ('Name', 'Values', 'TypeClass', 'IsNumeric', 'IsString', 'HasString', 'HasDatetime', 'DistinctCount',
+                 'Min', 'Max', 'IsIdentifier', 'Sketch')
+    m_Numeric = 'Numeric'
+    m_Boolean = 'Boolean'
+    m_Datetime = 'Datetime'
+    m_String = 'String'
+    m_Mixed = 'Mixed'
+    m_Empty = 'Empty'
+    m_IdentifierTokens = ('id', 'index')
+    m_DatetimeRegex = re.compile('\'([0-9]+)-([0-9]+)-([0-9]+) ([0-9]+):([0-9]+):([0-9]+).([0-9]+)\'')
+
+    def __init__(self, inName: str, inValues, inSketch: ColumnSketch = None):
+        self.Name = inName
+        self.Values = inValues
+        self.Sketch = inSketch
+        numericCount = booleanCount = stringCount = datetimeCount = 0
+        typedColumn = isinstance(inValues, ColumnStore.TypedColumn)
+        if typedColumn and inValues.Kind != ColumnStore.m_Object:
+            # The common type of the values is known already, only strings have to be looked at
+            if inValues.Kind in (ColumnStore.m_Integer, ColumnStore.m_Float):
+                numericCount = len(inValues)
+            elif inValues.Kind == ColumnStore.m_Boolean:
+                booleanCount = len(inValues)
+            else:
+                stringCount = len(inValues)
+                datetimeCount = sum(map(bool, map(ColumnProfile.m_DatetimeRegex.match, inValues)))
+        else:
+            for value in inValues:
+                if isinstance(value, str):
+                    stringCount += 1
+                    if ColumnProfile.m_DatetimeRegex.match(value) is not None:
+                        datetimeCount += 1
+                elif isinstance(value, bool):
+                    booleanCount += 1
+                elif isinstance(value, (int, float)):
+                    numericCount += 1
+        self.IsNumeric = numericCount == len(inValues)
+        self.IsString = stringCount == len(inValues)
+        self.HasString = stringCount > 0
+        self.HasDatetime = datetimeCount > 0
+        if len(inValues) == 0:
+            self.TypeClass = ColumnProfile.m_Empty
+        elif self.IsNumeric:
+            self.TypeClass = ColumnProfile.m_Numeric
+        elif booleanCount == len(inValues):
+            self.TypeClass = ColumnProfile.m_Boolean
+        elif datetimeCount == len(inValues):
+            self.TypeClass = ColumnProfile.m_Datetime
+        elif self.IsString:
+            self.TypeClass = ColumnProfile.m_String
+        else:
+            self.TypeClass = ColumnProfile.m_Mixed
+        if self.TypeClass in (ColumnProfile.m_Empty, ColumnProfile.m_Mixed):
+            self.Min = self.Max = None
+        elif typedColumn:
+            self.Min, self.Max = inValues.min(), inValues.max()
+        else:
+            self.Min, self.Max = min(inValues), max(inValues)
+        self.DistinctCount = inValues.distinctCount() if typedColumn else len(set(inValues))
+        self.IsIdentifier = any(token in inName.lower() for token in ColumnProfile.m_IdentifierTokens)
+
+    def getSelectivePredicate(self):
+        """
+        Finds the value an equality predicate on the column is compared against, among the most frequent values of the
+        sketch so that some row matches it. Its selectivity is estimated from the distinct & the null values, as the
+        counts of Space-Saving overestimate the rare values \n
+        :return: Returns (Value, Estimated fraction of the rows selected), None without a sketch or any non null value
+        """
+        if self.Sketch is None or len(self.Sketch.TopValues) == 0:
+            return None
+        value, _ = min(self.Sketch.TopValues, key=lambda topValue: topValue[1])
+        return value, (1.0 - self.Sketch.NullFraction) / max(self.Sketch.DistinctCount, 1)
+
+    def sample(self, inCount: int):
+        """Picks `inCount` of the sampled values at distinct positions at random, all of them if there are fewer"""
+        if isinstance(self.Values, ColumnStore.TypedColumn):
+            return self.Values.sample(inCount)
+        return random.sample(self.Values, min(inCount, len(self.Values)))
+
+    @staticmethod
+    def profileTables(inTableColumnsValues: dict, inColumnSketches: dict = None):
+        """
+        Profiles the columns of every table \n
+        :param inTableColumnsValues: Table Column Values Mapping, the values either as list or as `TypedColumn`
+        :param inColumnSketches: Table Column Sketch Mapping, attached to the profiles of the columns sketched
+        :return: Returns Table Column Profiles Mapping, keeping the order of tables & columns
+        """
+        sketches = inColumnSketches if inColumnSketches is not None else dict()
+        return {tableName: {columnName: ColumnProfile(columnName, columnValues,
+                                                      sketches.get(tableName, dict()).get(columnName))
+                            for columnName, columnValues in columns.items()}
+                for tableName, columns in inTableColumnsValues.items()}
+
+
+class TestSetManifest:
+    """
+    Hashes of the inputs every Test-set was generated from, kept as `Manifest.json` within the `Output` folder. A
+    Test-set whose inputs did not change is neither rewritten nor executed again, along with its Result-sets
+    """
+    m_Environment = 'Environment'
+    m_TestSets = 'TestSets'
+    m_Hash = 'Hash'
+    m_Executed = 'Executed'
+    m_CrossDuplicates = 'CrossDuplicates'
+
+    def __init__(self, inConnectionString: str, inShardLimits: tuple = (0, 0)):
+        self.filePath = os.path.join(m_OutputFolder, m_Manifest)
+        # Result-sets of every Test-set depend on the data source, the files written on the limits of the shards
+        self.environment = getFingerprint([m_GeneratorVersion, inConnectionString, inShardLimits]).hex()
+        self.testSets = dict()
+        if os.path.exists(self.filePath):
+            try:
+                with open(self.filePath) as file:
+                    content = json.load(file)
+                if content.get(TestSetManifest.m_Environment) == self.environment:
+                    self.testSets = content[TestSetManifest.m_TestSets]
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Warning: Ignoring unreadable {m_Manifest}: {e}")
+
+    @staticmethod
+    def getHash(inStartingID: int, inInputs):
+        """
+        Computes the hash of a Test-set's inputs \n
+        :param inStartingID: Starting Id of the Test-set
+        :param inInputs: JSON serializable inputs the Test-set is generated from
+        :return: Returns the hash as hex string
+        """
+        return getFingerprint([m_GeneratorVersion, inStartingID, inInputs]).hex()
+
+    def isUpToDate(self, inTestSuite: str, inTestSet: str, inHash: str):
+        """Checks whether the Test-set was already generated from the inputs with the given hash"""
+        entry = self.testSets.get(inTestSuite, dict()).get(inTestSet)
+        return entry is not None and entry[TestSetManifest.m_Hash] == inHash and \
+            os.path.exists(os.path.join(m_OutputFolder, inTestSuite, m_TestSets, inTestSet + m_TestFilesExtension))
+
+    def invalidate(self, inTestSuite: str, inTestSet: str):
+        """Forgets the Test-set and removes the Result-sets of all its shards, which are stale from now on"""
+        self.testSets.get(inTestSuite, dict()).pop(inTestSet, None)
+        resultSetsPath = os.path.join(m_OutputFolder, inTestSuite, m_ResultSets)
+        if os.path.exists(resultSetsPath):
+            resultSetPattern = re.compile(re.escape(inTestSet) + r'(_[0-9]+)?-')
+            for entry in os.scandir(resultSetsPath):
+                if resultSetPattern.match(entry.name):
+                    os.remove(entry.path)
+
+    def update(self, inTestSuite: str, inTestSet: str, inHash: str):
+        """Records the Test-set as generated from the inputs with the given hash, not executed yet"""
+        self.testSets.setdefault(inTestSuite, dict())[inTestSet] = {TestSetManifest.m_Hash: inHash,
+                                                                   TestSetManifest.m_Executed: False}
+
+    def getCrossDuplicates(self, inTestSuite: str, inTestSet: str):
+        """Returns the number of queries the Test-set dropped as an earlier Test-set already had them"""
+        entry = self.testSets.get(inTestSuite, dict()).get(inTestSet)
+        return 0 if entry is None else entry.get(TestSetManifest.m_CrossDuplicates, 0)
+
+    def setCrossDuplicates(self, inTestSuite: str, inTestSet: str, inCount: int):
+        entry = self.testSets.get(inTestSuite, dict()).get(inTestSet)
+        if entry is not None:
+            entry[TestSetManifest.m_CrossDuplicates] = inCount
+
+    def isExecuted(self, inTestSuite: str, inTestSet: str):
+        entry = self.testSets.get(inTestSuite, dict()).get(inTestSet)
+        return entry is not None and entry[TestSetManifest.m_Executed]
+
+    def setExecuted(self, inTestSuite: str, inTestSet: str):
+        entry = self.testSets.get(inTestSuite, dict()).get(inTestSet)
+        if entry is not None:
+            entry[TestSetManifest.m_Executed] = True
+
+    def getUnexecutedTestSets(self, inRequiredTestSuites: dict):
+        """
+        Finds the required Test-sets whose Result-sets are yet to be generated \n
+        :param inRequiredTestSuites: A Dictionary having Testsuite as a key and list of test-sets as value
+        :return: Returns a Dictionary having Testsuite as a key and list of unexecuted test-sets as value
+        """
+        unexecutedTestSets = dict()
+        for testSuite, testSets in inRequiredTestSuites.items():
+            for testSet in testSets:
+                if testSet in self.testSets.get(testSuite, dict()) and not self.isExecuted(testSuite, testSet):
+                    unexecutedTestSets.setdefault(testSuite, list()).append(testSet)
+        return unexecutedTestSets
+
+    def save(self):
+        with open(self.filePath, 'w') as file:
+            json.dump({TestSetManifest.m_Environment: self.environment, TestSetManifest.m_TestSets: self.testSets},
+                      file, indent=4)
 
 
 class TestWriter:
@@ -223,18 +779,8 @@ class TestWriter:
         """
         if os.path.exists(inTestEnvLoc):
             if len(inConnectionString) > 0:
-                with open(os.path.join(inTestEnvLoc, m_TestEnv), 'w') as file:
-                    file.write('<?xml version="1.0" encoding="utf-8"?>\n')
-                    file.write('<TestEnvironment>\n')
-                    file.write(f"\t<ConnectionString>{inConnectionString}</ConnectionString>\n")
-                    file.write('\t<_Monitor>\n')
-                    file.write('\t\t<GenerateResults>true</GenerateResults>\n')
-                    file.write('\t\t<timeout>20</timeout>\n')
-                    file.write('\t\t<maxConsecutiveTimeout>15</maxConsecutiveTimeout>\n')
-                    file.write('\t\t<maxAccumulatedTimeout>50</maxAccumulatedTimeout>\n')
-                    file.write('\t</_Monitor>\n')
-                    file.write('\t<SqlWcharEncoding>UTF-32</SqlWcharEncoding>\n')
-                    file.write('</TestEnvironment>')
+                with open(os.path.join(inTestEnvLoc, m_TestEnv), 'wb') as file:
+                    XMLEmitter.writeTestEnv(file, inConnectionString)
                 return True
             else:
                 print('Error: Empty Connection String passed')
@@ -246,95 +792,336 @@ class TestWriter:
     @staticmethod
     def writeTestSuites(inRequiredTestSuites: dict):
         """
-        Prepares Testsuite Folders and writes `TestSuite.xml` within the folder \n
+        Prepares Testsuite Folders and writes `TestSuite.xml` within the folder. Every shard of a Test-set is
+        registered as a Test-set on its own \n
         :param inRequiredTestSuites: A Dictionary having Testsuite as a key and list of test-sets as value
         :return: Returns True if written successfully else False
         """
         outputFolderLoc = os.path.abspath(m_OutputFolder)
         if os.path.exists(outputFolderLoc):
             for testSuite, testSets in inRequiredTestSuites.items():
-                with open(os.path.join(os.path.join(outputFolderLoc, testSuite), m_TestSuite), 'w') as file:
-                    file.write('<TestSuite Name="SQL Test">\n')
-                    for test_set in testSets:
-                        file.write(f"\t<TestSet Name=\"{test_set}\" "
-                                   f"SetFile=\"{testSuite}/TestSets/{test_set}{m_TestFilesExtension}\">\n")
-                        file.write('\t\t<!--\n')
-                        file.write('\t\t<Exclusion StartID="6" EndID="6">Exclusion reason</Exclusion>\n')
-                        file.write('\t\t<Ignorable StartID="6" EndID="6">Ignorable reason</Ignorable>\n')
-                        file.write('\t\t-->\n')
-                        file.write('\t</TestSet>\n')
-                    file.write('\t<GenerateResults>true</GenerateResults>\n')
-                    file.write(f"\t<BaselineDirectory>{testSuite}\\ResultSets</BaselineDirectory>\n")
-                    file.write('</TestSuite>')
+                shards = [shard for testSet in testSets for shard in TestWriter.getTestSetShards(testSuite, testSet)]
+                with open(os.path.join(os.path.join(outputFolderLoc, testSuite), m_TestSuite), 'wb') as file:
+                    XMLEmitter.writeTestSuite(file, testSuite, shards, m_TestFilesExtension)
             return True
         else:
             print('Error: Incorrect Test Suite Location')
             return False
 
+    @staticmethod
+    def writeTestSuitePartitions(inTestSuite: str, inTestSets, inPartitionCount: int):
+        """
+        Splits the tests of a Test-suite into partitions of contiguous Ids, each of them written as a Test-suite of its
+        own to `{Testsuite}/Partitions/{Partition}/TestSuite.xml`. A Test-set spanning several partitions is listed by
+        all of them, the Ids of the others being excluded through `Exclusion` elements. Every partition has its own
+        baseline folder \n
+        :param inTestSuite: Name of the Test Suite
+        :param inTestSets: Names of the Test Sets of the suite
+        :param inPartitionCount: Number of partitions to split the tests into
+        :return: Returns the number of partitions written, 0 if the suite is not worth splitting
+        """
+        testSetRanges = list()
+        for testSet in inTestSets:
+            for shard in TestWriter.getTestSetShards(inTestSuite, testSet):
+                idRange = TestWriter.getTestIdRange(inTestSuite, shard)
+                if idRange is not None:
+                    testSetRanges.append((shard, idRange[0], idRange[1]))
+        totalTests = sum(lastId - firstId + 1 for _, firstId, lastId in testSetRanges)
+        partitionsPath = os.path.join(m_OutputFolder, inTestSuite, m_Partitions)
+        if os.path.exists(partitionsPath):
+            rmtree(partitionsPath)
+        if inPartitionCount < 2 or totalTests < 2:
+            return 0
+        testsPerPartition = -(-totalTests // min(inPartitionCount, totalTests))
+        partitions = list()
+        position = 0
+        for testSet, firstId, lastId in testSetRanges:
+            testId = firstId
+            while testId <= lastId:
+                if position % testsPerPartition == 0:
+                    partitions.append(dict())
+                testCount = min(lastId - testId + 1, testsPerPartition - position % testsPerPartition)
+                partitions[-1][testSet] = (firstId, lastId, testId, testId + testCount - 1)
+                testId += testCount
+                position += testCount
+        for partition, testSets in enumerate(partitions, 1):
+            partitionPath = os.path.join(partitionsPath, str(partition))
+            os.makedirs(os.path.join(partitionPath, m_ResultSets), exist_ok=True)
+            exclusions = dict()
+            for testSet, (firstId, lastId, startId, endId) in testSets.items():
+                exclusions[testSet] = [(excludedStartId, excludedEndId, 'Run by another partition')
+                                       for excludedStartId, excludedEndId in ((firstId, startId - 1),
+                                                                              (endId + 1, lastId))
+                                       if excludedStartId <= excludedEndId]
+            with open(os.path.join(partitionPath, m_TestSuite), 'wb') as file:
+                XMLEmitter.writeTestSuite(file, inTestSuite, testSets, m_TestFilesExtension, exclusions,
+                                          f"{inTestSuite}\\{m_Partitions}\\{partition}")
+        return len(partitions)
+
+    @staticmethod
+    def getTestIdRange(inTestSuite: str, inTestSet: str):
+        """
+        Finds the Ids of the first & the last test of a Test-set file \n
+        :param inTestSuite: Name of the Test Suite
+        :param inTestSet: Name of the Test Set, or of one of its shards
+        :return: Returns (First Id, Last Id), None if the Test-set has no tests
+        """
+        testSetPath = os.path.join(m_OutputFolder, inTestSuite, m_TestSets, inTestSet + m_TestFilesExtension)
+        firstId = lastId = None
+        if os.path.exists(testSetPath):
+            for _, element in Etree.iterparse(testSetPath):
+                if element.tag == 'Test':
+                    lastId = int(element.attrib.get('ID'))
+                    firstId = lastId if firstId is None else firstId
+                    element.clear()
+        return None if firstId is None else (firstId, lastId)
+
     @staticmethod
     def writeTestSets(inRequiredTestSuites: dict, inMdefDiff: MDEF, inExternalArgs: dict, onlySelectAll: bool = False,
-                      inTableColumnsValues: dict = None):
+                      inTableColumnsValues: dict = None, inManifest: TestSetManifest = None,
+                      inShardLimits: tuple = (0, 0), inQueryBudget: tuple = (0, 0), inColumnSketches: dict = None):
         """
-        Prepares required TestSets for given TestSuites \n
+        Prepares required TestSets for given TestSuites. Test-sets are independent of each other, hence they are
+        generated concurrently and a failing test-set does not stop the others \n
         :param inExternalArgs: External Arguments containing the input params for SP.
         :param inTableColumnsValues: Table Column Values Mapping
         :param onlySelectAll: A Flag to only generate test sets for SQL_SELECT_ALL
         :param inMdefDiff: MDEF Instance
         :param inRequiredTestSuites: A Dictionary having Testsuite as a key and list of test-sets as value
+        :param inManifest: Manifest of the previously generated Test-sets, those still up to date are not rewritten
+        :param inShardLimits: Maximum number of tests & bytes per file, Test-sets exceeding them are split into shards.
+        `SQL_SELECT_ALL` is never split, as its Result-sets are parsed by Id
+        :param inQueryBudget: Maximum number of queries per table & per Test-set of the expandable Test-sets
+        :param inColumnSketches: Table Column Sketch Mapping, exposed to the query generators through the profiles
         :return: Returns True if written successfully else False
         """
         if len(inRequiredTestSuites) > 0:
-            if not onlySelectAll and (inTableColumnsValues is None or len(inTableColumnsValues) == 0):
+            if onlySelectAll:
+                for testSuite, testSets in inRequiredTestSuites.items():
+                    for testSet, startingId in testSets.items():
+                        if testSet in TestSets.SQL_SELECT_ALL.value:
+                            testSetHash = TestSetManifest.getHash(
+                                startingId, [[table.Name, TestWriter._toHex(table.Fingerprint)]
+                                             for table in inMdefDiff.Tables])
+                            if inManifest is not None:
+                                if inManifest.isUpToDate(testSuite, testSet, testSetHash):
+                                    print(f"{testSet} for {testSuite} is up to date")
+                                    return True
+                                inManifest.invalidate(testSuite, testSet)
+                            written = TestWriter.writeSelectAllTestSets(testSuite, testSet, inMdefDiff, startingId)
+                            if written and inManifest is not None:
+                                inManifest.update(testSuite, testSet, testSetHash)
+                                inManifest.save()
+                            return written
+                return False
+
+            if inTableColumnsValues is None or len(inTableColumnsValues) == 0:
                 print('Error: Tables Column Values Map must be provided in order to generate Test Cases other than '
                       '`SQL_SELECT_ALL`')
                 return False
 
-            hadFailure = False
+            sampleInputs = TestWriter._getSampleInputs(inMdefDiff, inTableColumnsValues)
+            # Classified once, shared by all the Test-sets
+            columnProfiles = ColumnProfile.profileTables(inTableColumnsValues, inColumnSketches)
+            tasks = list()
+            # Test-sets in the order of the configuration, earlier ones keep the queries shared with later ones
+            orderedTestSets = list()
+            earlierGenerated = False
             for testSuite, testSets in inRequiredTestSuites.items():
                 for testSet, startingId in testSets.items():
-                    if testSet in TestSets.SQL_SELECT_ALL.value and onlySelectAll:
-                        return TestWriter.writeSelectAllTestSets(testSuite, testSet, inMdefDiff, startingId)
-
-                    elif testSet in TestSets.SQL_PASSDOWN.value:
-                        hadFailure = not TestWriter.writeSQLPassdownTestsets(testSuite, testSet, inMdefDiff,
-                                                                             inTableColumnsValues, startingId)
-                    elif testSuite == TestSuites.SP.value and testSet in TestSets.SQL_SP.value:
-                        hadFailure = not TestWriter.writeSPTestSets(testSuite, testSet, inExternalArgs[testSuite], startingId)
-
-                    elif testSet in TestSets.SQL_SELECT_TOP.value:
-                        hadFailure = not TestWriter.writeSQLSelectTopTestsets(testSuite, testSet,
-                                                                              inTableColumnsValues, startingId)
-                    elif testSet in TestSets.SQL_AND_OR.value:
-                        hadFailure = not TestWriter.writeSQLAndOrTestsets(testSuite, testSet,
-                                                                          inTableColumnsValues, startingId)
-                    elif testSet in TestSets.SQL_ORDER_BY.value:
-                        hadFailure = not TestWriter.writeSQLOrderByTestsets(testSuite, testSet,
-                                                                            inTableColumnsValues, startingId)
-                    elif testSet in TestSets.SQL_FUNCTION_1TABLE.value:
-                        hadFailure = not TestWriter.writeSQLFunctionTestsets(testSuite, testSet,
-                                                                             inTableColumnsValues, startingId)
-                    elif testSet in TestSets.SQL_GROUP_BY.value:
-                        hadFailure = not TestWriter.writeSQLGroupByTestsets(testSuite, testSet, inTableColumnsValues,
-                                                                            startingId)
-                    elif testSet in TestSets.SQL_IN_BETWEEN.value:
-                        hadFailure = not TestWriter.writeSQLInBetweenTestsets(testSuite, testSet, inTableColumnsValues,
-                                                                              startingId)
-                    elif testSet in TestSets.SQL_LIKE.value:
-                        hadFailure = not TestWriter.writeSQLLikeTestsets(testSuite, testSet, inTableColumnsValues,
-                                                                         startingId)
-                    elif testSet in TestSets.SQL_COLUMNS_1TABLE.value:
-                        hadFailure = not TestWriter.writeSQLColumnTableTestsets(testSuite, testSet,
-                                                                                inTableColumnsValues, startingId)
-
-                    if hadFailure:
+                    writer = TestWriter._getTestSetWriter(testSuite, testSet)
+                    if writer is None:
+                        continue
+                    elif writer == TestWriter.writeSPTestSets.__name__:
+                        arguments = (testSuite, testSet, inExternalArgs[testSuite], startingId)
+                        inputs = inExternalArgs[testSuite]
+                    elif writer == TestWriter.writeSQLPassdownTestsets.__name__:
+                        arguments = (testSuite, testSet, inMdefDiff, columnProfiles, startingId)
+                        inputs = [sampleInputs, inMdefDiff.TableNames]
+                    elif writer in m_ExpandableTestSetWriters:
+                        arguments = (testSuite, testSet, columnProfiles, startingId)
+                        inputs = [sampleInputs, inQueryBudget]
+                        if writer in m_SketchedTestSetWriters:
+                            inputs.append(TestWriter._getSketchInputs(columnProfiles))
+                    else:
+                        arguments = (testSuite, testSet, columnProfiles, startingId)
+                        inputs = sampleInputs
+                    testSetHash = TestSetManifest.getHash(startingId, [writer, inputs])
+                    orderedTestSets.append((testSuite, testSet, startingId))
+                    if inManifest is not None:
+                        # Queries dropped in favour of an earlier Test-set may be gone from its new version
+                        if inManifest.isUpToDate(testSuite, testSet, testSetHash) and \
+                                not (earlierGenerated and inManifest.getCrossDuplicates(testSuite, testSet) > 0):
+                            print(f"{testSet} for {testSuite} is up to date")
+                            continue
+                        inManifest.invalidate(testSuite, testSet)
+                    earlierGenerated = True
+                    tasks.append((testSuite, testSet, writer, arguments, testSetHash))
+
+            failedTestSets = list()
+            generatedTestSets = dict()
+            totalDuplicates = 0
+            with ProcessPoolExecutor(max_workers=max(min(len(tasks), os.cpu_count() or 1), 1),
+                                     initializer=TestWriter._initWorker,
+                                     initargs=(inShardLimits, inQueryBudget)) as executor:
+                futures = [executor.submit(TestWriter._runTestSetWriter, writer, arguments)
+                           for _, _, writer, arguments, _ in tasks]
+                for (testSuite, testSet, _, _, testSetHash), future in zip(tasks, futures):
+                    try:
+                        written, elapsedTime, digests, duplicates = future.result()
+                    except Exception as error:
+                        written, elapsedTime, digests, duplicates = False, None, b'', 0
+                        print(f"Error: {error}")
+                    if written:
+                        print(f"Generated {testSet} for {testSuite} in {elapsedTime:.2f}s, "
+                              f"dropped {duplicates} duplicate queries")
+                        generatedTestSets[(testSuite, testSet)] = digests
+                        totalDuplicates += duplicates
+                        if inManifest is not None:
+                            inManifest.update(testSuite, testSet, testSetHash)
+                    else:
                         print(f"Error: Generation of {testSet} for {testSuite} failed")
-                        break
+                        failedTestSets.append(testSet)
 
-            return not hadFailure
+            orderedTestSets = [(testSuite, testSet, startingId) for testSuite, testSet, startingId in orderedTestSets
+                               if testSet not in failedTestSets]
+            crossDuplicates = TestWriter._dropCrossDuplicates(orderedTestSets, generatedTestSets, inShardLimits)
+            for (testSuite, testSet), duplicates in crossDuplicates.items():
+                print(f"{testSet} for {testSuite}: dropped {duplicates} queries already in earlier test-sets")
+                totalDuplicates += duplicates
+                if inManifest is not None:
+                    inManifest.setCrossDuplicates(testSuite, testSet, duplicates)
+            if len(generatedTestSets) > 0:
+                print(f"Saved {totalDuplicates} executions of duplicate queries")
+            if inManifest is not None:
+                inManifest.save()
+            return len(failedTestSets) == 0
         else:
             print('Error: No Test-Suites selected to prepare')
             return False
 
+    @staticmethod
+    def _getSampleInputs(inMdefDiff: MDEF, inTableColumnsValues: dict):
+        """
+        Collects the inputs shared by the Test-sets generated from the column values of the tables \n
+        :param inMdefDiff: MDEF Instance
+        :param inTableColumnsValues: Table Column Values Mapping
+        :return: Returns the fingerprint & the column values of every table. Values are sorted, as their order differs
+        from run to run
+        """
+        return {tableName: [TestWriter._toHex(inMdefDiff.getTableFingerprint(tableName)),
+                            {columnName: sorted(map(repr, columnValues))
+                             for columnName, columnValues in columns.items()}]
+                for tableName, columns in inTableColumnsValues.items()}
+
+    @staticmethod
+    def _getSketchInputs(inColumnProfiles: dict):
+        """Collects the predicates chosen from the sketches of the columns, the ones sketched only"""
+        sketchInputs = dict()
+        for tableName, columns in inColumnProfiles.items():
+            for columnName, profile in columns.items():
+                predicate = profile.getSelectivePredicate()
+                if predicate is not None:
+                    sketchInputs.setdefault(tableName, dict())[columnName] = [repr(predicate[0]), predicate[1]]
+        return sketchInputs
+
+    @staticmethod
+    def usesColumnSketches(inRequiredTestSuites: dict, inQueryBudget: tuple = (0, 0)):
+        """Checks whether any of the required Test-sets chooses its predicates from the sketches of the columns"""
+        return inQueryBudget == (0, 0) and any(
+            TestWriter._getTestSetWriter(testSuite, testSet) in m_SketchedTestSetWriters
+            for testSuite, testSets in inRequiredTestSuites.items() for testSet in testSets)
+
+    @staticmethod
+    def _toHex(inFingerprint: bytes):
+        return inFingerprint.hex() if inFingerprint is not None else None
+
+    @staticmethod
+    def _getTestSetWriter(inTestSuite: str, inTestSet: str):
+        """
+        Looks up the writer of given Test-set \n
+        :param inTestSuite: Name of the Test Suite
+        :param inTestSet: Name of the Test Set
+        :return: Returns name of the `TestWriter` method generating the Test-set, None if there is none
+        """
+        if inTestSet in TestSets.SQL_SP.value and inTestSuite != TestSuites.SP.value:
+            return None
+        for testSetType, writer in m_TestSetWriters.items():
+            if inTestSet in testSetType.value:
+                return writer
+        return None
+
+    @staticmethod
+    def _initWorker(inShardLimits: tuple, inQueryBudget: tuple = (0, 0)):
+        global m_ShardLimits, m_QueryBudget
+        m_ShardLimits = inShardLimits
+        m_QueryBudget = inQueryBudget
+        random.seed()
+
+    @staticmethod
+    def _runTestSetWriter(inWriter: str, inArguments: tuple):
+        """
+        Runs given `TestWriter` method within a worker process \n
+        :param inWriter: Name of the `TestWriter` method
+        :param inArguments: Arguments of the method
+        :return: Returns the result of the method along with the time it took in seconds
+        """
+        startTime = time.perf_counter()
+        written = getattr(TestWriter, inWriter)(*inArguments)
+        elapsedTime = time.perf_counter() - startTime
+        # Every writer takes the Test Suite & the Test Set first
+        digests, duplicates = m_WrittenQueries.pop((inArguments[0], inArguments[1]), (b'', 0))
+        return written, elapsedTime, digests, duplicates
+
+    @staticmethod
+    def _dropCrossDuplicates(inTestSets: list, inGeneratedTestSets: dict, inShardLimits: tuple = (0, 0)):
+        """
+        Drops the queries of every generated Test-set which an earlier Test-set, in the order of the configuration,
+        already has. Affected Test-sets are rewritten without them, queries of the Test-sets which were up to date are
+        read back from their files \n
+        :param inTestSets: List of (Test Suite, Test Set, Starting Id) in the order of the configuration
+        :param inGeneratedTestSets: Dictionary having (Test Suite, Test Set) of the generated Test-sets as key and the
+        digests of their queries as value
+        :param inShardLimits: Maximum number of tests & bytes per Test-set file
+        :return: Returns a Dictionary having (Test Suite, Test Set) as key and the number of dropped queries as value
+        """
+        lastGenerated = max((index for index, (testSuite, testSet, _) in enumerate(inTestSets)
+                             if (testSuite, testSet) in inGeneratedTestSets), default=-1)
+        queryIndex = QueryIndex()
+        crossDuplicates = dict()
+        for testSuite, testSet, startingId in inTestSets[:lastGenerated + 1]:
+            if (testSuite, testSet) not in inGeneratedTestSets:
+                for query in TestWriter.iterTestSetQueries(testSuite, testSet):
+                    queryIndex.add(query)
+                continue
+            # Digests are unique within the Test-set, so a known one comes from an earlier Test-set
+            kept = [queryIndex.addDigest(digest) for digest in splitDigests(inGeneratedTestSets[(testSuite, testSet)])]
+            if not all(kept):
+                queries = [query for query, keep in zip(TestWriter.iterTestSetQueries(testSuite, testSet), kept)
+                           if keep]
+                if TestWriter._prepareTestSet(testSuite, testSet, queries, startingId, False, inShardLimits):
+                    crossDuplicates[(testSuite, testSet)] = kept.count(False)
+        return crossDuplicates
+
+    @staticmethod
+    def iterTestSetQueries(inTestSuite: str, inTestSet: str):
+        """
+        Reads back the queries of a Test-set written before, across all its shards \n
+        :param inTestSuite: Name of the Test Suite
+        :param inTestSet: Name of the Test Set
+        :return: Returns a generator of the queries in the order of their Ids
+        """
+        testSetPath = os.path.join(m_OutputFolder, inTestSuite, m_TestSets)
+        for shardName in TestWriter.getTestSetShards(inTestSuite, inTestSet):
+            shardPath = os.path.join(testSetPath, shardName + m_TestFilesExtension)
+            if not os.path.exists(shardPath):
+                return
+            for _, element in Etree.iterparse(shardPath):
+                if element.tag == 'SQL':
+                    yield element.text or ''
+                elif element.tag == 'Test':
+                    element.clear()
+
     @staticmethod
     def writeSPTestSets(inTestSuite: str, inTestSet: str, inExternalArguments: dict, inStartingID: int = 1):
         """
@@ -349,10 +1136,13 @@ class TestWriter:
             print('Error: Invalid Parameters')
             return False
         else:
-            queries = list()
-            for name, arg in inExternalArguments.items():
-                queries.append('{call ' + name + '(' + arg + ')}')
-            return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
+            return TestWriter._prepareTestSet(inTestSuite, inTestSet, TestWriter._iterSPQueries(inExternalArguments),
+                                              inStartingID)
+
+    @staticmethod
+    def _iterSPQueries(inExternalArguments: dict):
+        for name, arg in inExternalArguments.items():
+            yield '{call ' + name + '(' + arg + ')}'
 
     @staticmethod
     def writeSelectAllTestSets(inTestSuite: str, inTestSet: str, inMdefDiff: MDEF, inStartingID: int = 1):
@@ -368,383 +1158,702 @@ class TestWriter:
             print('Error: Invalid Parameters')
             return False
         else:
-            queries = list()
-            for table in inMdefDiff.Tables:
-                queries.append(f"SELECT * FROM {table[MDEF.m_Name]}")
-            return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
+            # Result-sets are mapped back to the tables by Id, so none of the queries may be dropped
+            return TestWriter._prepareTestSet(inTestSuite, inTestSet, TestWriter._iterSelectAllQueries(inMdefDiff),
+                                              inStartingID, False)
+
+    @staticmethod
+    def _iterSelectAllQueries(inMdefDiff: MDEF):
+        for table in inMdefDiff.Tables:
+            yield f"SELECT * FROM {table.Name}"
 
     @staticmethod
-    def writeSQLPassdownTestsets(inTestSuite: str, inTestSet: str, inMdefDiff: MDEF, inTableColumnsValues: dict,
+    def writeSQLPassdownTestsets(inTestSuite: str, inTestSet: str, inMdefDiff: MDEF, inColumnProfiles: dict,
                                  inStartingID: int = 1):
         """
         Prepares Test Set for `SQL_PASSDOWN` \n
         :param inTestSet: Name of test case.
-        :param inTableColumnsValues: Key Value Pair Containing Table Name & Column Value Map
+        :param inColumnProfiles: Key Value Pair Containing Table Name & Column Profiles Map
         :param inStartingID: Starting Id of the test-set to write testcases further
         :param inTestSuite: Name of associated Testsuite
         :param inMdefDiff: Difference of MDEFs as MDEF Instance
         :return: Returns True if all `SQL_PASSDOWN` generated successfully else False
         """
-        if len(inTestSuite) == 0 or inMdefDiff is None or inTableColumnsValues is None:
+        if len(inTestSuite) == 0 or inMdefDiff is None or inColumnProfiles is None:
             print('Error: Invalid Parameters')
             return False
         else:
-            queries = list()
-            for tableName, passdownableColumns in inMdefDiff.TableNames.items():
-                if passdownableColumns is None or tableName not in inTableColumnsValues:
-                    continue
-                for columnName in passdownableColumns:
-                    for columnValue in inTableColumnsValues[tableName][columnName]:
-                        queries.append(f"SELECT * FROM {tableName} WHERE {columnName} = {columnValue}")
-                        break
-            return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
+            return TestWriter._prepareTestSet(inTestSuite, inTestSet,
+                                              TestWriter._iterSQLPassdownQueries(inMdefDiff, inColumnProfiles),
+                                              inStartingID)
+
+    @staticmethod
+    def _iterSQLPassdownQueries(inMdefDiff: MDEF, inColumnProfiles: dict):
+        for tableName, passdownableColumns in inMdefDiff.TableNames.items():
+            if passdownableColumns is None or tableName not in inColumnProfiles:
+                continue
+            for columnName in passdownableColumns:
+                for columnValue in inColumnProfiles[tableName][columnName].Values:
+                    yield f"SELECT * FROM {tableName} WHERE {columnName} = {columnValue}"
+                    break
 
     @staticmethod
-    def writeSQLSelectTopTestsets(inTestSuite: str, inTestSet: str, inTableColumnsValues: dict, inStartingID: int = 1):
+    def writeSQLSelectTopTestsets(inTestSuite: str, inTestSet: str, inColumnProfiles: dict, inStartingID: int = 1):
         """
         Prepares Test Set for `SQL_SELECT_TOP` \n
         :param inTestSet: Name of test case.
-        :param inTableColumnsValues: Key Value Pair Containing Table Name & Column Value Map
+        :param inColumnProfiles: Key Value Pair Containing Table Name & Column Profiles Map
         :param inStartingID: Starting Id of the test-set to write testcases further
         :param inTestSuite: Name of associated Testsuite
         :return: Returns True if all `SQL_SELECT_TOP` generated successfully else False
         """
-        if len(inTestSuite) > 0 and inTableColumnsValues is not None:
-            queries = list()
-            for table_name, columns in inTableColumnsValues.items():
-                rowCount = max(list(map(len, columns.values())))
-                if rowCount > 0:
-                    for columnName in columns:
-                        if random.randint(0, 50) % 2 == 0:
-                            queries.append(f"SELECT TOP {rowCount % 25} * FROM {table_name} ORDER BY {columnName}")
-                        else:
-                            queries.append(
-                                f"SELECT TOP {rowCount % 25} {columnName} FROM {table_name} ORDER BY {columnName}")
-                        break
-                else:
-                    print(f"Error: Columns for {table_name} could not be parsed correctly from the ResultSets")
-                    return False
-            return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
+        if len(inTestSuite) > 0 and inColumnProfiles is not None:
+            return TestWriter._prepareTestSet(inTestSuite, inTestSet,
+                                              TestWriter._iterSQLSelectTopQueries(inColumnProfiles), inStartingID)
         else:
             print('Error: Invalid Parameters')
             return False
 
     @staticmethod
-    def writeSQLAndOrTestsets(inTestSuite: str, inTestSet: str, inTableColumnsValues: dict, inStartingID: int = 1):
+    def _iterSQLSelectTopQueries(inColumnProfiles: dict):
+        for table_name, columns in inColumnProfiles.items():
+            rowCount = max([len(profile.Values) for profile in columns.values()], default=0)
+            if rowCount > 0:
+                for columnName in columns:
+                    if random.randint(0, 50) % 2 == 0:
+                        yield f"SELECT TOP {rowCount % 25} * FROM {table_name} ORDER BY {columnName}"
+                    else:
+                        yield f"SELECT TOP {rowCount % 25} {columnName} FROM {table_name} ORDER BY {columnName}"
+                    break
+            else:
+                raise ValueError(f"Columns for {table_name} could not be parsed correctly from the ResultSets")
+
+    @staticmethod
+    def writeSQLAndOrTestsets(inTestSuite: str, inTestSet: str, inColumnProfiles: dict, inStartingID: int = 1):
         """
         Prepares Test Set for `SQL_AND_OR` \n
         :param inTestSet: Name of test case.
-        :param inTableColumnsValues: Key Value Pair Containing Table Name & Column Value Map
+        :param inColumnProfiles: Key Value Pair Containing Table Name & Column Profiles Map
         :param inStartingID: Starting Id of the test-set to write testcases further
         :param inTestSuite: Name of associated Testsuite
         :return: Returns True if all `SQL_AND_OR` generated successfully else False
         """
-        if len(inTestSuite) > 0 and inTableColumnsValues is not None:
-            queries = list()
-            index = 0
-            for tableName, columns in inTableColumnsValues.items():
-                queryCompleted = True
-                if len(columns) > 0:
-                    query = f"SELECT * FROM {tableName} WHERE "
-                    for columnName, columnValues in columns.items():
-                        if len(columnValues) >= 2:
-                            query += f"{columnName}={columnValues[0]} "
-                            queryCompleted = not queryCompleted
-                            if queryCompleted:
-                                queries.append(query)
-                                break
-                            else:
-                                if index % 2 == 0:
-                                    query += 'AND '
-                                else:
-                                    query += 'OR '
-                    index += 1
+        if len(inTestSuite) > 0 and inColumnProfiles is not None:
+            if m_QueryBudget == (0, 0):
+                queries = TestWriter._iterSQLAndOrQueries(inColumnProfiles)
+            else:
+                queries = QueryExpansion.iterExpandedQueries(QueryExpansion.getAndOrSpace, inColumnProfiles,
+                                                             m_QueryBudget)
             return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
         else:
             print('Error: Invalid Parameters')
             return False
 
     @staticmethod
-    def writeSQLOrderByTestsets(inTestSuite: str, inTestSet: str, inTableColumnsValues: dict, inStartingID: int = 1):
+    def _iterSQLAndOrQueries(inColumnProfiles: dict):
+        index = 0
+        for tableName, columns in inColumnProfiles.items():
+            queryCompleted = True
+            if len(columns) > 0:
+                query = f"SELECT * FROM {tableName} WHERE "
+                for columnName, value in TestWriter._getAndOrPredicates(columns):
+                    query += f"{columnName}={value} "
+                    queryCompleted = not queryCompleted
+                    if queryCompleted:
+                        yield query
+                        break
+                    else:
+                        if index % 2 == 0:
+                            query += 'AND '
+                        else:
+                            query += 'OR '
+                index += 1
+
+    @staticmethod
+    def _getAndOrPredicates(inColumns: dict):
+        """
+        Lists the (Column Name, Value) pairs to compare the columns having at least 2 sampled values against. Sketched
+        columns come first, the most selective ones ahead, compared against a value of their sketch. The others are
+        compared against their first sampled value
+        """
+        sketchedPredicates, predicates = list(), list()
+        for columnName, profile in inColumns.items():
+            if len(profile.Values) >= 2:
+                predicate = profile.getSelectivePredicate()
+                if predicate is None:
+                    predicates.append((columnName, profile.Values[0]))
+                else:
+                    sketchedPredicates.append((predicate[1], columnName, predicate[0]))
+        sketchedPredicates.sort(key=lambda sketchedPredicate: sketchedPredicate[0])
+        return [(columnName, value) for _, columnName, value in sketchedPredicates] + predicates
+
+    @staticmethod
+    def writeSQLOrderByTestsets(inTestSuite: str, inTestSet: str, inColumnProfiles: dict, inStartingID: int = 1):
         """
         Prepares Test Set for `SQL_ORDER_BY` \n
         :param inTestSet: Name of test case.
-        :param inTableColumnsValues: Key Value Pair Containing Table Name & Column Value Map
+        :param inColumnProfiles: Key Value Pair Containing Table Name & Column Profiles Map
         :param inStartingID: Starting Id of the test-set to write testcases further
         :param inTestSuite: Name of associated Testsuite
         :return: Returns True if all `SQL_ORDER_BY` generated successfully else False
         """
-        if len(inTestSuite) > 0 and inTableColumnsValues is not None:
-            queries = list()
-            for tableName, columns in inTableColumnsValues.items():
-                columnsLen = len(columns)
-                requiredColIndex = random.randrange(0, (columnsLen % 10) - 1) if columnsLen % 10 > 1 else 0
-                index = 0
-                if columnsLen > 0:
-                    for columnName in columns:
-                        if requiredColIndex == index:
-                            if random.randint(0, 5) % 2 == 0:
-                                queries.append(f"SELECT * FROM {tableName} ORDER BY {columnName}")
-                            else:
-                                queries.append(f"SELECT {columnName} FROM {tableName} ORDER BY {columnName}")
-                        index += 1
+        if len(inTestSuite) > 0 and inColumnProfiles is not None:
+            if m_QueryBudget == (0, 0):
+                queries = TestWriter._iterSQLOrderByQueries(inColumnProfiles)
+            else:
+                queries = QueryExpansion.iterExpandedQueries(QueryExpansion.getOrderBySpace, inColumnProfiles,
+                                                             m_QueryBudget)
             return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
         else:
             print('Error: Invalid Parameters')
             return False
 
     @staticmethod
-    def writeSQLColumnTableTestsets(inTestSuite: str, inTestSet: str, inTableColumnsValues: dict, inStartingID: int = 1):
+    def _iterSQLOrderByQueries(inColumnProfiles: dict):
+        for tableName, columns in inColumnProfiles.items():
+            columnsLen = len(columns)
+            requiredColIndex = random.randrange(0, (columnsLen % 10) - 1) if columnsLen % 10 > 1 else 0
+            index = 0
+            if columnsLen > 0:
+                for columnName in columns:
+                    if requiredColIndex == index:
+                        if random.randint(0, 5) % 2 == 0:
+                            yield f"SELECT * FROM {tableName} ORDER BY {columnName}"
+                        else:
+                            yield f"SELECT {columnName} FROM {tableName} ORDER BY {columnName}"
+                    index += 1
+
+    @staticmethod
+    def writeSQLColumnTableTestsets(inTestSuite: str, inTestSet: str, inColumnProfiles: dict, inStartingID: int = 1):
         """
         Prepares Test Set for `SQL_COLUMNS_1TABLE` \n
         :param inTestSet: Name of test case.
-        :param inTableColumnsValues: Key Value Pair Containing Table Name & Column Value Map
+        :param inColumnProfiles: Key Value Pair Containing Table Name & Column Profiles Map
         :param inStartingID: Starting Id of the test-set to write testcases further
         :param inTestSuite: Name of associated Testsuite
         :return: Returns True if all 'SQL_COLUMNS_1TABLE' generated successfully else False
         """
-        if len(inTestSuite) > 0 and inTableColumnsValues is not None:
-            queries = list()
-            for tableName, columns in inTableColumnsValues.items():
-                columnsLen = len(columns)
-                requiredColIndex = random.randrange(0, (columnsLen % 10) - 1) if columnsLen % 10 > 1 else 0
-                index = 0
-                firstColumn = None
-                if columnsLen > 0:
-                    for columnName in columns:
-                        if index == 0:
-                            firstColumn = columnName
-                        if requiredColIndex == index:
-                            queries.append(f"SELECT {columnName} FROM {tableName} ORDER BY {firstColumn}")
-                        index += 1
-            return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
+        if len(inTestSuite) > 0 and inColumnProfiles is not None:
+            return TestWriter._prepareTestSet(inTestSuite, inTestSet,
+                                              TestWriter._iterSQLColumnTableQueries(inColumnProfiles),
+                                              inStartingID)
         else:
             print('Error: Invalid Parameters')
             return False
 
     @staticmethod
-    def writeSQLGroupByTestsets(inTestSuite: str, inTestSet: str, inTableColumnsValues: dict, inStartingID: int = 1):
+    def _iterSQLColumnTableQueries(inColumnProfiles: dict):
+        for tableName, columns in inColumnProfiles.items():
+            columnsLen = len(columns)
+            requiredColIndex = random.randrange(0, (columnsLen % 10) - 1) if columnsLen % 10 > 1 else 0
+            index = 0
+            firstColumn = None
+            if columnsLen > 0:
+                for columnName in columns:
+                    if index == 0:
+                        firstColumn = columnName
+                    if requiredColIndex == index:
+                        yield f"SELECT {columnName} FROM {tableName} ORDER BY {firstColumn}"
+                    index += 1
+
+    @staticmethod
+    def writeSQLGroupByTestsets(inTestSuite: str, inTestSet: str, inColumnProfiles: dict, inStartingID: int = 1):
         """
         Prepares Test Set for `SQL_GROUP_BY` \n
         :param inTestSet: Name of test case.
-        :param inTableColumnsValues: Key Value Pair Containing Table Name & Column Value Map
+        :param inColumnProfiles: Key Value Pair Containing Table Name & Column Profiles Map
         :param inStartingID: Starting Id of the test-set to write testcases further
         :param inTestSuite: Name of associated Testsuite
         :return: Returns True if all `SQL_GROUP_BY` generated successfully else False
         """
-        if len(inTestSuite) > 0 and inTableColumnsValues is not None:
-            queries = list()
-            for tableName, columns in inTableColumnsValues.items():
-                if len(columns) > 0:
-                    for columnName in columns:
-                        if len(columns[columnName]) > 0:
-                            queries.append(f"SELECT {columnName} FROM {tableName} GROUP BY {columnName} "
-                                           f"HAVING {columnName} = {columns[columnName][0]}")
-                            break
-                    else:
-                        queries.append(f"SELECT {columnName} FROM {tableName} GROUP BY {columnName} "
-                                       f"ORDER BY {columnName}")
-            return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
+        if len(inTestSuite) > 0 and inColumnProfiles is not None:
+            return TestWriter._prepareTestSet(inTestSuite, inTestSet,
+                                              TestWriter._iterSQLGroupByQueries(inColumnProfiles), inStartingID)
         else:
             print('Error: Invalid Parameters')
             return False
 
     @staticmethod
-    def writeSQLInBetweenTestsets(inTestSuite: str, inTestSet: str, inTableColumnsValues: dict, inStartingID: int = 1):
+    def _iterSQLGroupByQueries(inColumnProfiles: dict):
+        for tableName, columns in inColumnProfiles.items():
+            if len(columns) > 0:
+                for columnName, profile in columns.items():
+                    if len(profile.Values) > 0:
+                        yield f"SELECT {columnName} FROM {tableName} GROUP BY {columnName} " \
+                              f"HAVING {columnName} = {profile.Values[0]}"
+                        break
+                else:
+                    yield f"SELECT {columnName} FROM {tableName} GROUP BY {columnName} ORDER BY {columnName}"
+
+    @staticmethod
+    def writeSQLInBetweenTestsets(inTestSuite: str, inTestSet: str, inColumnProfiles: dict, inStartingID: int = 1):
         """
         Prepares Test Set for `SQL_IN_BETWEEN` \n
         :param inTestSet: Name of test case.
-        :param inTableColumnsValues: Key Value Pair Containing Table Name & Column Value Map
+        :param inColumnProfiles: Key Value Pair Containing Table Name & Column Profiles Map
         :param inStartingID: Starting Id of the test-set to write testcases further
         :param inTestSuite: Name of associated Testsuite
         :return: Returns True if all `SQL_IN_BETWEEN` generated successfully else False
         """
-        if len(inTestSuite) > 0 and inTableColumnsValues is not None:
-            queries = list()
-            for tableName, columns in inTableColumnsValues.items():
-                for columnName in columns:
-                    totalColumnValues = len(columns[columnName])
-                    if totalColumnValues > 2 and any(
-                            map(lambda columnValue: isinstance(columnValue, str), columns[columnName])):
-                        if totalColumnValues % 2 == 0:
-                            queries.append(f"SELECT * FROM {tableName} WHERE {columnName} IN "
-                                           f"({', '.join(random.sample(columns[columnName], 2))})")
-                        else:
-                            queries.append(f"SELECT {columnName} FROM {tableName} WHERE {columnName} IN "
-                                           f"({', '.join(random.sample(columns[columnName], 2))})")
-                        break
+        if len(inTestSuite) > 0 and inColumnProfiles is not None:
+            if m_QueryBudget == (0, 0):
+                queries = TestWriter._iterSQLInBetweenQueries(inColumnProfiles)
+            else:
+                queries = QueryExpansion.iterExpandedQueries(QueryExpansion.getInBetweenSpace, inColumnProfiles,
+                                                             m_QueryBudget)
             return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
         else:
             print('Error: Invalid Parameters')
             return False
 
     @staticmethod
-    def writeSQLLikeTestsets(inTestSuite: str, inTestSet: str, inTableColumnsValues: dict, inStartingID: int = 1):
+    def _iterSQLInBetweenQueries(inColumnProfiles: dict):
+        for tableName, columns in inColumnProfiles.items():
+            for columnName, profile in columns.items():
+                totalColumnValues = len(profile.Values)
+                if totalColumnValues > 2 and profile.HasString:
+                    if totalColumnValues % 2 == 0:
+                        yield f"SELECT * FROM {tableName} WHERE {columnName} IN " \
+                              f"({', '.join(profile.sample(2))})"
+                    else:
+                        yield f"SELECT {columnName} FROM {tableName} WHERE {columnName} IN " \
+                              f"({', '.join(profile.sample(2))})"
+                    break
+
+    @staticmethod
+    def writeSQLLikeTestsets(inTestSuite: str, inTestSet: str, inColumnProfiles: dict, inStartingID: int = 1):
         """
         Prepares Test Set for `SQL_LIKE` \n
         :param inTestSet: Name of test case.
-        :param inTableColumnsValues: Key Value Pair Containing Table Name & Column Value Map
+        :param inColumnProfiles: Key Value Pair Containing Table Name & Column Profiles Map
         :param inStartingID: Starting Id of the test-set to write testcases further
         :param inTestSuite: Name of associated Testsuite
         :return: Returns True if all `SQL_LIKE` generated successfully else False
         """
-        if len(inTestSuite) > 0 and inTableColumnsValues is not None:
-            queries = list()
-            queryWritten = False
-            for tableName, columns in inTableColumnsValues.items():
-                for columnName, columnValues in columns.items():
-                    for columnVal in columnValues:
-                        if isinstance(columnVal, str) and len(columnVal) > 2:
-                            queries.append(f"SELECT {columnName} FROM {tableName} WHERE {columnName} LIKE "
-                                           f"'%{columnVal[random.randint(1, len(columnVal) - 2)]}{random.choice(['_', '%', ''])}'")
-                            queryWritten = True
-                        elif isinstance(columnVal, (int, float)):
-                            columnValStr = str(columnVal)
-                            if len(columnValStr) > 2:
-                                queries.append(f"SELECT {columnName} FROM {tableName} WHERE {columnName} LIKE "
-                                               f"'%{columnValStr[random.randint(1, len(columnValStr) - 2)]}{random.choice(['_', '%', ''])}'")
-                            queryWritten = True
-                        break
-                    if queryWritten:
-                        break
-            return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
+        if len(inTestSuite) > 0 and inColumnProfiles is not None:
+            return TestWriter._prepareTestSet(inTestSuite, inTestSet,
+                                              TestWriter._iterSQLLikeQueries(inColumnProfiles), inStartingID)
         else:
             print('Error: Invalid Parameters')
             return False
 
     @staticmethod
-    def writeSQLFunctionTestsets(inTestSuite: str, inTestSet: str, inTableColumnsValues: dict, inStartingID: int = 1):
+    def _iterSQLLikeQueries(inColumnProfiles: dict):
+        queryWritten = False
+        for tableName, columns in inColumnProfiles.items():
+            for columnName, profile in columns.items():
+                for columnVal in profile.Values:
+                    if isinstance(columnVal, str) and len(columnVal) > 2:
+                        yield f"SELECT {columnName} FROM {tableName} WHERE {columnName} LIKE " \
+                              f"'%{columnVal[random.randint(1, len(columnVal) - 2)]}{random.choice(['_', '%', ''])}'"
+                        queryWritten = True
+                    elif isinstance(columnVal, (int, float)):
+                        columnValStr = str(columnVal)
+                        if len(columnValStr) > 2:
+                            yield f"SELECT {columnName} FROM {tableName} WHERE {columnName} LIKE " \
+                                  f"'%{columnValStr[random.randint(1, len(columnValStr) - 2)]}" \
+                                  f"{random.choice(['_', '%', ''])}'"
+                        queryWritten = True
+                    break
+                if queryWritten:
+                    break
+
+    @staticmethod
+    def writeSQLFunctionTestsets(inTestSuite: str, inTestSet: str, inColumnProfiles: dict, inStartingID: int = 1):
         """
         Prepares Test Set for `SQL_Function_Table` \n
         :param inTestSet: Name of test case.
-        :param inTableColumnsValues: Key Value Pair Containing Table Name & Column Value Map
+        :param inColumnProfiles: Key Value Pair Containing Table Name & Column Profiles Map
         :param inStartingID: Starting Id of the test-set to write testcases further
         :param inTestSuite: Name of associated Testsuite
         :return: Returns True if all `SQL_Function_Table` generated successfully else False
         """
-        if len(inTestSuite) > 0 and inTableColumnsValues is not None:
-            queries = list()
-            aggregateFunctions = ['MAX', 'MIN', 'COUNT', 'SUM', 'AVG']
-            datetimeRegex = '\'([0-9]+)-([0-9]+)-([0-9]+) ([0-9]+):([0-9]+):([0-9]+).([0-9]+)\''
-            for tableName, columns in inTableColumnsValues.items():
-                query_written = False
-                for columnName, columnValues in columns.items():
-                    if any(map(lambda inToken: inToken in columnName.lower(), ['id', 'index'])) or len(columnValues) == 0:
-                        pass
-                    elif all(map(lambda inVal: isinstance(inVal, (int, float)) and (not isinstance(inVal, (bool, str))),
-                                 columnValues)):
-                        currOp = random.choice(aggregateFunctions)
-                        queries.append(f"SELECT {currOp}({columnName}) AS {currOp}_OF_{columnName.upper()}"
-                                       f" FROM {tableName}")
-                        break
-                    elif not query_written and all(map(lambda inVal: isinstance(inVal, str) and
-                                                   re.match(datetimeRegex, inVal) is None, columnValues)):
-                        currOp = random.choice(['UCASE', 'LCASE', 'COUNT'])
-                        queries.append(f"SELECT {currOp}({columnName}) FROM {tableName}")
-                        query_written = True
-            return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
+        if len(inTestSuite) > 0 and inColumnProfiles is not None:
+            return TestWriter._prepareTestSet(inTestSuite, inTestSet,
+                                              TestWriter._iterSQLFunctionQueries(inColumnProfiles), inStartingID)
         else:
             print('Error: Invalid Parameters')
             return False
 
     @staticmethod
-    def _prepareTestSet(inTestSuite: str, inTestSet: str, inQueries: list, inStartingID: int = 1):
+    def _iterSQLFunctionQueries(inColumnProfiles: dict):
+        aggregateFunctions = ['MAX', 'MIN', 'COUNT', 'SUM', 'AVG']
+        for tableName, columns in inColumnProfiles.items():
+            query_written = False
+            for columnName, profile in columns.items():
+                if profile.IsIdentifier or profile.TypeClass == ColumnProfile.m_Empty:
+                    pass
+                elif profile.IsNumeric:
+                    currOp = random.choice(aggregateFunctions)
+                    yield f"SELECT {currOp}({columnName}) AS {currOp}_OF_{columnName.upper()} FROM {tableName}"
+                    break
+                elif not query_written and profile.IsString and not profile.HasDatetime:
+                    currOp = random.choice(['UCASE', 'LCASE', 'COUNT'])
+                    yield f"SELECT {currOp}({columnName}) FROM {tableName}"
+                    query_written = True
+
+    @staticmethod
+    def _prepareTestSet(inTestSuite: str, inTestSet: str, inQueries, inStartingID: int = 1,
+                        inDeduplicate: bool = True, inShardLimits: tuple = None):
         """
-        Prepares a new Test-set file for given queries \n
+        Prepares a new Test-set file for given queries. Queries are written as they are produced, in batches of
+        `XMLEmitter.m_WriteBatchSize` tests, so the whole test-set is never held in memory. \n
         :param inTestSuite: Name of the Test Suite
         :param inTestSet: Name of the Test Set
-        :param inQueries: List of queries
+        :param inQueries: Iterable of queries, e.g. a generator producing them lazily
         :param inStartingID: Starting Id for the testcases
+        :param inDeduplicate: Drops the queries equivalent to an earlier one of the Test-set, keeping the digests of
+        the rest in `m_WrittenQueries`
+        :param inShardLimits: Maximum number of tests & bytes per Test-set file, `m_ShardLimits` by default
         :return: Returns True if Test-set written successfully else False
         """
         if inTestSuite is not None and len(inTestSuite) > 0 and inTestSet is not None and len(inTestSet) > 0:
             testSetPath = os.path.abspath(os.path.join(os.path.join(m_OutputFolder, inTestSuite), m_TestSets))
             if os.path.exists(testSetPath):
-                with open(os.path.join(testSetPath, inTestSet + m_TestFilesExtension), 'w') as file:
-                    file.write(f"<TestSet Name=\"{inTestSet}\" JavaClass=\"com.simba.testframework.testcases"
-                               f".jdbc.resultvalidation.SqlTester\" dotNetClass=\"SqlTester\">\n")
-                    for query in inQueries:
-                        file.write(f"\t<Test Name=\"SQL_QUERY\" JavaMethod=\"testSqlQuery\" "
-                                   f"dotNetMethod=\"TestSqlQuery\" ID=\"{inStartingID}\">\n")
-                        file.write(f"\t\t<SQL><![CDATA[{query}]]></SQL>\n")
-                        file.write('\t\t<ValidateColumns>True</ValidateColumns>\n')
-                        file.write('\t\t<ValidateNumericExactly>True</ValidateNumericExactly>\n')
-                        file.write('\t</Test>\n')
-                        inStartingID += 1
-                    file.write('</TestSet>')
+                maxTests, maxBytes = m_ShardLimits if inShardLimits is None else inShardLimits
+                queryIndex, digests = QueryIndex(), bytearray()
+                if inDeduplicate:
+                    inQueries = queryIndex.filter(inQueries, digests)
+                filePath = os.path.join(testSetPath, inTestSet + m_TestFilesExtension)
+                # The single file is written aside and replaces the Test-set once complete
+                tempPath = f"{filePath}.{os.getpid()}{m_TempFileSuffix}"
+                try:
+                    if maxTests > 0 or maxBytes > 0:
+                        shardCount = XMLEmitter.writeTestSetShards(
+                            lambda inShard: TestWriter._openShard(testSetPath, inTestSet, inShard), inQueries,
+                            inStartingID, maxTests, maxBytes)
+                    else:
+                        with open(tempPath, 'wb', buffering=m_WriteBufferSize) as file:
+                            XMLEmitter.writeTestSet(file, inTestSet, inQueries, inStartingID)
+                        os.replace(tempPath, filePath)
+                        shardCount = 1
+                except Exception as e:
+                    # A partly written Test-set must not be taken as generated
+                    print(f"Error: Test-set {inTestSet} of {inTestSuite} could not be written, {e}")
+                    if os.path.exists(tempPath):
+                        os.remove(tempPath)
+                    TestWriter._removeShards(testSetPath, inTestSet)
+                    return False
+                # Shards left over from a previous run which needed more of them
+                TestWriter._removeShards(testSetPath, inTestSet, shardCount + 1)
+                if inDeduplicate:
+                    m_WrittenQueries[(inTestSuite, inTestSet)] = (bytes(digests), queryIndex.duplicates)
                 return True
             else:
                 print(f"Error: Path {testSetPath} doesn't exist")
                 return False
 
+    @staticmethod
+    def getShardName(inTestSet: str, inShard: int):
+        """Returns the name of the shard of a Test-set, the first shard keeps the name of the Test-set itself"""
+        return inTestSet if inShard == 1 else f"{inTestSet}_{inShard}"
+
+    @staticmethod
+    def hasTestSetFile(inTestSuite: str, inTestSet: str):
+        """Checks whether the Test-set was written to a file"""
+        return os.path.exists(os.path.join(m_OutputFolder, inTestSuite, m_TestSets, inTestSet + m_TestFilesExtension))
+
+    @staticmethod
+    def getTestSetShards(inTestSuite: str, inTestSet: str):
+        """
+        Finds the shards the Test-set was written to \n
+        :param inTestSuite: Name of the Test Suite
+        :param inTestSet: Name of the Test Set
+        :return: Returns the names of the shards, just the Test-set itself if it was not split
+        """
+        testSetPath = os.path.join(m_OutputFolder, inTestSuite, m_TestSets)
+        shards = [inTestSet]
+        while os.path.exists(os.path.join(testSetPath, TestWriter.getShardName(inTestSet, len(shards) + 1) +
+                                                       m_TestFilesExtension)):
+            shards.append(TestWriter.getShardName(inTestSet, len(shards) + 1))
+        return shards
+
+    @staticmethod
+    def _openShard(inTestSetPath: str, inTestSet: str, inShard: int):
+        shardName = TestWriter.getShardName(inTestSet, inShard)
+        return open(os.path.join(inTestSetPath, shardName + m_TestFilesExtension), 'wb',
+                    buffering=m_WriteBufferSize), shardName
+
+    @staticmethod
+    def _removeShards(inTestSetPath: str, inTestSet: str, inFirstShard: int = 1):
+        """Removes the shards of the Test-set starting from the given one"""
+        shardPath = os.path.join(inTestSetPath, TestWriter.getShardName(inTestSet, inFirstShard) + m_TestFilesExtension)
+        while os.path.exists(shardPath):
+            os.remove(shardPath)
+            inFirstShard += 1
+            shardPath = os.path.join(inTestSetPath, TestWriter.getShardName(inTestSet, inFirstShard) +
+                                     m_TestFilesExtension)
+
+
+class RevisionBisector:
+    """
+    Finds the MDEF revisions which introduced the Tables & Columns added within a range of revisions. All of them are
+    bisected at once, so every round fetches the revisions in the middle of the remaining ranges in a single batch and
+    each Table or Column costs O(log n) revisions instead of O(n).
+    """
+
+    def __init__(self, inMDEFLocation: str, inOlderRevision: int, inNewerRevision: int):
+        self.mdefLocation = inMDEFLocation
+        self.olderRevision = inOlderRevision
+        self.newerRevision = inNewerRevision
+        self.mdefs = dict()
+        self.columnFingerprints = dict()
+
+    def loadRevisions(self, inRevisions):
+        """Fetches & loads the given revisions of the MDEF which are not loaded yet"""
+        revisions = sorted(set(inRevisions).difference(self.mdefs))
+        if len(revisions) > 0:
+            mdefLocs = PerforceUtility.getRevisions(self.mdefLocation, revisions)
+            with ProcessPoolExecutor() as executor:
+                for revision, mdef in zip(revisions, executor.map(MDEF.load, [mdefLocs[revision]
+                                                                              for revision in revisions],
+                                                                  repeat(False), repeat(True))):
+                    self.mdefs[revision] = mdef
+
+    def getColumnFingerprints(self, inRevision: int, inTableName: str):
+        """Returns the column fingerprints of the given table in the given revision"""
+        if (inRevision, inTableName) not in self.columnFingerprints:
+            self.columnFingerprints[(inRevision, inTableName)] = \
+                self.mdefs[inRevision].getColumnFingerprints(inTableName)
+        return self.columnFingerprints[(inRevision, inTableName)]
+
+    def isIntroduced(self, inRevision: int, inTableName: str, inColumnName: str = None, inFingerprint: bytes = None):
+        """
+        Checks whether the given revision already has the Table, or the Column as in the newer revision \n
+        :param inRevision: Revision Number of the MDEF to check
+        :param inTableName: Name of the Table
+        :param inColumnName: Name of the Column, None to check the Table only
+        :param inFingerprint: Fingerprint of the Column in the newer revision
+        :return: Returns True if introduced by the given revision or an earlier one else False
+        """
+        mdef = self.mdefs[inRevision]
+        if inTableName not in mdef.TableIndex:
+            return False
+        elif inColumnName is None or mdef.getTableFingerprint(inTableName) == \
+                self.mdefs[self.newerRevision].getTableFingerprint(inTableName):
+            return True
+        else:
+            return self.getColumnFingerprints(inRevision, inTableName).get(inColumnName) == inFingerprint
+
+    def run(self):
+        """
+        Bisects the history of every Table & Column added or changed between the older and the newer revision \n
+        :return: Returns the mapping of the added Tables to their introducing revisions, along with the mapping of the
+        changed Tables to their added or changed Columns and the introducing revisions of those
+        """
+        self.loadRevisions([self.olderRevision, self.newerRevision])
+        mdefDiff = self.mdefs[self.newerRevision].findDifference(self.mdefs[self.olderRevision])
+        items = list()
+        if mdefDiff is not None:
+            tableChanges = mdefDiff[MDEF.m_Changes][MDEF.m_Tables]
+            items.extend((tableName, None, None) for tableName in tableChanges[MDEF.m_Added])
+            for tableName, columns in tableChanges[MDEF.m_Changed].items():
+                fingerprints = self.getColumnFingerprints(self.newerRevision, tableName)
+                items.extend((tableName, columnName, fingerprints[columnName]) for columnName in columns)
+
+        # Every item is missing in the first revision of its range and present in the last one
+        ranges = {item: [self.olderRevision, self.newerRevision] for item in items}
+        pendingItems = [item for item in items if ranges[item][1] - ranges[item][0] > 1]
+        while len(pendingItems) > 0:
+            self.loadRevisions(sum(ranges[item]) // 2 for item in pendingItems)
+            for item in pendingItems:
+                revision = sum(ranges[item]) // 2
+                ranges[item][1 if self.isIntroduced(revision, *item) else 0] = revision
+            pendingItems = [item for item in pendingItems if ranges[item][1] - ranges[item][0] > 1]
+
+        introducingRevisions = {MDEF.m_Tables: dict(), MDEF.m_Columns: dict()}
+        for (tableName, columnName, _), (_, revision) in ranges.items():
+            if columnName is None:
+                introducingRevisions[MDEF.m_Tables][tableName] = revision
+            else:
+                introducingRevisions[MDEF.m_Columns].setdefault(tableName, dict())[columnName] = revision
+        return introducingRevisions
+
 
 class TestSetGenerator:
     def __init__(self, inFilePath):
         self.inputFile = InputReader(inFilePath)
         self.inMDEFToGenerateTests = None
+        self.manifest = None
 
     def run(self):
+        if self.inputFile.getMDEFDifferenceFindMode() == m_RevisionRange:
+            return self.writeRevisionHistory()
         requiredTestSuites = self.inputFile.getRequiredTestSuites()
         externalArgs = self.inputFile.getExternalArguments()
         if self.setupTestFolders(requiredTestSuites):
+            self.manifest = TestSetManifest(self.inputFile.getConnectionString(), self.inputFile.getShardLimits())
             mdefDiff = self.findMDEFDifference()
-            if mdefDiff is not None:
-                if TestWriter.writeTestSets(requiredTestSuites, mdefDiff, externalArgs, onlySelectAll=True):
-                    if ResultSetGenerator.executeTestSuite(TestSuites.Integration.name, TestSets.SQL_SELECT_ALL.name):
-                        tableColumnValues = ResultSetGenerator.parseResultSets(
-                            mdefDiff, requiredTestSuites[TestSuites.Integration.name][TestSets.SQL_SELECT_ALL.name]
-                        )
-                        if tableColumnValues is not None and len(tableColumnValues) > 0:
-                            return TestWriter.writeTestSets(requiredTestSuites, mdefDiff, externalArgs, False,
-                                                            tableColumnValues)
-                        else:
-                            print('Error: Failed to generate result-sets of `SQL_SELECT_ALL`')
+            if mdefDiff is False:
+                return False
+            elif mdefDiff is not None:
+                if TestWriter.writeTestSets(requiredTestSuites, mdefDiff, externalArgs, onlySelectAll=True,
+                                            inManifest=self.manifest):
+                    tableColumnValues, columnSketches = self.loadTableColumnValues(
+                        mdefDiff, TestWriter.usesColumnSketches(requiredTestSuites, self.inputFile.getQueryBudget()))
+                    if tableColumnValues is not None and len(tableColumnValues) > 0:
+                        tableColumnValues = mdefDiff.restrictToChangedColumns(tableColumnValues)
+                        written = TestWriter.writeTestSets(requiredTestSuites, mdefDiff, externalArgs, False,
+                                                           tableColumnValues, self.manifest,
+                                                           self.inputFile.getShardLimits(),
+                                                           self.inputFile.getQueryBudget(), columnSketches)
+                        # Registers the shards written
+                        return TestWriter.writeTestSuites(requiredTestSuites) and written
+                    else:
+                        print('Error: Failed to generate result-sets of `SQL_SELECT_ALL`')
             else:
                 print('Warning: Provided MDEFs are identical. No difference found to generate new test-cases.')
 
+    def loadTableColumnValues(self, inMdefDiff: MDEF, withSketches: bool = False):
+        """
+        Finds the values of the columns of every table within the Column Catalog. Only if any of the tables misses it,
+        `SQL_SELECT_ALL` is run & its Result-sets are parsed, the values found are stored within the catalog then \n
+        :param inMdefDiff: MDEF Difference as MDEF Instance
+        :param withSketches: If set to True, the columns are sketched as well. Every row of the Result-sets is read then
+        :return: Returns the Table Column Values Mapping & the Table Column Sketch Mapping, both None if the
+        Result-sets of `SQL_SELECT_ALL` could not be generated. The sketches are None unless asked for
+        """
+        tableFingerprints = {table.Name: TestWriter._toHex(table.Fingerprint) for table in inMdefDiff.Tables}
+        with ColumnCatalog(m_ColumnCatalog, self.inputFile.getConnectionString()) as catalog:
+            cached = catalog.load(tableFingerprints, withSketches)
+            if cached is not None:
+                print(f"Column values of all {len(tableFingerprints)} tables found in the catalog, "
+                      f"skipping `SQL_SELECT_ALL`")
+                tableColumnValues, columnSketches = cached
+                if ColumnStore.numpy is not None:
+                    tableColumnValues = ColumnStore.toColumnStore(tableColumnValues)
+                return tableColumnValues, columnSketches if withSketches else None
+            if not self.executeSelectAllTestSet():
+                return None, None
+            columnSketches, tableErrors = dict(), dict()
+            tableColumnValues = ResultSetGenerator.parseResultSets(
+                inMdefDiff, self.inputFile.getRequiredTestSuites()[TestSuites.Integration.name][
+                    TestSets.SQL_SELECT_ALL.name], asColumnStore=ColumnStore.numpy is not None,
+                outColumnSketches=columnSketches if withSketches else None, outTableErrors=tableErrors
+            )
+            if tableColumnValues is not None:
+                # Tables without rows are stored as well, the ones having errors are parsed again next time
+                catalog.store({tableName: tableColumnValues.get(tableName, dict()) for tableName in tableFingerprints
+                               if tableName not in tableErrors}, columnSketches, tableFingerprints)
+            return tableColumnValues, columnSketches if withSketches else None
+
+    def executeSelectAllTestSet(self):
+        """
+        Runs Touchstone for `SQL_SELECT_ALL` unless its Result-sets are up to date \n
+        :return: True if the Result-sets are available else False
+        """
+        testSuite, testSet = TestSuites.Integration.name, TestSets.SQL_SELECT_ALL.name
+        if self.manifest.isExecuted(testSuite, testSet):
+            return True
+        if ResultSetGenerator.executeTestSuite(testSuite, testSet):
+            self.manifest.setExecuted(testSuite, testSet)
+            self.manifest.save()
+            return True
+        return False
+
+    def writeRevisionHistory(self):
+        """
+        Finds the revisions which introduced the Tables & Columns added within the `RevisionRange` and writes them to
+        `RevisionHistory.json` in the `Output` folder \n
+        :return: Returns None as no Test-sets are generated in this mode
+        """
+        olderMdefRev, newerMdefRev = self.inputFile.getRevisionRange()
+        introducingRevisions = RevisionBisector(self.inputFile.getMDEFLocation(), olderMdefRev, newerMdefRev).run()
+        for tableName, revision in introducingRevisions[MDEF.m_Tables].items():
+            print(f"{tableName}: introduced in #{revision}")
+        for tableName, columns in introducingRevisions[MDEF.m_Columns].items():
+            for columnName, revision in columns.items():
+                print(f"{tableName}.{columnName}: introduced in #{revision}")
+        os.makedirs(m_OutputFolder, exist_ok=True)
+        with open(os.path.join(m_OutputFolder, m_RevisionHistory), 'w') as file:
+            json.dump(introducingRevisions, file, indent=4)
+        return None
+
     def findMDEFDifference(self):
+        """
+        Finds the difference between the MDEFs given by the `DifferenceFindMode` \n
+        :return: Returns the difference as MDEF Instance, None if there is no difference, False if the MDEFs could not
+        be fetched
+        """
         mdefDiffMode = self.inputFile.getMDEFDifferenceFindMode()
         if mdefDiffMode == m_CompareTwoRevisions:
-            latestMdef, olderMdef = None, None
             mdefLoc = self.inputFile.getMDEFLocation()
             olderMdefRev = self.inputFile.getOlderMDEFRevision()
             newerMdefRev = self.inputFile.getNewerMDEFRevision()
-            if olderMdefRev is not None and newerMdefRev is not None:
-                olderMdefLoc = PerforceUtility.getRevision(mdefLoc, olderMdefRev)
-                olderMdef = MDEF(olderMdefLoc) if olderMdefLoc is not None else None
-                newerMdefLoc = PerforceUtility.getRevision(mdefLoc, newerMdefRev)
-                newerMdef = MDEF(newerMdefLoc) if newerMdefLoc is not None else None
-                mdefDiff = newerMdef.findDifference(olderMdef)
-            else:
-                latest_mdef_revision_num = PerforceUtility.getLatestRevisionNumber(mdefLoc)
-                olderMdefLoc = PerforceUtility.getRevision(mdefLoc, latest_mdef_revision_num - 1)
-                olderMdef = MDEF(olderMdefLoc) if olderMdefLoc is not None else None
-                latestMdefLoc = PerforceUtility.getRevision(mdefLoc)
-                latestMdef = MDEF(latestMdefLoc) if latestMdefLoc is not None else None
-                mdefDiff = latestMdef.findDifference(olderMdef)
-            if mdefDiff is not None:
-                return MDEF(inFileContent=mdefDiff, withColumns=True)
-            else:
-                print('No Difference found between the specified version of MDEF')
-                return None
+            if olderMdefRev is None or newerMdefRev is None:
+                latestMdefRev = PerforceUtility.getLatestRevisionNumber(mdefLoc)
+                if latestMdefRev is None:
+                    print(f"Error: Latest revision of {mdefLoc} could not be found")
+                    return False
+                olderMdefRev = latestMdefRev - 1
+                newerMdefRev = None
+            # Both revisions are fetched and parsed concurrently, the newer one with columns to hand the difference
+            # over without parsing it again
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                olderMdef = executor.submit(TestSetGenerator.fetchMDEF, mdefLoc, olderMdefRev)
+                newerMdef = executor.submit(TestSetGenerator.fetchMDEF, mdefLoc, newerMdefRev, True)
+                olderMdef, newerMdef = olderMdef.result(), newerMdef.result()
+            if olderMdef is None or newerMdef is None:
+                print(f"Error: Revisions of {mdefLoc} could not be fetched")
+                return False
+            return TestSetGenerator.getDifferenceMDEF(newerMdef, olderMdef)
         else:
             modifedMdefLoc = self.inputFile.getModifiedMDEFLocation()
             if modifedMdefLoc is not None:
                 if self.inputFile.isFirstRevision():
-                    return MDEF(inFilePath=modifedMdefLoc, withColumns=True)
-                else:
-                    latestMdefLoc = PerforceUtility.getRevision(self.inputFile.getMDEFLocation())
-                    latestMdef = MDEF(latestMdefLoc) if latestMdefLoc is not None else None
-                    modifedMdef = MDEF(modifedMdefLoc)
-                    mdefDiff = modifedMdef.findDifference(latestMdef)
-                if mdefDiff is not None:
-                    return MDEF(inFileContent=mdefDiff, withColumns=True)
+                    return MDEF.load(modifedMdefLoc, withColumns=True)
                 else:
-                    print('No Difference found between the specified version of MDEF')
-                    return None
+                    with ProcessPoolExecutor(max_workers=2) as executor:
+                        latestMdef = executor.submit(TestSetGenerator.fetchMDEF, self.inputFile.getMDEFLocation())
+                        modifedMdef = executor.submit(MDEF.load, modifedMdefLoc, True, True)
+                        latestMdef, modifedMdef = latestMdef.result(), modifedMdef.result()
+                    if latestMdef is None:
+                        print(f"Error: Latest revision of {self.inputFile.getMDEFLocation()} could not be fetched")
+                        return False
+                    return TestSetGenerator.getDifferenceMDEF(modifedMdef, latestMdef)
             else:
                 raise Exception(f"{m_ModifiedMDEFLocation} is an invalid value! Provide a correct one.")
 
+    @staticmethod
+    def fetchMDEF(inMDEFLocation: str, inRevision: int = None, withColumns: bool = False):
+        """
+        Gets the MDEF from Perforce and loads it lazily \n
+        :param inMDEFLocation: Location of the MDEF
+        :param inRevision: Revision Number of the MDEF, the latest revision if not specified
+        :param withColumns: If set to True, columns of the tables are parsed as well
+        :return: Returns the MDEF Instance if downloaded successfully else None
+        """
+        mdefLoc = PerforceUtility.getRevision(inMDEFLocation, inRevision)
+        if mdefLoc is None or not os.path.exists(mdefLoc):
+            return None
+        return MDEF.load(mdefLoc, withColumns, lazy=True)
+
+    @staticmethod
+    def getDifferenceMDEF(inNewerMDEF: MDEF, inOlderMDEF: MDEF):
+        """
+        Finds the difference between both MDEFs \n
+        :param inNewerMDEF: Newer MDEF Instance, parsed with columns
+        :param inOlderMDEF: Older MDEF Instance
+        :return: Returns the difference as MDEF Instance sharing the entries of `inNewerMDEF`, None if no difference
+        """
+        mdefDiff = inNewerMDEF.findDifference(inOlderMDEF)
+        if mdefDiff is not None:
+            TestSetGenerator.printChanges(mdefDiff[MDEF.m_Changes])
+            return MDEF(inFileContent=mdefDiff, withColumns=True, inParsedMDEF=inNewerMDEF)
+        else:
+            print('No Difference found between the specified version of MDEF')
+            return None
+
+    @staticmethod
+    def printChanges(inChanges: dict):
+        """Prints the summary of the changes found between the MDEFs"""
+        for section, sectionChanges in inChanges.items():
+            print(f"{section}: {len(sectionChanges[MDEF.m_Added])} added, "
+                  f"{len(sectionChanges[MDEF.m_Changed])} changed, {len(sectionChanges[MDEF.m_Removed])} removed")
+        for tableName, columns in inChanges[MDEF.m_Tables][MDEF.m_Changed].items():
+            if len(columns) > 0:
+                print(f"{tableName}: changed columns {', '.join(columns)}")
+
     def setupOutputFolder(self):
         """
         Makes a directory name `Output` and puts required files of TouchStone with the same by copying from the
@@ -771,17 +1880,13 @@ class TestSetGenerator:
         if self.setupOutputFolder():
             outputFolderPath = os.path.abspath(m_OutputFolder)
             envsFolderPath = os.path.abspath(os.path.join(outputFolderPath, m_EnvsFolder))
-            if os.path.exists(envsFolderPath):
-                rmtree(envsFolderPath)
-            os.mkdir(envsFolderPath)
+            os.makedirs(envsFolderPath, exist_ok=True)
             if TestWriter.writeTestEnv(envsFolderPath, self.inputFile.getConnectionString()):
+                # Existing Test-sets & Result-sets are kept, `TestSetManifest` tells which of them are stale
                 for testSuite in inRequiredTestSuites.keys():
                     currTestSuitePath = os.path.abspath(os.path.join(outputFolderPath, testSuite))
-                    if os.path.exists(currTestSuitePath):
-                        rmtree(currTestSuitePath)
-                    os.mkdir(currTestSuitePath)
-                    os.mkdir(os.path.join(currTestSuitePath, m_TestSets))
-                    os.mkdir(os.path.join(currTestSuitePath, m_ResultSets))
+                    os.makedirs(os.path.join(currTestSuitePath, m_TestSets), exist_ok=True)
+                    os.makedirs(os.path.join(currTestSuitePath, m_ResultSets), exist_ok=True)
                 return TestWriter.writeTestSuites(inRequiredTestSuites)
             else:
                 return False
@@ -795,32 +1900,177 @@ class ResultSetGenerator:
         self.inputFile = InputReader(in_filepath)
 
     def run(self):
-        if TestSetGenerator(self.inputFileName).run():
-            for testSuite in self.inputFile.getRequiredTestSuites():
-                if not ResultSetGenerator.executeTestSuite(testSuite):
-                    print(f"Error: {testSuite} could not be generated!")
+        testSetGenerator = TestSetGenerator(self.inputFileName)
+        if testSetGenerator.run():
+            manifest = testSetGenerator.manifest
+            requiredTestSuites = self.inputFile.getRequiredTestSuites()
+            unexecutedTestSets = manifest.getUnexecutedTestSets(requiredTestSuites)
+            plannedRuns = ResultSetGenerator.planRuns(unexecutedTestSets, requiredTestSuites,
+                                                      self.inputFile.getPartitionsPerSuite())
+            # Touchstone runs of all the suites go on at once, each of them being a process on its own
+            with ThreadPoolExecutor(max_workers=self.inputFile.getMaxConcurrentRuns() or os.cpu_count() or 1) \
+                    as executor:
+                runs = {testSuite: [executor.submit(ResultSetGenerator.executeTestSuite, testSuite, testSet, partition)
+                                    for testSet, partition in suiteRuns]
+                        for testSuite, suiteRuns in plannedRuns.items()}
+                for testSuite, testSets in unexecutedTestSets.items():
+                    executed = all([run.result() for run in runs[testSuite]])
+                    partitionCount = sum(1 for _, partition in plannedRuns[testSuite] if partition is not None)
+                    if partitionCount > 0:
+                        # Result-sets of the partitions which succeeded are kept even if another one failed
+                        executed = ResultSetGenerator.mergePartitionResultSets(testSuite, partitionCount) and executed
+                    if executed:
+                        for testSet in testSets:
+                            manifest.setExecuted(testSuite, testSet)
+                    else:
+                        print(f"Error: {testSuite} could not be generated!")
+            manifest.save()
+
+    @staticmethod
+    def planRuns(inUnexecutedTestSets: dict, inRequiredTestSuites: dict, inPartitionsPerSuite: int = 0):
+        """
+        Decides the Touchstone runs generating the Result-sets of the unexecuted Test-sets. With partitions asked for,
+        exactly the unexecuted Test-sets of a suite are split into partitions by `TestWriter.writeTestSuitePartitions`.
+        Otherwise a suite is run whole when none of its Test-sets having a file is up to date, else every shard of its
+        unexecuted Test-sets is run on its own \n
+        :param inUnexecutedTestSets: A Dictionary having Testsuite as a key and list of unexecuted test-sets as value
+        :param inRequiredTestSuites: A Dictionary having Testsuite as a key and the test-sets as value
+        :param inPartitionsPerSuite: Number of partitions to split the unexecuted Test-sets of a suite into
+        :return: Returns a Dictionary having Testsuite as a key and the list of runs as (Test-set, Partition) as value,
+        both None for a run of the whole suite
+        """
+        plannedRuns = dict()
+        for testSuite, testSets in inUnexecutedTestSets.items():
+            partitionCount = TestWriter.writeTestSuitePartitions(testSuite, testSets, inPartitionsPerSuite)
+            if partitionCount > 0:
+                plannedRuns[testSuite] = [(None, partition) for partition in range(1, partitionCount + 1)]
+            elif all(testSet in testSets or not TestWriter.hasTestSetFile(testSuite, testSet)
+                     for testSet in inRequiredTestSuites[testSuite]):
+                plannedRuns[testSuite] = [(None, None)]
+            else:
+                plannedRuns[testSuite] = [(shard, None) for testSet in testSets
+                                          for shard in TestWriter.getTestSetShards(testSuite, testSet)]
+        return plannedRuns
 
     @staticmethod
-    def executeTestSuite(inTestSuite: str, withSpecificTestSet: str = None):
+    def executeTestSuite(inTestSuite: str, withSpecificTestSet: str = None, inPartition: int = None):
         """
-        Runs Touchstone test for given testsuite \n
+        Runs Touchstone test for given testsuite. Touchstone gets the `Output` folder as its working directory while the
+        one of this process stays as it is, so several runs may go on at once. The run is followed by a `RunMonitor`
+        while it goes on, which logs the output & the timing of every test to `Output/TouchStoneOutput` and reports the
+        progress \n
         :param withSpecificTestSet: Name of test-set to run Touchstone for that particular test-set only
         :param inTestSuite: Name of the Testsuite
-        :return: True if succeeded else False
+        :param inPartition: Number of the partition written by `TestWriter.writeTestSuitePartitions` to run instead of
+        the whole suite, its Result-sets are written to the baseline folder of the partition
+        :return: True if Touchstone exited with code 0 having written a Result-set for every test of the run, else
+        False
         """
         if len(inTestSuite) > 0:
-            touchstone_cmd = f"{m_TouchStone} -te {m_EnvsFolder}\\{m_TestEnv} " \
-                             f"-ts {inTestSuite}\\{m_TestSuite} -o {inTestSuite}"
+            outputFolderPath = os.path.abspath(m_OutputFolder)
+            runFolder = ResultSetGenerator._getRunFolder(inTestSuite, inPartition)
+            arguments = [os.path.join(outputFolderPath, m_TouchStone), '-te', f"{m_EnvsFolder}\\{m_TestEnv}",
+                         '-ts', f"{runFolder}\\{m_TestSuite}".replace(os.sep, '\\'), '-o',
+                         runFolder.replace(os.sep, '\\')]
+            runName = inTestSuite if inPartition is None else f"{inTestSuite} partition {inPartition}"
             if withSpecificTestSet is not None and len(withSpecificTestSet) > 0:
-                touchstone_cmd += f" -rts {withSpecificTestSet}"
-            currentDir = os.path.abspath(os.curdir)
-            os.chdir(m_OutputFolder)
-            subprocess.call(touchstone_cmd)
-            os.chdir(currentDir)
-            return True if len(os.listdir(os.path.join(os.path.join(m_OutputFolder, inTestSuite), m_ResultSets))) > 0 \
-                else False
+                arguments += ['-rts', withSpecificTestSet]
+                runName += f" {withSpecificTestSet}"
+            # Every test yields a Result-set, a Test-set left without tests e.g. by the de-duplication yields none
+            testCount = ResultSetGenerator._getTestCount(inTestSuite, runFolder, withSpecificTestSet)
+            monitor = RunMonitor(runName, os.path.join(m_OutputFolder, m_TouchStoneOutput,
+                                                       f"{runName.replace(' ', '_')}.jsonl"),
+                                 os.path.join(m_OutputFolder, runFolder, m_ResultSets),
+                                 f"{withSpecificTestSet}-" if withSpecificTestSet else '', testCount)
+            monitor.start(arguments)
+            try:
+                with subprocess.Popen(arguments, cwd=outputFolderPath, stdout=subprocess.PIPE,
+                                      stderr=subprocess.STDOUT, text=True, errors='replace') as process:
+                    for line in process.stdout:
+                        line = line.rstrip()
+                        if len(line) > 0:
+                            print(f"{runName}: {line}")
+                            monitor.addOutput(line)
+                returnCode = process.returncode
+            except OSError as e:
+                monitor.stop()
+                print(f"Error: Touchstone could not be started for {runName}: {e}")
+                return False
+            resultSetCount = monitor.stop(returnCode)
+            print(monitor.getProgress())
+            if returnCode != 0:
+                print(f"Error: Touchstone exited with code {returnCode} for {runName}")
+                return False
+            elif resultSetCount != testCount:
+                print(f"Error: Touchstone wrote {resultSetCount} Result-sets for {runName}, {testCount} were expected")
+                return False
+            print(f"Touchstone wrote {resultSetCount} Result-sets for {runName}")
+            return True
         else:
             print('Error: Invalid Testsuite Name')
+            return False
+
+    @staticmethod
+    def _getRunFolder(inTestSuite: str, inPartition: int = None):
+        """Returns the folder of a Touchstone run relative to `Output`, holding its Test-suite & its Result-sets"""
+        return inTestSuite if inPartition is None else os.path.join(inTestSuite, m_Partitions, str(inPartition))
+
+    @staticmethod
+    def mergePartitionResultSets(inTestSuite: str, inPartitionCount: int):
+        """
+        Moves the Result-sets of every partition to the baseline folder of the Test-suite and removes the partitions.
+        Every other file Touchstone wrote to the folder of a partition, e.g. its logs, is kept within
+        `Output/TouchStoneOutput/{Testsuite}_partition_{Partition}` \n
+        :param inTestSuite: Name of the Testsuite
+        :param inPartitionCount: Number of partitions the suite was run as
+        :return: Returns True if a Result-set of every test of the partitions was merged, else False
+        """
+        resultSetsPath = os.path.join(m_OutputFolder, inTestSuite, m_ResultSets)
+        os.makedirs(resultSetsPath, exist_ok=True)
+        movedCount = expectedCount = 0
+        for partition in range(1, inPartitionCount + 1):
+            runFolder = ResultSetGenerator._getRunFolder(inTestSuite, partition)
+            partitionPath = os.path.join(m_OutputFolder, runFolder)
+            if not os.path.exists(partitionPath):
+                continue
+            expectedCount += ResultSetGenerator._getTestCount(inTestSuite, runFolder)
+            partitionResultSetsPath = os.path.join(partitionPath, m_ResultSets)
+            if os.path.exists(partitionResultSetsPath):
+                for entry in os.scandir(partitionResultSetsPath):
+                    os.replace(entry.path, os.path.join(resultSetsPath, entry.name))
+                    if m_ResultSetPattern.match(entry.name):
+                        movedCount += 1
+            logsPath = os.path.join(m_OutputFolder, m_TouchStoneOutput, f"{inTestSuite}_partition_{partition}")
+            rmtree(logsPath, ignore_errors=True)
+            for entry in os.scandir(partitionPath):
+                if entry.name not in (m_ResultSets, m_TestSuite):
+                    os.makedirs(logsPath, exist_ok=True)
+                    os.replace(entry.path, os.path.join(logsPath, entry.name))
+        rmtree(os.path.join(m_OutputFolder, inTestSuite, m_Partitions), ignore_errors=True)
+        if movedCount != expectedCount:
+            print(f"Error: Merged {movedCount} Result-sets of {inPartitionCount} partitions of {inTestSuite}, "
+                  f"{expectedCount} were expected")
+            return False
+        print(f"Merged {movedCount} Result-sets of {inPartitionCount} partitions of {inTestSuite}")
+        return True
+
+    @staticmethod
+    def _getTestCount(inTestSuite: str, inRunFolder: str, inTestSet: str = None):
+        """Returns the number of tests the Test-suite of the run holds, only the ones of the Test-set if given"""
+        testSuitePath = os.path.join(m_OutputFolder, inRunFolder, m_TestSuite)
+        if not os.path.exists(testSuitePath):
+            return 0
+        testCount = 0
+        for testSet in Etree.parse(testSuitePath).getroot().iter('TestSet'):
+            if inTestSet and testSet.get('Name') != inTestSet:
+                continue
+            idRange = TestWriter.getTestIdRange(inTestSuite, testSet.get('Name'))
+            if idRange is not None:
+                testCount += idRange[1] - idRange[0] + 1
+                for exclusion in testSet.iter('Exclusion'):
+                    testCount -= max(0, min(int(exclusion.get('EndID')), idRange[1]) -
+                                     max(int(exclusion.get('StartID')), idRange[0]) + 1)
+        return testCount
 
     @staticmethod
     def _convertDataType(inData: str, inSQLtype: str):
@@ -842,65 +2092,167 @@ class ResultSetGenerator:
             return f"\'{str(inData)}\'"
 
     @staticmethod
-    def parseResultSets(inMdefDiff: MDEF, inStartingID: int = 1):
+    def _readResultSet(inFilePath: str, withSketches: bool = False):
         """
-        Parses the `Result-sets` generated and maps to its relevant columns \n
+        Streams a Result-set, keeping only the rows which are sampled. Rows are cleared as soon as they are read and the
+        file is not read any further once the sampled rows & the columns are collected, so the memory held does not
+        depend on the size of the Result-set. Columns may come either before or after the rows \n
+        :param inFilePath: Path of the Result-set file
+        :param withSketches: If set to True, every row is read to build a `ColumnSketch` of every column, and the rows
+        are sampled uniformly instead of taking the first ones
+        :return: Returns the number of rows, the list of (Column Name, SQL Type), the sampled rows, every row as the
+        list of its values, None for the null & empty ones, and the list of unfinished sketches, None without them
+        """
+        rowCount = sampledRowCount = None
+        columns = list()
+        rows = list()
+        sketches = list() if withSketches else None
+        rowsRead = 0
+        # Seeded by the Result-set, so an unchanged one yields the same sample and its Test-sets stay up to date
+        sampler = random.Random(os.path.basename(inFilePath))
+        rowDescriptions = None
+        insideRows = rowsDone = columnsDone = False
+        # Depths of the rows & of the element holding the columns, the root being at depth 1
+        depth, rowDepth, columnsDepth = 0, None, None
+        with open(inFilePath, 'rb') as file:
+            # The XML declaration must come first, though Touchstone may write whitespaces ahead of it
+            character = file.read(1)
+            while character.isspace():
+                character = file.read(1)
+            # An empty file has nothing to step back over and fails to parse as any other malformed one
+            if len(character) > 0:
+                file.seek(-1, os.SEEK_CUR)
+            for event, element in Etree.iterparse(file, events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    if insideRows:
+                        continue
+                    elif element.tag == 'RowDescriptions':
+                        if rowDescriptions is not None:
+                            raise ValueError('More than one RowDescriptions found in the resultset')
+                        rowDescriptions = element
+                        rowCount = int(element.attrib.get('RowCount'))
+                        sampledRowCount = rowCount % 30
+                        insideRows, rowDepth = True, depth + 1
+                    elif element.tag == 'Column' and columnsDepth is None:
+                        columnsDepth = depth - 1
+                    continue
+                depth -= 1
+                if insideRows:
+                    if depth >= rowDepth:
+                        # Values of a row
+                        continue
+                    elif depth == rowDepth - 1:
+                        if withSketches or len(rows) < sampledRowCount:
+                            row = [None if assure(value.attrib, 'IsNull', ignoreError=True) or
+                                   value.text is None or value.text.strip() == 'none' or
+                                   len(value.text.strip()) == 0 else value.text.strip() for value in element]
+                            if withSketches:
+                                sketches.extend(ColumnSketch() for _ in range(len(sketches), len(row)))
+                                for sketch, value in zip(sketches, row):
+                                    sketch.add(value)
+                            # Reservoir sampling, every row read so far is kept with the same probability
+                            if len(rows) < sampledRowCount:
+                                rows.append(row)
+                            elif sampledRowCount > 0:
+                                position = sampler.randrange(rowsRead + 1)
+                                if position < sampledRowCount:
+                                    rows[position] = row
+                        rowsRead += 1
+                        # Drops the rows read so far from the tree
+                        rowDescriptions.clear()
+                    else:
+                        insideRows = False
+                    rowsDone = not insideRows or not withSketches and len(rows) == sampledRowCount
+                elif element.tag == 'Column':
+                    columns.append((element[0].text.strip(), element[1].attrib.get('Type').strip()))
+                    element.clear()
+                elif columnsDepth is not None and depth < columnsDepth:
+                    columnsDone = True
+                if rowsDone and (columnsDone or rowCount == 0):
+                    break
+        if rowDescriptions is None:
+            raise ValueError('No RowDescriptions found in the resultset')
+        return rowCount, columns, rows, sketches
+
+    @staticmethod
+    def _parseResultSet(inResultSetPath: str, inColumnNames: list, asColumnStore: bool = False,
+                        withSketches: bool = False):
+        """
+        Parses a single Result-set of `SQL_SELECT_ALL` and maps its values to the columns of the table \n
+        :param inResultSetPath: Path of the Result-set file
+        :param inColumnNames: Names of the columns of the table within the MDEF
+        :param asColumnStore: If set to True, the values of every column are held as `ColumnStore.TypedColumn`
+        :param withSketches: If set to True, a `ColumnSketch` of all the values of every column is built as well
+        :return: Returns the Column Values Mapping of the table, None if the table has no rows, the list of errors found
+        and the Column Sketch Mapping of the table
+        """
+        if not os.path.exists(inResultSetPath):
+            return None, [f"Invalid Path {inResultSetPath} doesn't exist!"], dict()
+        try:
+            rowCount, columns, rows, sketches = ResultSetGenerator._readResultSet(inResultSetPath, withSketches)
+        except (ValueError, Etree.ParseError, OSError) as e:
+            return None, [str(e)], dict()
+        if rowCount == 0:
+            return None, list(), dict()
+        columnSketches = dict()
+        if withSketches:
+            for (columnName, columnType), sketch in zip(columns, sketches):
+                columnSketches[columnName] = sketch.finish(
+                    lambda inText, inType=columnType: ResultSetGenerator._convertDataType(inText, inType))
+        columnValues = dict()
+        errors = list()
+        for columnIndex, (columnName, columnType) in enumerate(columns):
+            if columnName in inColumnNames:
+                currColumnValues = {ResultSetGenerator._convertDataType(row[columnIndex], columnType)
+                                    for row in rows if columnIndex < len(row) and row[columnIndex] is not None}
+                columnValues[columnName] = ColumnStore.TypedColumn(currColumnValues) if asColumnStore \
+                    else list(currColumnValues)
+            else:
+                errors.append(f"Column Name {columnName} mismatched")
+        if len(columns) != len(inColumnNames):
+            errors.append('Column Count mismatched! There might be duplicate columns')
+        return columnValues, errors, columnSketches
+
+    @staticmethod
+    def parseResultSets(inMdefDiff: MDEF, inStartingID: int = 1, asColumnStore: bool = False,
+                        outColumnSketches: dict = None, outTableErrors: dict = None):
+        """
+        Parses the `Result-sets` generated and maps to its relevant columns. Every Result-set is parsed by a separate
+        task of a process pool, the tables having errors are reported and left out of the mapping \n
         :param inMdefDiff: MDEF Difference as MDEF Instance
         :param inStartingID: Starting Testcase Id for `SQL_SELECT_ALL` Testset
-        :return: Returns Table Columns Values Mapping
+        :param asColumnStore: If set to True, the values of every column are held as `ColumnStore.TypedColumn`
+        :param outColumnSketches: If given, receives the Table Column Sketch Mapping, having a `ColumnSketch` of all the
+        values of every column. Every row is read then, and the values are sampled uniformly over the rows
+        :param outTableErrors: If given, receives the list of errors of every table left out
+        :return: Returns Table Columns Values Mapping, in the order of the tables within the MDEF
         """
         if inMdefDiff is not None:
             resultSetsPath = os.path.abspath(os.path.join(os.path.join(m_OutputFolder, TestSuites.Integration.name),
                                                           m_ResultSets))
-            totalResultSets = len(inMdefDiff.Tables)
-            etree = None
+            resultSetPaths = [os.path.join(resultSetsPath, f"{TestSets.SQL_SELECT_ALL.name}-SQL_QUERY-"
+                                                           f"{testCaseId}{m_TestFilesExtension}")
+                              for testCaseId in range(inStartingID, inStartingID + len(inMdefDiff.Tables))]
+            if len(resultSetPaths) == 0:
+                return dict()
             tableColumnValues = dict()
-            for testCaseId in range(inStartingID, inStartingID + totalResultSets):
-                if os.path.exists(os.path.join(resultSetsPath, f"{TestSets.SQL_SELECT_ALL.name}-SQL_QUERY-"
-                                                               f"{testCaseId}{m_TestFilesExtension}")):
-                    invalidRowDesc = True
-                    rowCount = 0
-                    with open(os.path.abspath(os.path.join(resultSetsPath, f"{TestSets.SQL_SELECT_ALL.name}-SQL_QUERY-"
-                                                                           f"{testCaseId}{m_TestFilesExtension}"))) as file:
-                        etree = Etree.fromstring(file.read().strip())
-                        rowDescriptions = None
-                        for child in etree.iter('RowDescriptions'):
-                            rowDescriptions = child
-                            invalidRowDesc = not invalidRowDesc
-                            rowCount = int(child.attrib.get('RowCount'))
-                        if invalidRowDesc:
-                            print('More than one RowDescriptions found in the resultset')
-                            return None
-                        if rowCount > 0:
-                            rowCount %= 30
-                            currTableName = inMdefDiff.Tables[testCaseId - inStartingID][MDEF.m_Name]
-                            tableColumnValues[currTableName] = dict()
-                            columnCount = 0
-                            for column in etree.iter('Column'):
-                                columnCount += 1
-                                columnName = column[0].text.strip()
-                                columnType = column[1].attrib.get('Type').strip()
-                                tableColumnValues[currTableName][columnName] = list()
-                                currColumnValues = set()
-                                if columnName in inMdefDiff.Tables[testCaseId - inStartingID][MDEF.m_Columns]:
-                                    for i in range(1, rowCount + 1):
-                                        columnValue = rowDescriptions[i - 1][columnCount - 1]
-                                        if not assure(columnValue.attrib, 'IsNull', ignoreError=True) and \
-                                                columnValue.text is not None and columnValue.text.strip() != 'none' and \
-                                                len(columnValue.text.strip()) > 0:
-                                            currColumnValues.add(
-                                                ResultSetGenerator._convertDataType(columnValue.text.strip(), columnType)
-                                            )
-                                    tableColumnValues[currTableName][columnName] = list(currColumnValues)
-                                else:
-                                    print('Error: Column Name mismatched')
-                                    return None
-                            if columnCount != len(inMdefDiff.Tables[testCaseId - inStartingID][MDEF.m_Columns]):
-                                print(
-                                    'Error: Column Count mismatched! There might be duplicate columns in ' + currTableName)
-                                return None
-                else:
-                    print('Error: Invalid Path', os.path.join(resultSetsPath, f"{TestSets.SQL_SELECT_ALL.name}-SQL_QUERY-"
-                                                               f"{testCaseId}{m_TestFilesExtension}"), 'doesn\'t exist!')
-                    return None
+            tableErrors = outTableErrors if outTableErrors is not None else dict()
+            with ProcessPoolExecutor(max_workers=min(len(resultSetPaths), os.cpu_count() or 1)) as executor:
+                results = executor.map(ResultSetGenerator._parseResultSet, resultSetPaths,
+                                       [list(table.Columns) for table in inMdefDiff.Tables], repeat(asColumnStore),
+                                       repeat(outColumnSketches is not None))
+                for table, (columnValues, errors, columnSketches) in zip(inMdefDiff.Tables, results):
+                    if len(errors) > 0:
+                        tableErrors[table.Name] = errors
+                    elif columnValues is not None:
+                        tableColumnValues[table.Name] = columnValues
+                        if outColumnSketches is not None:
+                            outColumnSketches[table.Name] = columnSketches
+            for tableName, errors in tableErrors.items():
+                for error in errors:
+                    print(f"Error: {tableName}: {error}")
+            if len(tableErrors) > 0:
+                print(f"Error: Result-sets of {len(tableErrors)} of {len(resultSetPaths)} tables could not be parsed, "
+                      f"they are left out")
             return tableColumnValues
@@ -7,6 +7,7 @@ from GenUtility import assure, getEnvVariableValue
 m_ConnectionString = 'ConnectionString'
 m_DifferenceFindMode = 'DifferenceFindMode'
 m_CompareTwoRevisions = 'CompareTwoRevisions'
+m_RevisionRange = 'RevisionRange'
 m_ExternalArguments = 'ExternalArguments'
 m_ModifiedMDEFLocation = 'ModifiedMDEFLocation'
 m_IsFirstRevision = 'IsFirstRevision'
@@ -14,6 +15,15 @@ m_PerforceLocation = 'PerforceLocation'
 m_MDEFLocation = 'MDEFLocation'
 m_TestDefinitionsLocation = 'TestDefinitionsLocation'
 m_TestSuite = 'TestSuite'
+m_Sharding = 'Sharding'
+m_MaxTestsPerFile = 'MaxTestsPerFile'
+m_MaxBytesPerFile = 'MaxBytesPerFile'
+m_QueryBudget = 'QueryBudget'
+m_PerTable = 'PerTable'
+m_PerTestSet = 'PerTestSet'
+m_Execution = 'Execution'
+m_MaxConcurrentRuns = 'MaxConcurrentRuns'
+m_PartitionsPerSuite = 'PartitionsPerSuite'
 
 # Perfoce Variables
 P4_ROOT = 'P4_ROOT'
@@ -48,6 +58,16 @@ class InputReader:
                     else:
                         raise Exception(f"Error: Invalid Values for `{m_CompareTwoRevisions}`. "
                                         "MDEF Revision Numbers must be different.")
+                elif assure(in_file[m_DifferenceFindMode], m_RevisionRange, True) and \
+                        (len(in_file[m_DifferenceFindMode][m_RevisionRange]) == 2):
+                    self.inDifferenceFindMode = m_RevisionRange
+                    self.inFirstRevision = False
+                    revisionRange = sorted(in_file[m_DifferenceFindMode][m_RevisionRange])
+                    if 0 < revisionRange[0] < revisionRange[1]:
+                        self.inOlderMDEFVersion, self.inNewerMDEFVersion = revisionRange
+                    else:
+                        raise Exception(f"Error: Invalid Values for `{m_RevisionRange}`. "
+                                        "MDEF Revision Numbers must be different and greater than 0.")
                 elif assure(in_file[m_DifferenceFindMode], m_ModifiedMDEFLocation) and \
                         len(in_file[m_DifferenceFindMode][m_ModifiedMDEFLocation]) > 0:
                     self.inDifferenceFindMode = m_ModifiedMDEFLocation
@@ -59,7 +79,8 @@ class InputReader:
                                                 f"is not a valid location for {m_ModifiedMDEFLocation}")
 
             if assure(in_file, m_PerforceLocation):
-                if assure(in_file[m_PerforceLocation], m_MDEFLocation) and len(in_file[m_PerforceLocation][m_MDEFLocation]) > 0:
+                if assure(in_file[m_PerforceLocation], m_MDEFLocation) and \
+                        len(in_file[m_PerforceLocation][m_MDEFLocation]) > 0:
                     if os.path.exists(getEnvVariableValue(P4_ROOT) + in_file[m_PerforceLocation][m_MDEFLocation]):
                         self.inMDEFLocation = in_file[m_PerforceLocation][m_MDEFLocation]
                     else:
@@ -77,6 +98,35 @@ class InputReader:
                             required_test_sets[test_set] = 1
                     self.inRequiredTestSuites[test_suite] = required_test_sets
 
+            # Optional, Test-sets are written as single files unless a limit greater than 0 is given
+            self.inShardLimits = (0, 0)
+            if assure(in_file, m_Sharding, True):
+                maxTests = assure(in_file[m_Sharding], m_MaxTestsPerFile, True) or 0
+                maxBytes = assure(in_file[m_Sharding], m_MaxBytesPerFile, True) or 0
+                if maxTests < 0 or maxBytes < 0:
+                    raise Exception(f"Error: Invalid Values for `{m_Sharding}`. Limits must not be negative.")
+                self.inShardLimits = (maxTests, maxBytes)
+
+            # Optional, `SQL_AND_OR`, `SQL_ORDER_BY` & `SQL_IN_BETWEEN` are expanded combinatorially once a budget
+            # greater than 0 is given, else they take a single query per table
+            self.inQueryBudget = (0, 0)
+            if assure(in_file, m_QueryBudget, True):
+                perTable = assure(in_file[m_QueryBudget], m_PerTable, True) or 0
+                perTestSet = assure(in_file[m_QueryBudget], m_PerTestSet, True) or 0
+                if perTable < 0 or perTestSet < 0:
+                    raise Exception(f"Error: Invalid Values for `{m_QueryBudget}`. Budgets must not be negative.")
+                self.inQueryBudget = (perTable, perTestSet)
+
+            # Optional, as many Touchstone runs go on at once as there are CPUs unless a limit greater than 0 is given
+            self.inMaxConcurrentRuns = 0
+            # Optional, a suite is run by a single Touchstone run unless more than 1 partition is asked for
+            self.inPartitionsPerSuite = 0
+            if assure(in_file, m_Execution, True):
+                self.inMaxConcurrentRuns = assure(in_file[m_Execution], m_MaxConcurrentRuns, True) or 0
+                self.inPartitionsPerSuite = assure(in_file[m_Execution], m_PartitionsPerSuite, True) or 0
+                if self.inMaxConcurrentRuns < 0 or self.inPartitionsPerSuite < 0:
+                    raise Exception(f"Error: Invalid Values for `{m_Execution}`. Values must not be negative.")
+
             if assure(in_file, m_ExternalArguments):
                 self.inExternalArguments = dict()
                 for test_suite, args_map in in_file[m_ExternalArguments].items():
@@ -94,6 +144,12 @@ class InputReader:
     def getNewerMDEFRevision(self):
         return self.inNewerMDEFVersion if self.inNewerMDEFVersion > 0 else None
 
+    def getRevisionRange(self):
+        if self.getMDEFDifferenceFindMode() == m_RevisionRange:
+            return self.inOlderMDEFVersion, self.inNewerMDEFVersion
+        else:
+            return None
+
     def getMDEFDifferenceFindMode(self):
         return self.inDifferenceFindMode
 
@@ -117,3 +173,15 @@ class InputReader:
 
     def getExternalArguments(self):
         return self.inExternalArguments
+
+    def getShardLimits(self):
+        return self.inShardLimits
+
+    def getQueryBudget(self):
+        return self.inQueryBudget
+
+    def getMaxConcurrentRuns(self):
+        return self.inMaxConcurrentRuns
+
+    def getPartitionsPerSuite(self):
+        return self.inPartitionsPerSuite
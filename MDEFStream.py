@@ -0,0 +1,192 @@
+"""
+Streaming Access to MDEF Files
+"""
+
+import codecs
+import json
+from array import array
+from collections.abc import Sequence
+
+
+m_ChunkSize = 1 << 20
+m_Whitespaces = ' \t\n\r'
+m_UTF8BOM = codecs.BOM_UTF8
+
+
+class _JSONStream:
+    """
+    Reads a JSON document chunk by chunk while keeping track of the byte offset of the current position, so that the
+    elements decoded from it can be located again in the file later on
+    """
+
+    def __init__(self, inFile):
+        self.file = inFile
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.jsonDecoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.bytePos = 0
+        self.eof = False
+        if inFile.read(len(m_UTF8BOM)) == m_UTF8BOM:
+            self.bytePos = len(m_UTF8BOM)
+        else:
+            inFile.seek(0)
+
+    def _fill(self, inSize: int = m_ChunkSize):
+        """Reads the next chunk of the file, returns False once the file is exhausted"""
+        if self.eof:
+            return False
+        chunk = self.file.read(inSize)
+        if self.pos > m_ChunkSize and self.pos > len(self.buffer) // 2:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        if chunk:
+            self.buffer += self.decoder.decode(chunk)
+        else:
+            self.buffer += self.decoder.decode(b'', final=True)
+            self.eof = True
+        return True
+
+    def peek(self):
+        """Skips whitespaces and returns the next character without consuming it, None at the end of the file"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in m_Whitespaces:
+                self.pos += 1
+                self.bytePos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return None
+
+    def expect(self, inChars: str):
+        """Consumes the next structural character if it is one of `inChars`"""
+        char = self.peek()
+        if char is None or char not in inChars:
+            raise ValueError(f"Invalid MDEF: expected one of `{inChars}` at byte {self.bytePos} but found `{char}`")
+        self.pos += 1
+        self.bytePos += 1
+        return char
+
+    def decodeValue(self):
+        """
+        Decodes the JSON value at the current position \n
+        :return: Returns the value along with its byte offset and byte length within the file
+        """
+        self.peek()
+        readSize = m_ChunkSize
+        while True:
+            try:
+                value, end = self.jsonDecoder.raw_decode(self.buffer, self.pos)
+                # A value touching the end of the buffer might still continue in the next chunk e.g. numbers
+                if end < len(self.buffer) or self.eof:
+                    break
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill(readSize)
+            readSize *= 2
+        offset = self.bytePos
+        length = len(self.buffer[self.pos:end].encode('utf-8'))
+        self.pos = end
+        self.bytePos += length
+        return value, offset, length
+
+
+def iterArrayElements(inFilePath: str, inKeys: tuple):
+    """
+    Streams the elements of the top-level arrays stored under the given keys without loading the whole document \n
+    :param inFilePath: Path of the JSON File
+    :param inKeys: Top-level keys whose arrays have to be streamed, values of all other keys are skipped
+    :return: Yields tuples of key, element, byte offset and byte length of the element
+    """
+    with open(inFilePath, 'rb') as file:
+        stream = _JSONStream(file)
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+        while True:
+            key = stream.decodeValue()[0]
+            stream.expect(':')
+            if key in inKeys and stream.peek() == '[':
+                stream.expect('[')
+                if stream.peek() != ']':
+                    while True:
+                        yield (key,) + stream.decodeValue()
+                        if stream.expect(',]') == ']':
+                            break
+                else:
+                    stream.expect(']')
+            else:
+                stream.decodeValue()
+            if stream.expect(',}') == '}':
+                break
+
+
+class LazyJSONArray(Sequence):
+    """
+    Elements of a JSON Array stored in a file, decoded from their byte ranges only when accessed
+    """
+
+    def __init__(self, inFilePath: str):
+        self.filePath = inFilePath
+        self.offsets = array('q')
+        self.lengths = array('q')
+
+    def append(self, inOffset: int, inLength: int):
+        self.offsets.append(inOffset)
+        self.lengths.append(inLength)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, inIndex):
+        if isinstance(inIndex, slice):
+            return [self[index] for index in range(*inIndex.indices(len(self)))]
+        with open(self.filePath, 'rb') as file:
+            return self._read(file, inIndex)
+
+    def __iter__(self):
+        with open(self.filePath, 'rb') as file:
+            for index in range(len(self)):
+                yield self._read(file, index)
+
+    def _read(self, inFile, inIndex: int):
+        inFile.seek(self.offsets[inIndex])
+        return json.loads(inFile.read(self.lengths[inIndex]))
+
+
+class LazyEntryList(Sequence):
+    """
+    Parsed entries of a `LazyJSONArray`, every element gets parsed by its owner on first access and then kept.
+    An element may produce any number of entries (e.g. a Table along with its Virtual Tables)
+    """
+
+    def __init__(self, inOwner, inSection: str, inElements: LazyJSONArray):
+        self.owner = inOwner
+        self.section = inSection
+        self.elements = inElements
+        self.entryElements = array('q')
+        self.entryPositions = array('l')
+        self.parsedElements = dict()
+
+    def addEntries(self, inElementIndex: int, inCount: int):
+        """Registers `inCount` entries produced by the element at `inElementIndex`"""
+        for position in range(inCount):
+            self.entryElements.append(inElementIndex)
+            self.entryPositions.append(position)
+
+    def __len__(self):
+        return len(self.entryElements)
+
+    def __getitem__(self, inIndex):
+        if isinstance(inIndex, slice):
+            return [self[index] for index in range(*inIndex.indices(len(self)))]
+        elementIndex = self.entryElements[inIndex]
+        if elementIndex not in self.parsedElements:
+            self.parsedElements[elementIndex] = self.owner.parseElement(self.section, self.elements[elementIndex])
+        return self.parsedElements[elementIndex][self.entryPositions[inIndex]]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['parsedElements'] = dict()
+        return state
@@ -0,0 +1,263 @@
+"""
+Budgeted Combinatorial Expansion of the queries over the columns & the sampled values of the tables
+"""
+
+import random
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import accumulate
+from math import comb, perm, prod
+
+
+m_Operators = ('AND', 'OR')
+m_Directions = ('ASC', 'DESC')
+m_MaxOrderByColumns = 3
+m_MaxInListLength = 4
+
+
+class ProductSpace(Sequence):
+    """Cartesian product of the given sequences, the element at an index is decoded on demand"""
+
+    def __init__(self, inFactors: list):
+        self.factors = inFactors
+        self.length = prod(map(len, inFactors))
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, inIndex: int):
+        if not 0 <= inIndex < self.length:
+            raise IndexError(inIndex)
+        element = list()
+        for factor in reversed(self.factors):
+            inIndex, position = divmod(inIndex, len(factor))
+            element.append(factor[position])
+        return tuple(reversed(element))
+
+
+class CombinationSpace(Sequence):
+    """Combinations of `inLength` items, in the order of `itertools.combinations`, decoded on demand"""
+
+    def __init__(self, inItems: list, inLength: int):
+        self.items = inItems
+        self.size = inLength
+        self.length = comb(len(inItems), inLength)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, inIndex: int):
+        if not 0 <= inIndex < self.length:
+            raise IndexError(inIndex)
+        # Ranks the reversed items in co-lexicographic order, which finds every item by a binary search
+        index, upper, element = self.length - 1 - inIndex, len(self.items), list()
+        for remaining in range(self.size, 0, -1):
+            lower, higher = remaining - 1, upper - 1
+            while lower < higher:
+                middle = (lower + higher + 1) // 2
+                if comb(middle, remaining) <= index:
+                    lower = middle
+                else:
+                    higher = middle - 1
+            index -= comb(lower, remaining)
+            element.append(self.items[len(self.items) - 1 - lower])
+            upper = lower
+        return tuple(element)
+
+
+class PermutationSpace(Sequence):
+    """Permutations of `inLength` items, in the order of `itertools.permutations`, decoded on demand"""
+
+    def __init__(self, inItems: list, inLength: int):
+        self.items = inItems
+        self.size = inLength
+        self.length = perm(len(inItems), inLength)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, inIndex: int):
+        if not 0 <= inIndex < self.length:
+            raise IndexError(inIndex)
+        items, element = list(self.items), list()
+        for position in range(self.size):
+            count = perm(len(items) - 1, self.size - position - 1)
+            choice, inIndex = divmod(inIndex, count)
+            element.append(items.pop(choice))
+        return tuple(element)
+
+
+class PairSpace(Sequence):
+    """
+    Pairs of values of two distinct columns, the first column coming before the second, with every item of `inMiddle`
+    between them. Columns may have any number of values. The pair at an index is found by binary searches over the
+    prefix sums of the columns' values & of the pairs starting with every column, so only O(columns) offsets are held
+    whatever the number of pairs of columns
+    """
+
+    def __init__(self, inColumns: list, inMiddle: Sequence):
+        self.columns = inColumns
+        self.middle = inMiddle
+        # Number of values of the columns before every column
+        self.valueOffsets = list(accumulate((len(values) for _, values in inColumns), initial=0))
+        totalValues = self.valueOffsets[-1]
+        # Number of pairs starting with the columns before every column, a column pairs its values with the ones of
+        # all the later columns
+        self.pairOffsets = list(accumulate(
+            (len(values) * len(inMiddle) * (totalValues - self.valueOffsets[position + 1])
+             for position, (_, values) in enumerate(inColumns)), initial=0))
+        self.length = self.pairOffsets[-1]
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, inIndex: int):
+        if not 0 <= inIndex < self.length:
+            raise IndexError(inIndex)
+        # The last offset not beyond the index belongs to a column having pairs
+        first = bisect_right(self.pairOffsets, inIndex) - 1
+        laterValues = self.valueOffsets[-1] - self.valueOffsets[first + 1]
+        index, laterValue = divmod(inIndex - self.pairOffsets[first], laterValues)
+        firstValue, middle = divmod(index, len(self.middle))
+        laterValue += self.valueOffsets[first + 1]
+        second = bisect_right(self.valueOffsets, laterValue) - 1
+        (firstName, firstValues), (secondName, secondValues) = self.columns[first], self.columns[second]
+        return (firstName, firstValues[firstValue], self.middle[middle], secondName,
+                secondValues[laterValue - self.valueOffsets[second]])
+
+
+class QuerySpace(Sequence):
+    """
+    Concatenation of spaces, each rendering its elements into queries with its own callable. Nothing is enumerated
+    until the queries at the given indices are asked for
+    """
+
+    def __init__(self):
+        self.spaces = list()
+        self.renderers = list()
+        self.offsets = list()
+        self.length = 0
+
+    def add(self, inSpace: Sequence, inRenderer):
+        if len(inSpace) > 0:
+            self.offsets.append(self.length)
+            self.spaces.append(inSpace)
+            self.renderers.append(inRenderer)
+            self.length += len(inSpace)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, inIndex: int):
+        if not 0 <= inIndex < self.length:
+            raise IndexError(inIndex)
+        space = bisect_right(self.offsets, inIndex) - 1
+        return self.renderers[space](self.spaces[space][inIndex - self.offsets[space]])
+
+
+def allocateBudget(inSizes: list, inBudget: int):
+    """
+    Shares the budget among the spaces of the given sizes, the smaller spaces are taken whole & the rest is split
+    evenly among the larger ones \n
+    :param inSizes: Sizes of the spaces
+    :param inBudget: Total number of queries, 0 for no limit
+    :return: Returns the number of queries to take from every space
+    """
+    if inBudget <= 0 or sum(inSizes) <= inBudget:
+        return list(inSizes)
+    shares, remaining = [0] * len(inSizes), inBudget
+    pending = sorted(range(len(inSizes)), key=inSizes.__getitem__)
+    for position, index in enumerate(pending):
+        shares[index] = min(inSizes[index], remaining // (len(pending) - position))
+        remaining -= shares[index]
+    return shares
+
+
+def sampleSpace(inSpace: Sequence, inCount: int):
+    """
+    Takes `inCount` queries of the space uniformly at random, without replacement. Indices are drawn instead of the
+    queries, so the space is never enumerated and the memory held is bound by the count \n
+    :param inSpace: Space of queries
+    :param inCount: Number of queries to take
+    :return: Returns a generator of the queries taken, in the order of the space
+    """
+    if inCount >= len(inSpace):
+        indices = range(len(inSpace))
+    else:
+        indices = sorted(random.sample(range(len(inSpace)), inCount))
+    for index in indices:
+        yield inSpace[index]
+
+
+def iterBudgetedQueries(inTableSpaces: dict, inQueryBudget: tuple):
+    """
+    Takes the queries of every table within the budget \n
+    :param inTableSpaces: Dictionary having Table Name as key and its `QuerySpace` as value
+    :param inQueryBudget: Maximum number of queries per table & per Test-set, 0 for no limit
+    :return: Returns a generator of the queries
+    """
+    perTable, perTestSet = inQueryBudget
+    sizes = [min(len(space), perTable) if perTable > 0 else len(space) for space in inTableSpaces.values()]
+    for space, count in zip(inTableSpaces.values(), allocateBudget(sizes, perTestSet)):
+        yield from sampleSpace(space, count)
+
+
+def getDistinctValues(inProfile):
+    """Returns the distinct non null values of a `ColumnProfile`"""
+    values = inProfile.Values
+    if hasattr(values, 'distinct'):
+        return values.distinct()
+    return [value for value in dict.fromkeys(values) if value is not None]
+
+
+def getAndOrSpace(inTableName: str, inColumnProfiles: dict):
+    """Pairs of columns compared against every pair of their values, joined by each of `m_Operators`"""
+    space = QuerySpace()
+    columns = [(columnName, getDistinctValues(profile)) for columnName, profile in inColumnProfiles.items()]
+    space.add(PairSpace([column for column in columns if len(column[1]) > 0], m_Operators),
+              lambda element: f"SELECT * FROM {inTableName} WHERE {element[0]}={element[1]} {element[2]} "
+                              f"{element[3]}={element[4]}")
+    return space
+
+
+def getOrderBySpace(inTableName: str, inColumnProfiles: dict):
+    """Ordered selections of up to `m_MaxOrderByColumns` columns, each of them in either direction"""
+    space = QuerySpace()
+    columns = list(inColumnProfiles)
+    for length in range(1, min(len(columns), m_MaxOrderByColumns) + 1):
+        space.add(ProductSpace([PermutationSpace(columns, length), ProductSpace([m_Directions] * length)]),
+                  lambda element: f"SELECT * FROM {inTableName} ORDER BY "
+                                  f"{', '.join(f'{column} {direction}' for column, direction in zip(*element))}")
+    return space
+
+
+def getInBetweenSpace(inTableName: str, inColumnProfiles: dict):
+    """Lists of 2 to `m_MaxInListLength` distinct values of every column, and ranges between any two of them"""
+    space = QuerySpace()
+    for columnName, profile in inColumnProfiles.items():
+        values = getDistinctValues(profile)
+        for length in range(2, min(len(values), m_MaxInListLength) + 1):
+            space.add(CombinationSpace(values, length),
+                      lambda element, column=columnName:
+                      f"SELECT * FROM {inTableName} WHERE {column} IN ({', '.join(map(str, element))})")
+        try:
+            values = sorted(values)
+        except TypeError:
+            # Values not sharing an order have no range
+            continue
+        space.add(CombinationSpace(values, 2),
+                  lambda element, column=columnName:
+                  f"SELECT * FROM {inTableName} WHERE {column} BETWEEN {element[0]} AND {element[1]}")
+    return space
+
+
+def iterExpandedQueries(inGetSpace, inColumnProfiles: dict, inQueryBudget: tuple):
+    """
+    Expands the queries of every table within the budget \n
+    :param inGetSpace: Callable returning the `QuerySpace` of a table, given its name & column profiles
+    :param inColumnProfiles: Key Value Pair Containing Table Name & Column Profiles Map
+    :param inQueryBudget: Maximum number of queries per table & per Test-set, 0 for no limit
+    :return: Returns a generator of the queries
+    """
+    return iterBudgetedQueries({tableName: inGetSpace(tableName, columns)
+                                for tableName, columns in inColumnProfiles.items()}, inQueryBudget)
@@ -0,0 +1,78 @@
+"""
+Index of the canonical forms of SQL Queries to find duplicate ones
+"""
+
+import re
+from hashlib import blake2b
+
+
+m_DigestSize = 8
+# Quoted literals & identifiers are kept as they are, everything else is case & whitespace insensitive
+m_QuotedPattern = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")")
+m_WhitespacePattern = re.compile(r'\s+')
+
+
+def canonicalizeQuery(inQuery: str):
+    """
+    Brings the query to its canonical form, collapsing whitespaces and upper-casing everything outside of quotes \n
+    :param inQuery: SQL Query
+    :return: Returns the canonical form of the query
+    """
+    parts = m_QuotedPattern.split(inQuery)
+    # Split yields the quoted parts at the odd positions
+    for index in range(0, len(parts), 2):
+        parts[index] = m_WhitespacePattern.sub(' ', parts[index]).upper()
+    return ''.join(parts).strip()
+
+
+def getQueryDigest(inQuery: str):
+    """Returns the digest of the canonical form of the query"""
+    return blake2b(canonicalizeQuery(inQuery).encode('utf-8'), digest_size=m_DigestSize).digest()
+
+
+def splitDigests(inDigests: bytes):
+    """Splits the concatenated digests into the list of digests"""
+    return [inDigests[index:index + m_DigestSize] for index in range(0, len(inDigests), m_DigestSize)]
+
+
+class QueryIndex:
+    """
+    Digests of the canonical forms of the queries seen so far
+    """
+
+    def __init__(self):
+        self.digests = set()
+        self.duplicates = 0
+
+    def __len__(self):
+        return len(self.digests)
+
+    def __contains__(self, inDigest: bytes):
+        return inDigest in self.digests
+
+    def addDigest(self, inDigest: bytes):
+        """Adds the digest of a query, returns False if it was seen already"""
+        if inDigest in self.digests:
+            return False
+        self.digests.add(inDigest)
+        return True
+
+    def add(self, inQuery: str):
+        """Adds the query, returns False if an equivalent query was seen already"""
+        return self.addDigest(getQueryDigest(inQuery))
+
+    def filter(self, inQueries, outDigests: bytearray = None):
+        """
+        Drops the queries equivalent to the ones seen already, counting them in `duplicates` \n
+        :param inQueries: Iterable of queries
+        :param outDigests: Receives the digests of the queries kept, in their order
+        :return: Returns a generator of the queries kept
+        """
+        for query in inQueries:
+            digest = getQueryDigest(query)
+            if self.addDigest(digest):
+                if outDigests is not None:
+                    outDigests += digest
+                yield query
+            else:
+                self.duplicates += 1
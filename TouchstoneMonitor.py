@@ -0,0 +1,174 @@
+"""
+Live Monitor of a Touchstone run, following its output & the Result-sets it writes
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+
+m_PollInterval = 0.5
+m_ReportInterval = 10
+m_SlowestTestCount = 10
+# Touchstone writes a Result-set `{Testset}-{Query Type}-{Test Id}.xml` once a test is done
+m_ResultSetPattern = re.compile(r'^(?P<TestSet>[^-]+)-.*-(?P<TestId>[0-9]+)\.xml$')
+m_TestIdPattern = re.compile(r'\b(?:Test\s*(?:Case)?\s*(?:ID)?|ID)\s*[:#=]?\s*"?([0-9]+)', re.IGNORECASE)
+m_TimeoutPattern = re.compile(r'\btime[sd]?[\s_-]*out', re.IGNORECASE)
+
+
+def formatDuration(inSeconds: float):
+    """Returns the duration as `[{h}h]{m}m{s}s`"""
+    minutes, seconds = divmod(int(inSeconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{seconds:02d}s" if hours > 0 else f"{minutes}m{seconds:02d}s"
+
+
+class RunMonitor:
+    """
+    Follows a Touchstone run while it goes on. Every line of its output is fed through `addOutput`, and its
+    `ResultSets` folder is polled every `m_PollInterval` seconds for the Result-sets written since the run started.
+    A test ends when its Result-set is last modified, and starts when its Id is first mentioned by the output or else
+    when the test before it ended, as Touchstone runs the tests of a run one after another. Tests mentioned by an output
+    line about a timeout of the `_Monitor` are flagged as timed out. Every event is written as a line of JSON to the
+    log, and the throughput & the ETA are printed every `m_ReportInterval` seconds
+    """
+
+    def __init__(self, inRunName: str, inLogPath: str, inResultSetsPath: str, inResultSetPrefix: str = '',
+                 inExpectedTests: int = 0):
+        self.runName = inRunName
+        self.logPath = inLogPath
+        self.resultSetsPath = inResultSetsPath
+        self.resultSetPrefix = inResultSetPrefix
+        self.expectedTests = inExpectedTests
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.watcher = None
+        self.logFile = None
+        self.startTime = self.startClock = 0.0
+        self.lastEnd = 0.0
+        # Modification time & size of every Result-set when last seen
+        self.resultSets = dict()
+        # Result-sets found written but possibly still being written, recorded once the next poll finds them unchanged
+        self.pendingResultSets = dict()
+        self.mentionedTests = dict()
+        self.timedOutTests = set()
+        self.timeoutCount = 0
+        self.testTimes = list()
+
+    def _getResultSets(self):
+        """Returns the modification time in ns & the size of every Result-set of the run"""
+        if not os.path.exists(self.resultSetsPath):
+            return dict()
+        resultSets = dict()
+        for entry in os.scandir(self.resultSetsPath):
+            if entry.is_file() and entry.name.startswith(self.resultSetPrefix):
+                stat = entry.stat()
+                resultSets[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return resultSets
+
+    def _log(self, inEvent: str, **inFields):
+        self.logFile.write(json.dumps({'Event': inEvent, 'Time': round(time.time(), 6), **inFields}) + '\n')
+
+    def start(self, inArguments: list):
+        """Takes the Result-sets present before the run, opens the log & starts polling"""
+        folderPath = os.path.dirname(self.logPath)
+        if len(folderPath) > 0:
+            os.makedirs(folderPath, exist_ok=True)
+        self.resultSets = self._getResultSets()
+        self.logFile = open(self.logPath, 'w', encoding='utf-8')
+        self.startTime = self.lastEnd = time.time()
+        self.startClock = time.perf_counter()
+        self._log('Start', Run=self.runName, Arguments=inArguments, ExpectedTests=self.expectedTests)
+        self.watcher = threading.Thread(target=self._watch, name=f"Monitor {self.runName}", daemon=True)
+        self.watcher.start()
+
+    def addOutput(self, inLine: str):
+        """Records a line of the output of Touchstone, along with the tests & the timeouts it mentions"""
+        with self.lock:
+            now = time.time()
+            testIds = [int(testId) for testId in m_TestIdPattern.findall(inLine)]
+            for testId in testIds:
+                self.mentionedTests.setdefault(testId, now)
+            self._log('Output', Line=inLine)
+            if m_TimeoutPattern.search(inLine):
+                self.timeoutCount += 1
+                self.timedOutTests.update(testIds)
+                self._log('Timeout', TestIds=testIds, Line=inLine)
+
+    def _watch(self):
+        lastReport = time.perf_counter()
+        while not self.stopped.wait(m_PollInterval):
+            with self.lock:
+                self._poll(False)
+                if time.perf_counter() - lastReport >= m_ReportInterval:
+                    lastReport = time.perf_counter()
+                    print(self.getProgress())
+
+    def _poll(self, inFinal: bool):
+        """Records the tests whose Result-sets are done, all the pending ones if the run is over"""
+        resultSets = self._getResultSets()
+        done = list()
+        for name, (modifiedTime, size) in self.pendingResultSets.items():
+            if inFinal or resultSets.get(name) == (modifiedTime, size):
+                done.append((modifiedTime, name, size))
+        for _, name, _ in done:
+            self.pendingResultSets.pop(name)
+        for name, state in resultSets.items():
+            if self.resultSets.get(name) != state:
+                self.resultSets[name] = state
+                if inFinal:
+                    done.append((state[0], name, state[1]))
+                else:
+                    self.pendingResultSets[name] = state
+        for modifiedTime, name, size in sorted(done):
+            match = m_ResultSetPattern.match(name)
+            if match is None:
+                # Not the Result-set of a test
+                continue
+            testSet, testId = match.group('TestSet'), int(match.group('TestId'))
+            endTime = modifiedTime / 1e9
+            startTime = min(max(self.lastEnd, self.mentionedTests.get(testId, self.lastEnd)), endTime)
+            self.lastEnd = max(self.lastEnd, endTime)
+            elapsed = endTime - startTime
+            self.testTimes.append((elapsed, testSet, testId))
+            self._log('Test', TestSet=testSet, TestId=testId, ResultSet=name, Start=round(startTime, 6),
+                      End=round(endTime, 6), Elapsed=round(elapsed, 6), ResultSetSize=size,
+                      TimedOut=testId in self.timedOutTests)
+
+    def getProgress(self):
+        """Returns the tests done so far along with the throughput & the ETA"""
+        elapsed = time.perf_counter() - self.startClock
+        testCount = len(self.testTimes)
+        rate = testCount / elapsed if elapsed > 0 else 0.0
+        progress = f"{self.runName}: {testCount}"
+        if self.expectedTests > 0:
+            progress += f"/{self.expectedTests}"
+        progress += f" tests in {formatDuration(elapsed)}, {rate:.1f} tests/s"
+        if self.expectedTests > testCount and rate > 0:
+            progress += f", ETA {formatDuration((self.expectedTests - testCount) / rate)}"
+        if self.timeoutCount > 0:
+            progress += f", {self.timeoutCount} timeouts"
+        return progress
+
+    def stop(self, inReturnCode: int = None):
+        """
+        Stops polling once the run is over, records the Result-sets left and closes the log \n
+        :param inReturnCode: Exit code of Touchstone, None if it could not be started
+        :return: Returns the number of Result-sets of tests written by the run
+        """
+        self.stopped.set()
+        if self.watcher is not None:
+            self.watcher.join()
+        with self.lock:
+            self._poll(True)
+            elapsed = time.perf_counter() - self.startClock
+            slowestTests = sorted(self.testTimes, key=lambda testTime: -testTime[0])[:m_SlowestTestCount]
+            self._log('End', ReturnCode=inReturnCode, Elapsed=round(elapsed, 6), Tests=len(self.testTimes),
+                      TestsPerSecond=round(len(self.testTimes) / elapsed, 3) if elapsed > 0 else 0.0,
+                      Timeouts=self.timeoutCount, TimedOutTests=sorted(self.timedOutTests),
+                      SlowestTests=[{'TestSet': testSet, 'TestId': testId, 'Elapsed': round(testElapsed, 6)}
+                                    for testElapsed, testSet, testId in slowestTests])
+            self.logFile.close()
+        return len(self.testTimes)
@@ -0,0 +1,170 @@
+"""
+Byte Template based Writers of Touchstone XML Files
+"""
+
+from itertools import islice
+
+
+m_CDATAEnd = ']]>'
+m_CDATAEndEscaped = ']]]]><![CDATA[>'
+m_Encoding = 'utf-8'
+m_WriteBatchSize = 4096
+
+m_TestSetHeader = b'<TestSet Name="%b" JavaClass="com.simba.testframework.testcases.jdbc.resultvalidation.SqlTester" ' \
+                  b'dotNetClass="SqlTester">\n'
+m_TestSetFooter = b'</TestSet>'
+m_TestTemplate = b'\t<Test Name="SQL_QUERY" JavaMethod="testSqlQuery" dotNetMethod="TestSqlQuery" ID="%d">\n' \
+                 b'\t\t<SQL><![CDATA[%b]]></SQL>\n' \
+                 b'\t\t<ValidateColumns>True</ValidateColumns>\n' \
+                 b'\t\t<ValidateNumericExactly>True</ValidateNumericExactly>\n' \
+                 b'\t</Test>\n'
+
+m_TestSuiteHeader = b'<TestSuite Name="SQL Test">\n'
+m_TestSuiteTestSetTemplate = b'\t<TestSet Name="%b" SetFile="%b/TestSets/%b%b">\n' \
+                             b'\t\t<!--\n' \
+                             b'\t\t<Exclusion StartID="6" EndID="6">Exclusion reason</Exclusion>\n' \
+                             b'\t\t<Ignorable StartID="6" EndID="6">Ignorable reason</Ignorable>\n' \
+                             b'\t\t-->\n' \
+                             b'\t</TestSet>\n'
+m_TestSuiteExcludingTestSetTemplate = b'\t<TestSet Name="%b" SetFile="%b/TestSets/%b%b">\n' \
+                                      b'%b' \
+                                      b'\t</TestSet>\n'
+m_ExclusionTemplate = b'\t\t<Exclusion StartID="%d" EndID="%d">%b</Exclusion>\n'
+m_TestSuiteFooter = b'\t<GenerateResults>true</GenerateResults>\n' \
+                    b'\t<BaselineDirectory>%b\\ResultSets</BaselineDirectory>\n' \
+                    b'</TestSuite>'
+
+m_TestEnvTemplate = b'<?xml version="1.0" encoding="utf-8"?>\n' \
+                    b'<TestEnvironment>\n' \
+                    b'\t<ConnectionString>%b</ConnectionString>\n' \
+                    b'\t<_Monitor>\n' \
+                    b'\t\t<GenerateResults>true</GenerateResults>\n' \
+                    b'\t\t<timeout>20</timeout>\n' \
+                    b'\t\t<maxConsecutiveTimeout>15</maxConsecutiveTimeout>\n' \
+                    b'\t\t<maxAccumulatedTimeout>50</maxAccumulatedTimeout>\n' \
+                    b'\t</_Monitor>\n' \
+                    b'\t<SqlWcharEncoding>UTF-32</SqlWcharEncoding>\n' \
+                    b'</TestEnvironment>'
+
+
+def escapeCDATA(inText: str):
+    """
+    Escapes given text to be placed within a CDATA Section. A `]]>` would terminate the section early, hence it is
+    split across two sections \n
+    :param inText: Text to escape
+    :return: Returns the escaped text
+    """
+    return inText.replace(m_CDATAEnd, m_CDATAEndEscaped)
+
+
+def _iterTestBatches(inQueries, inStartingID: int):
+    """Renders the tests of given queries from the byte template, `m_WriteBatchSize` tests at a time"""
+    queries = iter(inQueries)
+    while True:
+        batch = list(islice(queries, m_WriteBatchSize))
+        if len(batch) == 0:
+            return
+        # Separator can not be part of `]]>`, so no occurrence spans two queries
+        if m_CDATAEnd in '\0'.join(batch):
+            batch = list(map(escapeCDATA, batch))
+        yield [m_TestTemplate % (testID, query.encode(m_Encoding))
+               for testID, query in zip(range(inStartingID, inStartingID + len(batch)), batch)]
+        inStartingID += len(batch)
+
+
+def writeTestSet(inFile, inTestSet: str, inQueries, inStartingID: int = 1):
+    """
+    Writes a Test-set for given queries. Queries are taken in batches of `m_WriteBatchSize`, every batch is rendered
+    from the byte template and written at once \n
+    :param inFile: File opened in binary mode
+    :param inTestSet: Name of the Test Set
+    :param inQueries: Iterable of queries
+    :param inStartingID: Id of the first testcase
+    :return: Returns the Id following the last written testcase
+    """
+    inFile.write(m_TestSetHeader % inTestSet.encode(m_Encoding))
+    for tests in _iterTestBatches(inQueries, inStartingID):
+        inFile.write(b''.join(tests))
+        inStartingID += len(tests)
+    inFile.write(m_TestSetFooter)
+    return inStartingID
+
+
+def writeTestSetShards(inOpenShard, inQueries, inStartingID: int = 1, inMaxTests: int = 0, inMaxBytes: int = 0):
+    """
+    Writes a Test-set split into shards, each of them a Test-set on its own covering a contiguous range of Ids. A shard
+    is closed once it holds `inMaxTests` tests or the next test would take it beyond `inMaxBytes` bytes, though every
+    shard holds at least one test. A limit of 0 means no limit \n
+    :param inOpenShard: Callable opening the shard of the given number, counting from 1. Returns the file opened in
+    binary mode along with the name of the shard
+    :param inQueries: Iterable of queries
+    :param inStartingID: Id of the first testcase
+    :param inMaxTests: Maximum number of tests per shard
+    :param inMaxBytes: Maximum size of a shard in bytes
+    :return: Returns the number of shards written
+    """
+    shardCount, file, testCount, byteCount = 0, None, 0, 0
+    try:
+        for tests in _iterTestBatches(inQueries, inStartingID):
+            for test in tests:
+                if file is None or (inMaxTests and testCount == inMaxTests) or \
+                        (inMaxBytes and testCount > 0 and byteCount + len(test) + len(m_TestSetFooter) > inMaxBytes):
+                    if file is not None:
+                        file.write(m_TestSetFooter)
+                        file.close()
+                    shardCount += 1
+                    file, shardName = inOpenShard(shardCount)
+                    header = m_TestSetHeader % shardName.encode(m_Encoding)
+                    file.write(header)
+                    testCount, byteCount = 0, len(header)
+                file.write(test)
+                testCount += 1
+                byteCount += len(test)
+        if file is None:
+            shardCount += 1
+            file, shardName = inOpenShard(shardCount)
+            file.write(m_TestSetHeader % shardName.encode(m_Encoding))
+        file.write(m_TestSetFooter)
+    finally:
+        if file is not None:
+            file.close()
+    return shardCount
+
+
+def writeTestSuite(inFile, inTestSuite: str, inTestSets, inTestFilesExtension: str, inExclusions: dict = None,
+                   inBaselineFolder: str = None):
+    """
+    Writes a Test-suite referring to given Test-sets \n
+    :param inFile: File opened in binary mode
+    :param inTestSuite: Name of the Test Suite
+    :param inTestSets: Names of the Test Sets
+    :param inTestFilesExtension: Extension of the Test-set files
+    :param inExclusions: Dictionary having Test Set as key and the list of (Start Id, End Id, Reason) to exclude as
+    value. Test-sets missing from it get the commented out placeholders
+    :param inBaselineFolder: Folder holding the `ResultSets` folder, the one of the Test Suite by default
+    """
+    testSuite = inTestSuite.encode(m_Encoding)
+    extension = inTestFilesExtension.encode(m_Encoding)
+    exclusions = inExclusions if inExclusions is not None else dict()
+    content = [m_TestSuiteHeader]
+    for testSet in inTestSets:
+        testSetName = testSet.encode(m_Encoding)
+        if testSet in exclusions:
+            content.append(m_TestSuiteExcludingTestSetTemplate % (
+                testSetName, testSuite, testSetName, extension,
+                b''.join(m_ExclusionTemplate % (startId, endId, reason.encode(m_Encoding))
+                         for startId, endId, reason in exclusions[testSet])))
+        else:
+            content.append(m_TestSuiteTestSetTemplate % (testSetName, testSuite, testSetName, extension))
+    content.append(m_TestSuiteFooter % (inBaselineFolder if inBaselineFolder is not None else inTestSuite)
+                   .encode(m_Encoding))
+    inFile.write(b''.join(content))
+
+
+def writeTestEnv(inFile, inConnectionString: str):
+    """
+    Writes a Test Environment for given connection string \n
+    :param inFile: File opened in binary mode
+    :param inConnectionString: Connection String
+    """
+    inFile.write(m_TestEnvTemplate % inConnectionString.encode(m_Encoding))
@@ -0,0 +1,47 @@
+"""
+Regression checks of the MDEF difference, run with `python -m unittest test_MDEF`
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault('TOUCHSTONE_DIR', tempfile.gettempdir())
+
+from Generator import MDEF
+
+
+m_MDEFContent = {
+    MDEF.m_Tables: [{'TableName': 'T1', 'APIAccess': {'ReadAPI': {}},
+                     'Columns': [{'Name': 'C1', 'Metadata': {'SQLType': 'SQL_INTEGER'}, 'Passdownable': True}]}],
+    MDEF.m_StoredProcedures: [{'Name': 'SP1', 'ResultTable': {}},
+                              {'Name': 'SP2', 'ResultTable': {'Columns': [{'Name': 'C1',
+                                                                           'Metadata': {'SQLType': 'SQL_INTEGER'}}]}}]
+}
+
+
+class MDEFDifferenceTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.filePath = os.path.join(folder.name, 'MDEF.json')
+        with open(self.filePath, 'w') as file:
+            json.dump(m_MDEFContent, file)
+
+    def testIdenticalMDEFsWithAndWithoutColumns(self):
+        # The older revision is loaded without columns & the newer one with them
+        for lazy in (False, True):
+            older = MDEF(self.filePath, withColumns=False, lazy=lazy)
+            newer = MDEF(self.filePath, withColumns=True, lazy=lazy)
+            self.assertIsNone(newer.findDifference(older))
+            self.assertIsNone(older.findDifference(newer))
+
+    def testStoredProcedureWithoutResultTableIsIndexed(self):
+        mdef = MDEF(self.filePath, withColumns=True)
+        self.assertEqual(mdef.getStoredProcedure('SP1').Columns, ())
+        self.assertEqual([column.Name for column in mdef.getStoredProcedure('SP2').Columns], ['C1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
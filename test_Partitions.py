@@ -0,0 +1,68 @@
+"""
+Checks of the Touchstone runs planned for the unexecuted Test-sets, run with `python -m unittest test_Partitions`
+"""
+
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault('TOUCHSTONE_DIR', tempfile.gettempdir())
+
+from Generator import ResultSetGenerator, m_OutputFolder, m_Partitions, m_ResultSets, m_TestSets, m_TouchStoneOutput
+
+
+m_TestSuite = 'Integration'
+m_TestSetIds = {'SQL_SELECT_ALL': (1, 3), 'SQL_AND_OR': (10, 19), 'SQL_LIKE': (20, 25)}
+m_RequiredTestSets = {'SQL_SELECT_ALL': 1, 'SQL_AND_OR': 10, 'SQL_LIKE': 20, 'SQL_NOT_WRITTEN': 30}
+# `SQL_SELECT_ALL` is executed ahead of the other Test-sets
+m_UnexecutedTestSets = {m_TestSuite: ['SQL_AND_OR', 'SQL_LIKE']}
+
+
+class PlanRunsTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(folder.name)
+        testSetsPath = os.path.join(m_OutputFolder, m_TestSuite, m_TestSets)
+        os.makedirs(testSetsPath)
+        for testSet, (firstId, lastId) in m_TestSetIds.items():
+            with open(os.path.join(testSetsPath, testSet + '.xml'), 'w') as file:
+                file.write('<TestSet>' + ''.join(f'<Test ID="{testId}"/>' for testId in range(firstId, lastId + 1)) +
+                           '</TestSet>')
+
+    def testUnexecutedTestSetsArePartitioned(self):
+        plannedRuns = ResultSetGenerator.planRuns(m_UnexecutedTestSets, {m_TestSuite: m_RequiredTestSets}, 2)
+        self.assertEqual(plannedRuns[m_TestSuite], [(None, 1), (None, 2)])
+        testCounts = list()
+        for partition in (1, 2):
+            runFolder = os.path.join(m_TestSuite, m_Partitions, str(partition))
+            with open(os.path.join(m_OutputFolder, runFolder, 'TestSuite.xml')) as file:
+                self.assertNotIn('SQL_SELECT_ALL', file.read())
+            testCounts.append(ResultSetGenerator._getTestCount(m_TestSuite, runFolder))
+        self.assertEqual(testCounts, [8, 8])
+
+    def testExecutedTestSetIsNotRunAgain(self):
+        plannedRuns = ResultSetGenerator.planRuns(m_UnexecutedTestSets, {m_TestSuite: m_RequiredTestSets})
+        self.assertEqual(plannedRuns[m_TestSuite], [('SQL_AND_OR', None), ('SQL_LIKE', None)])
+        unexecutedTestSets = {m_TestSuite: ['SQL_SELECT_ALL', 'SQL_AND_OR', 'SQL_LIKE']}
+        plannedRuns = ResultSetGenerator.planRuns(unexecutedTestSets, {m_TestSuite: m_RequiredTestSets})
+        self.assertEqual(plannedRuns[m_TestSuite], [(None, None)])
+
+    def testPartitionsAreMerged(self):
+        ResultSetGenerator.planRuns(m_UnexecutedTestSets, {m_TestSuite: m_RequiredTestSets}, 2)
+        for partition, testIds in ((1, range(10, 18)), (2, range(18, 26))):
+            partitionPath = os.path.join(m_OutputFolder, m_TestSuite, m_Partitions, str(partition))
+            for testId in testIds:
+                testSet = 'SQL_AND_OR' if testId < 20 else 'SQL_LIKE'
+                open(os.path.join(partitionPath, m_ResultSets, f"{testSet}-SQL_QUERY-{testId}.xml"), 'w').close()
+            open(os.path.join(partitionPath, 'Touchstone.log'), 'w').close()
+        self.assertTrue(ResultSetGenerator.mergePartitionResultSets(m_TestSuite, 2))
+        self.assertEqual(len(os.listdir(os.path.join(m_OutputFolder, m_TestSuite, m_ResultSets))), 16)
+        self.assertFalse(os.path.exists(os.path.join(m_OutputFolder, m_TestSuite, m_Partitions)))
+        self.assertTrue(os.path.exists(os.path.join(m_OutputFolder, m_TouchStoneOutput, f"{m_TestSuite}_partition_2",
+                                                    'Touchstone.log')))
+
+
+if __name__ == '__main__':
+    unittest.main()